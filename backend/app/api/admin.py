@@ -1,22 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import IntegrityError
+from starlette.concurrency import run_in_threadpool
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
-from typing import List
+from typing import Dict, Iterator, List, Literal, Optional
 
-from database import get_session
-from models.player import Player, PlayerTicket, GameSession
+from database import engine, get_session
+from models.archive import ArchivedGame
+from models.player import Player, PlayerTicket, GameSession, SessionPlayer
 from schemas.multiplayer import (
-    AdminTicketGenerate, AdminSessionInfo, PlayerResponse, 
+    AdminTicketGenerate, AdminSessionInfo, ArchivedGameResponse, PlayerResponse, 
     PlayerTicketResponse, SuccessResponse
 )
+from utils.archive import game_archive
+from utils.generation_service import generation_service
 from utils.generator import BingoTicketGenerator
+from utils.fingerprint import ensure_unique_tickets
+from utils.directory import directory_cursor, directory_ndjson, directory_query, player_response
+from utils.persistence import insert_rows, player_ticket_rows
+from utils.session_state import publish_state
+from utils.membership import add_session_tickets, remove_player_memberships
+from utils.draw import called_numbers, remaining_numbers
 
 router = APIRouter()
 
+# Admin listings are paged with limit/after (keyset) cursors
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 500
 
-def verify_admin(player_id: str, session: Session) -> Player:
+
+async def verify_admin(player_id: str, session: AsyncSession) -> Player:
     """Verify that a player is an admin"""
-    player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+    player = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     if not player.is_admin:
@@ -24,30 +41,52 @@ def verify_admin(player_id: str, session: Session) -> Player:
     return player
 
 
+def check_page_size(limit: int) -> None:
+    if limit <= 0 or limit > MAX_PAGE_SIZE:
+        raise HTTPException(status_code=400, detail=f"Limit must be between 1 and {MAX_PAGE_SIZE}")
+
+
+async def players_by_session(session: AsyncSession, game_session_ids: List[int]) -> Dict[int, List[PlayerResponse]]:
+    """Players of each listed session, loaded with one IN (...) query"""
+    players = {game_session_id: [] for game_session_id in game_session_ids}
+    if not game_session_ids:
+        return players
+    
+    rows = (await session.exec(
+        select(SessionPlayer.game_session_id, Player)
+        .join(Player, Player.player_id == SessionPlayer.player_id)
+        .where(SessionPlayer.game_session_id.in_(game_session_ids))
+        .order_by(SessionPlayer.game_session_id, SessionPlayer.player_id)
+    )).all()
+    for game_session_id, player in rows:
+        players[game_session_id].append(player_response(player))
+    return players
+
+
 @router.post("/generate-tickets", response_model=List[PlayerTicketResponse])
-def admin_generate_tickets_for_player(
+async def admin_generate_tickets_for_player(
     ticket_request: AdminTicketGenerate,
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> List[PlayerTicketResponse]:
     """Admin endpoint to generate tickets for any player"""
     
     # Verify admin privileges
-    verify_admin(admin_player_id, session)
+    await verify_admin(admin_player_id, session)
     
     # Verify target player exists
-    target_player = session.exec(
+    target_player = (await session.exec(
         select(Player).where(Player.player_id == ticket_request.player_id)
-    ).first()
+    )).first()
     if not target_player:
         raise HTTPException(status_code=404, detail="Target player not found")
     
     # Verify session exists if provided
     game_session = None
     if ticket_request.session_code:
-        game_session = session.exec(
+        game_session = (await session.exec(
             select(GameSession).where(GameSession.session_code == ticket_request.session_code)
-        ).first()
+        )).first()
         if not game_session:
             raise HTTPException(status_code=404, detail="Game session not found")
     
@@ -55,196 +94,261 @@ def admin_generate_tickets_for_player(
         raise HTTPException(status_code=400, detail="Count must be between 1 and 20")
     
     try:
-        # Generate tickets
-        ticket_grids = BingoTicketGenerator.generate_tickets(ticket_request.count)
+        # Generate seed-addressed tickets off the event loop
+        seeded_tickets = await generation_service.agenerate_seeded(ticket_request.count)
         
-        created_tickets = []
-        for grid in ticket_grids:
-            ticket = PlayerTicket(
-                player_id=ticket_request.player_id,
-                grid=grid,
-                strikes={},
-                game_session_id=game_session.id if game_session else None
-            )
-            session.add(ticket)
-            created_tickets.append(ticket)
-        
-        session.commit()
-        
-        # Refresh all tickets to get IDs
-        for ticket in created_tickets:
-            session.refresh(ticket)
+        # Replace any ticket that duplicates one already in the session
+        seeded_tickets = await ensure_unique_tickets(
+            session,
+            game_session.id if game_session else None,
+            seeded_tickets,
+            BingoTicketGenerator.generate_seeded_tickets
+        )
         
-        return [
-            PlayerTicketResponse(
-                ticket_id=ticket.ticket_id,
-                player_id=ticket.player_id,
-                grid=ticket.grid,
-                strikes=ticket.strikes,
-                created_at=ticket.created_at,
-                updated_at=ticket.updated_at
-            )
-            for ticket in created_tickets
-        ]
+        rows = player_ticket_rows(
+            ticket_request.player_id, seeded_tickets, game_session.id if game_session else None
+        )
+        await insert_rows(session, PlayerTicket, rows)
+        if game_session:
+            await add_session_tickets(session, game_session.id, ticket_request.player_id, len(rows))
+        await session.commit()
         
+    except IntegrityError:
+        # A concurrent request issued a matching ticket into the session first
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="A ticket was just issued twice in this session, please retry")
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"Error generating tickets: {str(e)}")
+    
+    if game_session:
+        await publish_state(session, [(game_session.id, game_session.session_code)])
+    
+    return [
+        PlayerTicketResponse(
+            ticket_id=row["ticket_id"],
+            player_id=ticket_request.player_id,
+            grid=grid,
+            strikes={},
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+        for row, (_, _, grid, _) in zip(rows, seeded_tickets)
+    ]
 
 
 @router.get("/session/{session_code}", response_model=AdminSessionInfo)
-def get_session_admin_info(
+async def get_session_admin_info(
     session_code: str,
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    response: Response,
+    include_remaining: bool = True,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+    session: AsyncSession = Depends(get_session)
 ) -> AdminSessionInfo:
-    """Get detailed session information for admin"""
+    """
+    Get detailed session information for admin.
+    
+    Players are paged by player_id: pass the X-Next-Cursor response header
+    back as `after` for the next page (no header on the last page).
+    """
     
     # Verify admin privileges
-    verify_admin(admin_player_id, session)
+    await verify_admin(admin_player_id, session)
+    check_page_size(limit)
     
     # Get game session
-    game_session = session.exec(
+    game_session = (await session.exec(
         select(GameSession).where(GameSession.session_code == session_code)
-    ).first()
+    )).first()
     
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     
-    # Get all tickets in the session
-    session_tickets = session.exec(
-        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
-    ).all()
-    
-    # Get unique players
-    unique_player_ids = set(ticket.player_id for ticket in session_tickets)
-    
-    players = []
-    for player_id in unique_player_ids:
-        player = session.exec(select(Player).where(Player.player_id == player_id)).first()
-        if player:
-            players.append(PlayerResponse(
-                id=player.id,
-                player_id=player.player_id,
-                name=player.name,
-                is_admin=player.is_admin,
-                created_at=player.created_at
-            ))
+    # One page of the session's players, in primary key order
+    query = (
+        select(Player)
+        .join(SessionPlayer, Player.player_id == SessionPlayer.player_id)
+        .where(SessionPlayer.game_session_id == game_session.id)
+        .order_by(SessionPlayer.player_id)
+        .limit(limit)
+    )
+    if after is not None:
+        query = query.where(SessionPlayer.player_id > after)
+    session_players = (await session.exec(query)).all()
+    
+    if len(session_players) == limit:
+        response.headers["X-Next-Cursor"] = session_players[-1].player_id
     
     return AdminSessionInfo(
         session_code=game_session.session_code,
         admin_player_id=game_session.admin_player_id,
-        players=players,
-        total_tickets=len(session_tickets),
+        players=[player_response(player) for player in session_players],
+        total_tickets=game_session.tickets_count,
         current_number=game_session.current_number,
-        called_numbers=game_session.called_numbers,
-        remaining_numbers=game_session.remaining_numbers,
+        called_numbers=called_numbers(game_session),
+        remaining_numbers=remaining_numbers(game_session) if include_remaining else None,
         is_active=game_session.is_active
     )
 
 
 @router.get("/players", response_model=List[PlayerResponse])
-def get_all_players(
+async def get_all_players(
     admin_player_id: str,
-    session: Session = Depends(get_session)
-) -> List[PlayerResponse]:
-    """Get list of all players (admin only)"""
+    response: Response,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    id_prefix: Optional[str] = None,
+    format: Literal["json", "ndjson"] = "json",
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Get a page of the player directory (admin only).
+    
+    Players are ordered by player_id, or by name when searching by
+    `name_prefix` (case-insensitive); `id_prefix` narrows by player ID.
+    Pass the X-Next-Cursor response header back as `after` for the next
+    page. `format=ndjson` streams every matching player instead of a page.
+    """
     
     # Verify admin privileges
-    verify_admin(admin_player_id, session)
+    await verify_admin(admin_player_id, session)
     
-    players = session.exec(select(Player)).all()
+    if format == "ndjson":
+        return StreamingResponse(_directory_stream(name_prefix, id_prefix), media_type="application/x-ndjson")
     
-    return [
-        PlayerResponse(
-            id=player.id,
-            player_id=player.player_id,
-            name=player.name,
-            is_admin=player.is_admin,
-            created_at=player.created_at
-        )
-        for player in players
-    ]
+    check_page_size(limit)
+    try:
+        query = directory_query(limit, after, name_prefix, id_prefix)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    players = (await session.exec(query)).all()
+    
+    if len(players) == limit:
+        response.headers["X-Next-Cursor"] = directory_cursor(players[-1], name_prefix)
+    
+    return [player_response(player) for player in players]
+
+
+def _directory_stream(name_prefix: Optional[str], id_prefix: Optional[str]) -> Iterator[str]:
+    # The request's session closes before the body is streamed, so use our own
+    with Session(engine) as session:
+        yield from directory_ndjson(session, name_prefix, id_prefix)
 
 
 @router.get("/sessions", response_model=List[AdminSessionInfo])
-def get_all_sessions(
+async def get_all_sessions(
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    response: Response,
+    include_remaining: bool = True,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    session: AsyncSession = Depends(get_session)
 ) -> List[AdminSessionInfo]:
-    """Get list of all game sessions (admin only)"""
+    """
+    Get a page of game sessions (admin only).
+    
+    Sessions are listed newest first; pass the X-Next-Cursor response header
+    back as `after` for the next page (no header on the last page).
+    """
     
     # Verify admin privileges
-    verify_admin(admin_player_id, session)
+    await verify_admin(admin_player_id, session)
+    check_page_size(limit)
     
-    game_sessions = session.exec(select(GameSession)).all()
+    query = select(GameSession).order_by(GameSession.id.desc()).limit(limit)
+    if after is not None:
+        query = query.where(GameSession.id < after)
+    game_sessions = (await session.exec(query)).all()
     
-    result = []
-    for game_session in game_sessions:
-        # Get session tickets and players
-        session_tickets = session.exec(
-            select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
-        ).all()
-        
-        unique_player_ids = set(ticket.player_id for ticket in session_tickets)
-        players = []
-        
-        for player_id in unique_player_ids:
-            player = session.exec(select(Player).where(Player.player_id == player_id)).first()
-            if player:
-                players.append(PlayerResponse(
-                    id=player.id,
-                    player_id=player.player_id,
-                    name=player.name,
-                    is_admin=player.is_admin,
-                    created_at=player.created_at
-                ))
-        
-        result.append(AdminSessionInfo(
+    # Players of the whole page at once; counts come from the session counters
+    players = await players_by_session(session, [game_session.id for game_session in game_sessions])
+    
+    if len(game_sessions) == limit:
+        response.headers["X-Next-Cursor"] = str(game_sessions[-1].id)
+    
+    return [
+        AdminSessionInfo(
             session_code=game_session.session_code,
             admin_player_id=game_session.admin_player_id,
-            players=players,
-            total_tickets=len(session_tickets),
+            players=players[game_session.id],
+            total_tickets=game_session.tickets_count,
             current_number=game_session.current_number,
-            called_numbers=game_session.called_numbers,
-            remaining_numbers=game_session.remaining_numbers,
+            called_numbers=called_numbers(game_session),
+            remaining_numbers=remaining_numbers(game_session) if include_remaining else None,
             is_active=game_session.is_active
-        ))
+        )
+        for game_session in game_sessions
+    ]
+
+
+@router.get("/archive/{session_code}", response_model=ArchivedGameResponse)
+async def get_archived_game(
+    session_code: str,
+    admin_player_id: str,
+    session: AsyncSession = Depends(get_session)
+) -> ArchivedGameResponse:
+    """
+    Get a finished game from the archive (admin only).
+    
+    Session codes are reused once a game is cleaned up; the most recently
+    archived game with the code is returned. Only that game's frame is
+    read and decompressed.
+    """
     
-    return result
+    # Verify admin privileges
+    await verify_admin(admin_player_id, session)
+    
+    entry = (await session.exec(
+        select(ArchivedGame)
+        .where(ArchivedGame.session_code == session_code)
+        .order_by(ArchivedGame.id.desc())
+        .limit(1)
+    )).first()
+    
+    if not entry:
+        raise HTTPException(status_code=404, detail="Archived game not found")
+    
+    record = await run_in_threadpool(game_archive.read, entry.segment, entry.offset, entry.length)
+    return ArchivedGameResponse(**record, archived_at=entry.archived_at)
 
 
 @router.delete("/player/{player_id}", response_model=SuccessResponse)
-def delete_player(
+async def delete_player(
     player_id: str,
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SuccessResponse:
     """Delete a player and all their tickets (admin only)"""
     
     # Verify admin privileges
-    verify_admin(admin_player_id, session)
+    await verify_admin(admin_player_id, session)
     
     # Don't allow deleting self
     if player_id == admin_player_id:
         raise HTTPException(status_code=400, detail="Cannot delete yourself")
     
     # Get player
-    player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+    player = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
-    # Delete all player tickets
-    player_tickets = session.exec(
+    # Take the player out of their sessions, then delete all player tickets
+    sessions_left = await remove_player_memberships(session, player_id)
+    player_tickets = (await session.exec(
         select(PlayerTicket).where(PlayerTicket.player_id == player_id)
-    ).all()
+    )).all()
     
     for ticket in player_tickets:
-        session.delete(ticket)
+        await session.delete(ticket)
     
     # Delete player
-    session.delete(player)
-    session.commit()
+    await session.delete(player)
+    await session.commit()
+    
+    await publish_state(session, sessions_left)
     
     return SuccessResponse(
         success=True,
@@ -257,20 +361,20 @@ def delete_player(
 
 
 @router.post("/player/{player_id}/make-admin", response_model=SuccessResponse)
-def make_player_admin(
+async def make_player_admin(
     player_id: str,
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SuccessResponse:
     """Make a player an admin (admin only)"""
     
     # Verify admin privileges
-    verify_admin(admin_player_id, session)
+    await verify_admin(admin_player_id, session)
     
     # Get target player
-    target_player = session.exec(
+    target_player = (await session.exec(
         select(Player).where(Player.player_id == player_id)
-    ).first()
+    )).first()
     if not target_player:
         raise HTTPException(status_code=404, detail="Player not found")
     
@@ -280,7 +384,7 @@ def make_player_admin(
     # Make admin
     target_player.is_admin = True
     session.add(target_player)
-    session.commit()
+    await session.commit()
     
     return SuccessResponse(
         success=True,
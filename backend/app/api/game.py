@@ -1,11 +1,12 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 from typing import Optional
 import random
 
 from database import get_session
 from models.game import NumberSession
+from utils.retention import load_latest_number_session, save_number_session
 from schemas.game import (
     GameStartResponse, 
     GamePickResponse, 
@@ -19,14 +20,13 @@ router = APIRouter()
 current_session: Optional[NumberSession] = None
 
 
-def get_or_create_session(session: Session) -> NumberSession:
+async def get_or_create_session(session: AsyncSession) -> NumberSession:
     """Get current session or create a new one"""
     global current_session
     
     if current_session is None:
-        # Try to get the latest session from database
-        statement = select(NumberSession).order_by(NumberSession.updated_at.desc())
-        db_session = session.exec(statement).first()
+        # Try to get the latest session from database (day partitions, newest first)
+        db_session = await load_latest_number_session(session)
         
         if db_session and db_session.remaining:
             current_session = db_session
@@ -39,15 +39,14 @@ def get_or_create_session(session: Session) -> NumberSession:
                 created_at=datetime.now().isoformat(),
                 updated_at=datetime.now().isoformat()
             )
-            session.add(current_session)
-            session.commit()
-            session.refresh(current_session)
+            await save_number_session(session, current_session)
+        await session.commit()
     
     return current_session
 
 
 @router.post("/start", response_model=GameStartResponse)
-def start_game(session: Session = Depends(get_session)) -> GameStartResponse:
+async def start_game(session: AsyncSession = Depends(get_session)) -> GameStartResponse:
     """Start a new game session"""
     global current_session
     
@@ -60,9 +59,8 @@ def start_game(session: Session = Depends(get_session)) -> GameStartResponse:
         updated_at=datetime.now().isoformat()
     )
     
-    session.add(current_session)
-    session.commit()
-    session.refresh(current_session)
+    await save_number_session(session, current_session)
+    await session.commit()
     
     return GameStartResponse(
         message="New game started",
@@ -71,9 +69,9 @@ def start_game(session: Session = Depends(get_session)) -> GameStartResponse:
 
 
 @router.post("/pick", response_model=GamePickResponse)
-def pick_number(session: Session = Depends(get_session)) -> GamePickResponse:
+async def pick_number(session: AsyncSession = Depends(get_session)) -> GamePickResponse:
     """Pick the next random number"""
-    game_session = get_or_create_session(session)
+    game_session = await get_or_create_session(session)
     
     if not game_session.remaining:
         raise HTTPException(status_code=400, detail="No numbers remaining")
@@ -82,14 +80,15 @@ def pick_number(session: Session = Depends(get_session)) -> GamePickResponse:
     picked_number = random.choice(game_session.remaining)
     
     # Update session
+    previous_updated_at = game_session.updated_at
     game_session.remaining.remove(picked_number)
     game_session.history.append(picked_number)
     game_session.current_number = picked_number
     game_session.updated_at = datetime.now().isoformat()
     
-    # Save to database
-    session.add(game_session)
-    session.commit()
+    # Save to database (moves to today's partition on a new day)
+    await save_number_session(session, game_session, previous_updated_at)
+    await session.commit()
     
     return GamePickResponse(
         number=picked_number,
@@ -98,9 +97,9 @@ def pick_number(session: Session = Depends(get_session)) -> GamePickResponse:
 
 
 @router.get("/state", response_model=GameStateResponse)
-def get_game_state(session: Session = Depends(get_session)) -> GameStateResponse:
+async def get_game_state(session: AsyncSession = Depends(get_session)) -> GameStateResponse:
     """Get current game state"""
-    game_session = get_or_create_session(session)
+    game_session = await get_or_create_session(session)
     
     return GameStateResponse(
         current_number=game_session.current_number,
@@ -110,7 +109,7 @@ def get_game_state(session: Session = Depends(get_session)) -> GameStateResponse
 
 
 @router.post("/reset", response_model=GameResetResponse)
-def reset_game(session: Session = Depends(get_session)) -> GameResetResponse:
+async def reset_game(session: AsyncSession = Depends(get_session)) -> GameResetResponse:
     """Reset the game"""
     global current_session
     
@@ -123,8 +122,7 @@ def reset_game(session: Session = Depends(get_session)) -> GameResetResponse:
         updated_at=datetime.now().isoformat()
     )
     
-    session.add(current_session)
-    session.commit()
-    session.refresh(current_session)
+    await save_number_session(session, current_session)
+    await session.commit()
     
     return GameResetResponse(message="Game reset successfully")
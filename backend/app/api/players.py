@@ -1,30 +1,39 @@
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 from typing import List
 
 from database import get_session
-from models.player import Player, PlayerTicket, generate_player_id
+from models.player import Player, PlayerTicket, GameSession, generate_player_id
 from schemas.multiplayer import (
     PlayerCreate, PlayerResponse, PlayerTicketCreate, 
     PlayerTicketResponse, TicketStrike, SuccessResponse
 )
-from utils.generator import BingoTicketGenerator
+from utils.generator import BingoTicketGenerator, resolve_grid
+from utils.generation_service import generation_service
+from utils.reservoir import ticket_reservoir
+from utils.fingerprint import ensure_unique_tickets
+from utils.session_state import publish_state
+from utils.membership import add_session_tickets
+from utils.strikes import apply_strike, resolve_strikes
+from utils.persistence import insert_rows, player_ticket_rows
 
 router = APIRouter()
 
 
 @router.post("/create", response_model=PlayerResponse)
-def create_player(
+async def create_player(
     player_data: PlayerCreate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> PlayerResponse:
     """Create a new player with unique short ID"""
     
     # Generate unique player ID
     while True:
         player_id = generate_player_id()
-        existing = session.exec(select(Player).where(Player.player_id == player_id)).first()
+        existing = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
         if not existing:
             break
     
@@ -36,8 +45,8 @@ def create_player(
     )
     
     session.add(player)
-    session.commit()
-    session.refresh(player)
+    await session.commit()
+    await session.refresh(player)
     
     return PlayerResponse(
         id=player.id,
@@ -49,13 +58,13 @@ def create_player(
 
 
 @router.get("/{player_id}", response_model=PlayerResponse)
-def get_player(
+async def get_player(
     player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> PlayerResponse:
     """Get player information by their short ID"""
     
-    player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+    player = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
@@ -69,28 +78,28 @@ def get_player(
 
 
 @router.get("/{player_id}/tickets", response_model=List[PlayerTicketResponse])
-def get_player_tickets(
+async def get_player_tickets(
     player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> List[PlayerTicketResponse]:
     """Get all tickets for a specific player"""
     
     # Verify player exists
-    player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+    player = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
     # Get player tickets
-    tickets = session.exec(
+    tickets = (await session.exec(
         select(PlayerTicket).where(PlayerTicket.player_id == player_id)
-    ).all()
+    )).all()
     
     return [
         PlayerTicketResponse(
             ticket_id=ticket.ticket_id,
             player_id=ticket.player_id,
-            grid=ticket.grid,
-            strikes=ticket.strikes,
+            grid=resolve_grid(ticket),
+            strikes=resolve_strikes(ticket),
             created_at=ticket.created_at,
             updated_at=ticket.updated_at
         )
@@ -99,70 +108,88 @@ def get_player_tickets(
 
 
 @router.post("/{player_id}/tickets", response_model=List[PlayerTicketResponse])
-def generate_tickets_for_player(
+async def generate_tickets_for_player(
     player_id: str,
     ticket_request: PlayerTicketCreate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> List[PlayerTicketResponse]:
     """Generate tickets for a specific player"""
     
     # Verify player exists
-    player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+    player = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
     if ticket_request.count <= 0 or ticket_request.count > 10:
         raise HTTPException(status_code=400, detail="Count must be between 1 and 10")
     
+    # Tickets bought for a session go straight into it and must not
+    # duplicate one already there
+    game_session = None
+    if ticket_request.session_code:
+        game_session = (await session.exec(
+            select(GameSession).where(GameSession.session_code == ticket_request.session_code)
+        )).first()
+        if not game_session:
+            raise HTTPException(status_code=404, detail="Game session not found")
+    
     try:
-        # Generate tickets
-        ticket_grids = BingoTicketGenerator.generate_tickets(ticket_request.count)
-        
-        created_tickets = []
-        for grid in ticket_grids:
-            ticket = PlayerTicket(
-                player_id=player_id,
-                grid=grid,
-                strikes={},  # Initialize empty strikes
-                game_session_id=None  # Will be set when joining a session
-            )
-            session.add(ticket)
-            created_tickets.append(ticket)
+        # Single tickets come ready-made from the reservoir; strips are built to order
+        if ticket_request.mode == "single":
+            seeded_tickets = await ticket_reservoir.take(ticket_request.count)
+        else:
+            seeded_tickets = await generation_service.agenerate_seeded(ticket_request.count, ticket_request.mode)
         
-        session.commit()
-        
-        # Refresh all tickets to get IDs
-        for ticket in created_tickets:
-            session.refresh(ticket)
+        seeded_tickets = await ensure_unique_tickets(
+            session,
+            game_session.id if game_session else None,
+            seeded_tickets,
+            BingoTicketGenerator.generate_seeded_tickets
+        )
         
-        return [
-            PlayerTicketResponse(
-                ticket_id=ticket.ticket_id,
-                player_id=ticket.player_id,
-                grid=ticket.grid,
-                strikes=ticket.strikes,
-                created_at=ticket.created_at,
-                updated_at=ticket.updated_at
-            )
-            for ticket in created_tickets
-        ]
+        # Only the seed is stored; the grid is rebuilt from it on read. Ids and
+        # timestamps are set here, so one executemany INSERT persists them all
+        rows = player_ticket_rows(player_id, seeded_tickets, game_session.id if game_session else None)
+        await insert_rows(session, PlayerTicket, rows)
+        if game_session:
+            await add_session_tickets(session, game_session.id, player_id, len(rows))
+        await session.commit()
         
+    except IntegrityError:
+        # A concurrent request issued a matching ticket into the session first
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="A ticket was just issued twice in this session, please retry")
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"Error generating tickets: {str(e)}")
+    
+    if game_session:
+        await publish_state(session, [(game_session.id, game_session.session_code)])
+    
+    return [
+        PlayerTicketResponse(
+            ticket_id=row["ticket_id"],
+            player_id=player_id,
+            grid=grid,
+            strikes={},
+            created_at=row["created_at"],
+            updated_at=row["updated_at"]
+        )
+        for row, (_, _, grid, _) in zip(rows, seeded_tickets)
+    ]
 
 
 @router.post("/tickets/strike", response_model=SuccessResponse)
-def strike_number_on_ticket(
+async def strike_number_on_ticket(
     strike_data: TicketStrike,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SuccessResponse:
     """Strike or unstrike a number on a player's ticket"""
     
     # Get the ticket
-    ticket = session.exec(
+    ticket = (await session.exec(
         select(PlayerTicket).where(PlayerTicket.ticket_id == strike_data.ticket_id)
-    ).first()
+    )).first()
     
     if not ticket:
         raise HTTPException(status_code=404, detail="Ticket not found")
@@ -172,24 +199,15 @@ def strike_number_on_ticket(
         raise HTTPException(status_code=400, detail="Invalid row or column")
     
     # Check if there's a number at that position
-    if ticket.grid[strike_data.row][strike_data.col] is None:
+    grid = resolve_grid(ticket)
+    if grid[strike_data.row][strike_data.col] is None:
         raise HTTPException(status_code=400, detail="No number at that position")
     
-    # Create strike key
-    strike_key = f"{strike_data.row}-{strike_data.col}"
-    
-    # Update strikes
-    if not ticket.strikes:
-        ticket.strikes = {}
-    
-    ticket.strikes[strike_key] = strike_data.strike
-    ticket.updated_at = datetime.now().isoformat()
-    
-    session.add(ticket)
-    session.commit()
+    # Atomic bitmask update; concurrent taps on other cells are never lost
+    await apply_strike(session, ticket, strike_data.row, strike_data.col, strike_data.strike)
     
     action = "struck" if strike_data.strike else "unstruk"
-    number = ticket.grid[strike_data.row][strike_data.col]
+    number = grid[strike_data.row][strike_data.col]
     
     return SuccessResponse(
         success=True,
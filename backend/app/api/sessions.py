@@ -1,8 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session, select
+from fastapi import APIRouter, Depends, Header, HTTPException, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from datetime import datetime
 from typing import List, Optional
-import random
 
 from database import get_session
 from models.player import Player, PlayerTicket, GameSession, generate_session_code
@@ -10,21 +13,40 @@ from schemas.multiplayer import (
     GameSessionCreate, GameSessionResponse, GameSessionState,
     NumberCall, NumberCallResponse, SuccessResponse
 )
+from utils.generator import BingoTicketGenerator, resolve_grid
+from utils.fingerprint import ensure_unique_tickets
+from utils.membership import add_session_tickets, assign_tickets
+from utils.strikes import clear_session_strikes
+from utils.draw import advance_draw, called_numbers, remaining_count, remaining_numbers, reset_draw
+from utils.broadcast import session_broadcaster
+from utils.session_state import publish_state, session_state
 
 router = APIRouter()
 
 
+def session_etag(game_session_id: int, version: int, include_remaining: bool = True) -> str:
+    """Strong ETag of a session's state; the id tells apart sessions that reuse a code"""
+    return f'"{game_session_id}-{version}{"" if include_remaining else "-n"}"'
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match comparison (weak, as RFC 9110 specifies for it)"""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
 @router.post("/create", response_model=GameSessionResponse)
-def create_game_session(
+async def create_game_session(
     session_data: GameSessionCreate,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> GameSessionResponse:
     """Create a new multiplayer game session"""
     
     # Verify admin player exists and is admin
-    admin_player = session.exec(
+    admin_player = (await session.exec(
         select(Player).where(Player.player_id == session_data.admin_player_id)
-    ).first()
+    )).first()
     
     if not admin_player:
         raise HTTPException(status_code=404, detail="Admin player not found")
@@ -35,9 +57,9 @@ def create_game_session(
     # Generate unique session code
     while True:
         session_code = generate_session_code()
-        existing = session.exec(
+        existing = (await session.exec(
             select(GameSession).where(GameSession.session_code == session_code)
-        ).first()
+        )).first()
         if not existing:
             break
     
@@ -45,23 +67,21 @@ def create_game_session(
     game_session = GameSession(
         session_code=session_code,
         admin_player_id=session_data.admin_player_id,
-        current_number=None,
-        called_numbers=[],
-        remaining_numbers=list(range(1, 91)),  # 1-90
         is_active=True
     )
+    reset_draw(game_session)
     
     session.add(game_session)
-    session.commit()
-    session.refresh(game_session)
+    await session.commit()
+    await session.refresh(game_session)
     
     return GameSessionResponse(
         id=game_session.id,
         session_code=game_session.session_code,
         admin_player_id=game_session.admin_player_id,
         current_number=game_session.current_number,
-        called_numbers=game_session.called_numbers,
-        remaining_numbers=game_session.remaining_numbers,
+        called_numbers=called_numbers(game_session),
+        remaining_numbers=remaining_numbers(game_session),
         is_active=game_session.is_active,
         created_at=game_session.created_at,
         updated_at=game_session.updated_at
@@ -69,53 +89,93 @@ def create_game_session(
 
 
 @router.get("/{session_code}", response_model=GameSessionState)
-def get_session_state(
+async def get_session_state(
     session_code: str,
-    session: Session = Depends(get_session)
+    response: Response,
+    include_remaining: bool = True,
+    if_none_match: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_session)
 ) -> GameSessionState:
-    """Get current state of a game session"""
-    
-    game_session = session.exec(
+    """
+    Get current state of a game session.
+    
+    The response carries an ETag of the session's version. A poll whose
+    If-None-Match still matches gets an empty 304 after one lookup by
+    session code, without loading or serializing the state.
+    """
+    
+    if if_none_match:
+        current = (await session.exec(
+            select(GameSession.id, GameSession.version).where(GameSession.session_code == session_code)
+        )).first()
+        etag = session_etag(*current, include_remaining) if current else None
+        if etag and etag_matches(if_none_match, etag):
+            return Response(status_code=304, headers={"ETag": etag, "Cache-Control": "no-cache"})
+    
+    game_session = (await session.exec(
         select(GameSession).where(GameSession.session_code == session_code)
-    ).first()
+    )).first()
     
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     
-    # Count players and tickets in this session
-    tickets_count = len(session.exec(
-        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
-    ).all())
+    # Tagged with the version of the row actually read; no-cache makes browsers revalidate each poll
+    response.headers["ETag"] = session_etag(game_session.id, game_session.version, include_remaining)
+    response.headers["Cache-Control"] = "no-cache"
+    return session_state(game_session, include_remaining)
+
+
+@router.get("/{session_code}/stream")
+async def stream_session(
+    session_code: str,
+    include_remaining: bool = True,
+    after: Optional[str] = None,
+    last_event_id: Optional[str] = Header(None),
+    session: AsyncSession = Depends(get_session)
+) -> StreamingResponse:
+    """
+    Server-Sent Events stream of a game session.
+    
+    Starts with a `state` event (the GET response) unless it resumes from
+    the `Last-Event-ID` header or `after` query parameter; then sends one
+    small event per call (`call`), reset (`reset`) and deactivation
+    (`deactivate`), a fresh `state` when players or tickets change or the
+    session is reaped, and heartbeat comments while quiet. A `resync` event
+    asks the client to refetch the state with GET.
+    """
+    
+    # Subscribe before reading, so no event between the read and the stream is lost
+    subscription = session_broadcaster.subscribe(session_code, last_event_id or after)
+    
+    game_session = (await session.exec(
+        select(GameSession).where(GameSession.session_code == session_code)
+    )).first()
+    
+    if not game_session:
+        session_broadcaster.release(subscription)
+        raise HTTPException(status_code=404, detail="Game session not found")
     
-    # Get unique players from tickets
-    unique_players = set()
-    tickets = session.exec(
-        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
-    ).all()
-    for ticket in tickets:
-        unique_players.add(ticket.player_id)
+    snapshot = None
+    if subscription.position is None:
+        snapshot = session_state(game_session, include_remaining).model_dump_json()
     
-    return GameSessionState(
-        session_code=game_session.session_code,
-        current_number=game_session.current_number,
-        called_numbers=game_session.called_numbers,
-        remaining_numbers=game_session.remaining_numbers,
-        players_count=len(unique_players),
-        tickets_count=tickets_count,
-        is_active=game_session.is_active
+    return StreamingResponse(
+        session_broadcaster.stream(subscription, snapshot),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
     )
 
 
 @router.post("/{session_code}/call-number", response_model=NumberCallResponse)
-def call_next_number(
+async def call_next_number(
     session_code: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> NumberCallResponse:
     """Call the next random number in the game session"""
     
-    game_session = session.exec(
+    game_session = (await session.exec(
         select(GameSession).where(GameSession.session_code == session_code)
-    ).first()
+    )).first()
     
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
@@ -123,62 +183,58 @@ def call_next_number(
     if not game_session.is_active:
         raise HTTPException(status_code=400, detail="Game session is not active")
     
-    if not game_session.remaining_numbers:
+    if remaining_count(game_session) == 0:
         raise HTTPException(status_code=400, detail="No numbers remaining in this session")
     
-    # Pick random number from remaining
-    called_number = random.choice(game_session.remaining_numbers)
-    
-    # Update session state - create new lists to ensure SQLModel tracks changes
-    new_remaining = game_session.remaining_numbers.copy()
-    new_remaining.remove(called_number)
-    new_called = game_session.called_numbers.copy()
-    new_called.append(called_number)
+    # Next number of the pre-shuffled draw, advanced in the database so
+    # concurrent calls never announce the same number
+    called_number = await advance_draw(session, game_session)
+    if called_number is None:
+        raise HTTPException(status_code=400, detail="No numbers remaining in this session")
+    await session.commit()
     
-    game_session.remaining_numbers = new_remaining
-    game_session.called_numbers = new_called
-    game_session.current_number = called_number
-    game_session.updated_at = datetime.now().isoformat()
-    
-    session.add(game_session)
-    session.commit()
+    all_called_numbers = called_numbers(game_session)
+    session_broadcaster.publish(session_code, "call", {
+        "number": called_number,
+        "called_count": len(all_called_numbers)
+    })
     
     return NumberCallResponse(
         session_code=session_code,
         called_number=called_number,
-        remaining_count=len(game_session.remaining_numbers),
-        all_called_numbers=game_session.called_numbers.copy()
+        remaining_count=remaining_count(game_session),
+        all_called_numbers=all_called_numbers
     )
 
 
 @router.post("/{session_code}/join", response_model=SuccessResponse)
-def join_session(
+async def join_session(
     session_code: str,
     player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SuccessResponse:
     """Add a player's tickets to a game session"""
     
     # Verify game session exists
-    game_session = session.exec(
+    game_session = (await session.exec(
         select(GameSession).where(GameSession.session_code == session_code)
-    ).first()
+    )).first()
     
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     
     # Verify player exists
-    player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+    player = (await session.exec(select(Player).where(Player.player_id == player_id))).first()
     if not player:
         raise HTTPException(status_code=404, detail="Player not found")
     
     # Get player's tickets that aren't already in a session
-    player_tickets = session.exec(
+    player_tickets = (await session.exec(
         select(PlayerTicket).where(
             PlayerTicket.player_id == player_id,
             PlayerTicket.game_session_id == None
         )
-    ).all()
+    )).all()
     
     if not player_tickets:
         raise HTTPException(
@@ -186,15 +242,49 @@ def join_session(
             detail="Player has no available tickets to join the session"
         )
     
-    # Add tickets to session
-    tickets_added = 0
-    for ticket in player_tickets:
-        ticket.game_session_id = game_session.id
-        ticket.updated_at = datetime.now().isoformat()
-        session.add(ticket)
-        tickets_added += 1
-    
-    session.commit()
+    # A ticket duplicating one already in the session (or another of the
+    # player's) is regenerated, its whole strip for a strip ticket
+    unique_tickets = await ensure_unique_tickets(
+        session,
+        game_session.id,
+        [(ticket.seed, ticket.generator_version, resolve_grid(ticket)) for ticket in player_tickets],
+        BingoTicketGenerator.generate_seeded_tickets
+    )
+    now = datetime.now().isoformat()
+    replaced = []
+    fingerprinted = []
+    for ticket, (seed, version, _, fingerprint) in zip(player_tickets, unique_tickets):
+        if seed != ticket.seed or version != ticket.generator_version:
+            # A new ticket: strikes made on the old grid no longer apply
+            replaced.append({
+                "id": ticket.id, "seed": seed, "generator_version": version, "grid": None,
+                "fingerprint": fingerprint, "strike_mask": 0, "strikes": None, "updated_at": now
+            })
+        elif ticket.fingerprint is None:
+            # Tickets from before fingerprints get theirs
+            fingerprinted.append({"id": ticket.id, "fingerprint": fingerprint})
+    
+    try:
+        # By primary key, one executemany per shape
+        for rows in (replaced, fingerprinted):
+            if rows:
+                await session.execute(update(PlayerTicket), rows)
+        
+        # Counters first, so their membership read is done before the UPDATE
+        # below takes the write lock; then move every ticket in one statement
+        await add_session_tickets(session, game_session.id, player_id, len(player_tickets))
+        tickets_added = await assign_tickets(session, game_session.id, [ticket.id for ticket in player_tickets])
+        if tickets_added != len(player_tickets):
+            # Another join moved some of these tickets in the meantime
+            await session.rollback()
+            raise HTTPException(status_code=409, detail="Player's tickets changed while joining, please retry")
+        await session.commit()
+    except IntegrityError:
+        # A concurrent join or purchase brought a matching ticket in first
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="Session tickets changed while joining, please retry")
+    
+    await publish_state(session, [(game_session.id, session_code)])
     
     return SuccessResponse(
         success=True,
@@ -202,94 +292,90 @@ def join_session(
         data={
             "player_id": player_id,
             "session_code": session_code,
-            "tickets_added": tickets_added
+            "tickets_added": tickets_added,
+            "tickets_replaced": len(replaced)
         }
     )
 
 
 @router.post("/{session_code}/reset", response_model=SuccessResponse)
-def reset_session(
+async def reset_session(
     session_code: str,
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SuccessResponse:
     """Reset a game session (admin only)"""
     
-    game_session = session.exec(
+    game_session = (await session.exec(
         select(GameSession).where(GameSession.session_code == session_code)
-    ).first()
+    )).first()
     
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     
     # Verify admin privileges
     if game_session.admin_player_id != admin_player_id:
-        admin_player = session.exec(
+        admin_player = (await session.exec(
             select(Player).where(Player.player_id == admin_player_id)
-        ).first()
+        )).first()
         
         if not admin_player or not admin_player.is_admin:
             raise HTTPException(status_code=403, detail="Admin privileges required")
     
     # Reset session state
-    game_session.current_number = None
-    game_session.called_numbers = []
-    game_session.remaining_numbers = list(range(1, 91))
-    game_session.updated_at = datetime.now().isoformat()
-    
-    # Reset all ticket strikes in this session
-    session_tickets = session.exec(
-        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
-    ).all()
+    reset_draw(game_session)
+    game_session.updated_at = game_session.last_activity_at = datetime.now().isoformat()
+    game_session.version = GameSession.version + 1
     
-    for ticket in session_tickets:
-        ticket.strikes = {}
-        ticket.updated_at = datetime.now().isoformat()
-        session.add(ticket)
+    # Clear every ticket's strikes in one UPDATE
+    tickets_reset = await clear_session_strikes(session, game_session.id)
     
     session.add(game_session)
-    session.commit()
+    await session.commit()
+    session_broadcaster.publish(session_code, "reset", {})
     
     return SuccessResponse(
         success=True,
         message=f"Session {session_code} has been reset",
         data={
             "session_code": session_code,
-            "tickets_reset": len(session_tickets)
+            "tickets_reset": tickets_reset
         }
     )
 
 
 @router.post("/{session_code}/deactivate", response_model=SuccessResponse)
-def deactivate_session(
+async def deactivate_session(
     session_code: str,
     admin_player_id: str,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> SuccessResponse:
     """Deactivate a game session (admin only)"""
     
-    game_session = session.exec(
+    game_session = (await session.exec(
         select(GameSession).where(GameSession.session_code == session_code)
-    ).first()
+    )).first()
     
     if not game_session:
         raise HTTPException(status_code=404, detail="Game session not found")
     
     # Verify admin privileges
     if game_session.admin_player_id != admin_player_id:
-        admin_player = session.exec(
+        admin_player = (await session.exec(
             select(Player).where(Player.player_id == admin_player_id)
-        ).first()
+        )).first()
         
         if not admin_player or not admin_player.is_admin:
             raise HTTPException(status_code=403, detail="Admin privileges required")
     
     # Deactivate session
     game_session.is_active = False
-    game_session.updated_at = datetime.now().isoformat()
+    game_session.updated_at = game_session.last_activity_at = datetime.now().isoformat()
+    game_session.version = GameSession.version + 1
     
     session.add(game_session)
-    session.commit()
+    await session.commit()
+    session_broadcaster.publish(session_code, "deactivate", {})
     
     return SuccessResponse(
         success=True,
@@ -1,20 +1,28 @@
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
-from datetime import datetime
-from typing import List
+from datetime import date
+from typing import Iterator, List
 
-from database import get_session
-from models.ticket import Ticket
-from schemas.ticket import TicketGenerateRequest, TicketGenerateResponse
-from utils.generator import BingoTicketGenerator
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database import engine, get_session
+from schemas.ticket import (
+    TicketGenerateRequest, TicketGenerateResponse, TicketExportRequest, ReservoirStatsResponse
+)
+from utils.export import MAX_EXPORT_COUNT, csv_chunks, iter_ticket_chunks, ndjson_chunks
+from utils.generation_service import generation_service
+from utils.persistence import insert_rows, ticket_rows
+from utils.reservoir import ticket_reservoir
+from utils.retention import ticket_partitions
 
 router = APIRouter()
 
 
 @router.post("/generate", response_model=TicketGenerateResponse)
-def generate_tickets(
+async def generate_tickets(
     request: TicketGenerateRequest,
-    session: Session = Depends(get_session)
+    session: AsyncSession = Depends(get_session)
 ) -> TicketGenerateResponse:
     """Generate bingo tickets"""
     
@@ -22,23 +30,52 @@ def generate_tickets(
         raise HTTPException(status_code=400, detail="Count must be between 1 and 100")
     
     try:
-        # Generate tickets
-        tickets_grids = BingoTicketGenerator.generate_tickets(request.count)
-        
-        # Save to database (optional - you can remove this if you don't want persistence)
-        saved_tickets = []
-        for grid in tickets_grids:
-            ticket = Ticket(
-                grid=grid,
-                created_at=datetime.now().isoformat()
-            )
-            session.add(ticket)
-            saved_tickets.append(ticket)
+        # Generate seed-addressed tickets off the event loop
+        seeded_tickets = await generation_service.agenerate_seeded(request.count, request.mode)
         
-        session.commit()
+        # Save to today's partition in one INSERT (optional - you can remove this if you don't want persistence)
+        await insert_rows(session, await ticket_partitions.aensure(date.today()), ticket_rows(seeded_tickets))
+        await session.commit()
         
-        return TicketGenerateResponse(tickets=tickets_grids)
+        return TicketGenerateResponse(tickets=[grid for _, _, grid in seeded_tickets])
         
     except Exception as e:
-        session.rollback()
+        await session.rollback()
         raise HTTPException(status_code=500, detail=f"Error generating tickets: {str(e)}")
+
+
+def _export_stream(request: TicketExportRequest) -> Iterator[str]:
+    """Generate and serialize the export chunk by chunk"""
+    def serialize(chunks):
+        if request.format == "csv":
+            return csv_chunks(chunks, with_ids=request.persist)
+        return ndjson_chunks(chunks)
+
+    if not request.persist:
+        yield from serialize(iter_ticket_chunks(request.count, request.mode))
+        return
+
+    # The request's session closes before the body is streamed, so use our own
+    with Session(engine) as session:
+        yield from serialize(iter_ticket_chunks(request.count, request.mode, session=session))
+
+
+@router.post("/export")
+async def export_tickets(request: TicketExportRequest) -> StreamingResponse:
+    """Stream up to a million tickets as NDJSON or CSV for print runs"""
+    
+    if request.count <= 0 or request.count > MAX_EXPORT_COUNT:
+        raise HTTPException(status_code=400, detail=f"Count must be between 1 and {MAX_EXPORT_COUNT}")
+    
+    media_type = "text/csv" if request.format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        _export_stream(request),
+        media_type=media_type,
+        headers={"Content-Disposition": f"attachment; filename=tickets.{request.format}"}
+    )
+
+
+@router.get("/reservoir", response_model=ReservoirStatsResponse)
+async def get_reservoir_stats() -> ReservoirStatsResponse:
+    """Size, hit/miss counts and refill latency of the pre-generated ticket pool"""
+    return ReservoirStatsResponse(**ticket_reservoir.stats())
@@ -2,9 +2,15 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import asyncio
 
-from database import create_db_and_tables
+from database import async_engine, create_db_and_tables
 from app.api import tickets, game, announce, players, sessions, admin
-from utils.cleanup import periodic_cleanup_task, manual_cleanup
+from utils.cleanup import cleanup_worker, periodic_cleanup_task, manual_cleanup
+from utils.reaper import session_reaper
+from utils.broadcast import session_broadcaster
+from utils.retention import retention_worker
+from schemas.multiplayer import CleanupStatsResponse, ReaperStatsResponse, RetentionStatsResponse, StreamStatsResponse
+from utils.generation_service import generation_service
+from utils.reservoir import ticket_reservoir
 
 # Create FastAPI app
 app = FastAPI(
@@ -20,6 +26,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag"],  # Admin listing pagination, session state versions
 )
 
 # Include routers
@@ -41,6 +48,23 @@ def on_startup():
     # Start periodic cleanup task in background
     asyncio.create_task(periodic_cleanup_task())
 
+    # Deactivate sessions left idle past their TTL
+    asyncio.create_task(session_reaper.run())
+
+    # Drop expired day partitions of the legacy ticket and game tables
+    asyncio.create_task(retention_worker.run())
+
+    # Keep a pool of ready-made tickets for purchases
+    asyncio.create_task(ticket_reservoir.run())
+
+
+@app.on_event("shutdown")
+async def on_shutdown():
+    """End session streams, stop the ticket generation worker pool and close database connections"""
+    session_broadcaster.close()
+    generation_service.shutdown()
+    await async_engine.dispose()
+
 
 @app.get("/")
 def read_root():
@@ -97,3 +121,27 @@ def health_check():
 def trigger_manual_cleanup():
     """Manually trigger database cleanup (for admin use)"""
     return manual_cleanup()
+
+
+@app.get("/api/admin/cleanup/stats", response_model=CleanupStatsResponse)
+def get_cleanup_stats() -> CleanupStatsResponse:
+    """Rows deleted, duration, lag and chunk lock times of the cleanup worker"""
+    return CleanupStatsResponse(**cleanup_worker.stats())
+
+
+@app.get("/api/admin/reaper/stats", response_model=ReaperStatsResponse)
+def get_reaper_stats() -> ReaperStatsResponse:
+    """Sessions reaped, lag and run duration of the idle-session reaper"""
+    return ReaperStatsResponse(**session_reaper.stats())
+
+
+@app.get("/api/admin/retention/stats", response_model=RetentionStatsResponse)
+def get_retention_stats() -> RetentionStatsResponse:
+    """Partitions kept and dropped, legacy rows drained and database size"""
+    return RetentionStatsResponse(**retention_worker.stats())
+
+
+@app.get("/api/admin/streams/stats", response_model=StreamStatsResponse)
+async def get_stream_stats() -> StreamStatsResponse:
+    """Open session event streams and events published"""
+    return StreamStatsResponse(**session_broadcaster.stats())
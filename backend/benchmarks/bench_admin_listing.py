@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+Benchmark the admin session listings and check their query budget.
+
+Fills a scratch database with sessions, players and tickets, then lists
+every session the old way (all tickets per session, one player query per
+player) and through the paginated endpoints, reporting latency and SQL
+statements executed. The endpoints must stay within QUERY_BUDGET statements
+per request whatever the page or session size; the script exits non-zero
+if they don't. Run from the backend directory:
+
+    python -m benchmarks.bench_admin_listing [sessions] [players per session]
+"""
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event, insert
+from sqlmodel import Session, select
+
+from models.player import GameSession, Player, PlayerTicket, SessionPlayer
+from utils.draw import called_numbers, remaining_numbers, reset_draw
+
+TICKETS_PER_PLAYER = 3
+PAGE_SIZES = (50, 500)
+# Admin check, the page, its players
+QUERY_BUDGET = 3
+
+
+class QueryCounter:
+    """Counts statements executed on an engine"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self)
+
+
+def build(engine, sessions: int, players_per_session: int) -> None:
+    """Sessions, each with its own players, their tickets, memberships and counters"""
+    with Session(engine) as session:
+        session.add(Player(player_id="ADMIN1", name="Admin", is_admin=True))
+        for index in range(sessions):
+            game_session = GameSession(
+                session_code=f"S{index}",
+                admin_player_id="ADMIN1",
+                tickets_count=players_per_session * TICKETS_PER_PLAYER,
+                players_count=players_per_session
+            )
+            reset_draw(game_session)
+            session.add(game_session)
+        session.commit()
+
+        ids = session.exec(select(GameSession.id).order_by(GameSession.id)).all()
+        members = [(game_session_id, f"P{game_session_id}-{index}") for game_session_id in ids
+                   for index in range(players_per_session)]
+        session.execute(insert(Player), [{"player_id": player_id, "name": player_id} for _, player_id in members])
+        session.execute(insert(SessionPlayer), [
+            {"game_session_id": game_session_id, "player_id": player_id, "tickets_count": TICKETS_PER_PLAYER}
+            for game_session_id, player_id in members
+        ])
+        session.execute(insert(PlayerTicket), [
+            {"game_session_id": game_session_id, "player_id": player_id, "seed": seed, "generator_version": 1}
+            for game_session_id, player_id in members for seed in range(TICKETS_PER_PLAYER)
+        ])
+        session.commit()
+
+
+def list_sessions_per_player(engine) -> int:
+    """The pre-pagination listing: every ticket of every session, then one query per player"""
+    listed = 0
+    with Session(engine) as session:
+        for game_session in session.exec(select(GameSession)).all():
+            session_tickets = session.exec(
+                select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
+            ).all()
+            players = []
+            for player_id in set(ticket.player_id for ticket in session_tickets):
+                player = session.exec(select(Player).where(Player.player_id == player_id)).first()
+                if player:
+                    players.append(player)
+            called_numbers(game_session), remaining_numbers(game_session), len(session_tickets)
+            listed += 1
+    return listed
+
+
+async def list_pages(client, path: str, limit: int, counter: QueryCounter) -> tuple:
+    """Follow X-Next-Cursor through every page; returns (items, pages, most statements in one request)"""
+    items, pages, worst, after = 0, 0, 0, None
+    while True:
+        params = {"admin_player_id": "ADMIN1", "limit": limit, "include_remaining": False}
+        if after is not None:
+            params["after"] = after
+        before = counter.count
+        response = await client.get(path, params=params)
+        response.raise_for_status()
+        worst = max(worst, counter.count - before)
+        body = response.json()
+        items += len(body) if isinstance(body, list) else len(body["players"])
+        pages += 1
+        after = response.headers.get("X-Next-Cursor")
+        if after is None:
+            return items, pages, worst
+
+
+async def run(sessions: int, players_per_session: int) -> bool:
+    import httpx
+
+    import database
+    database.create_db_and_tables()
+    build(database.engine, sessions, players_per_session)
+    from app.main import app
+
+    print(f"📊 Admin session listing ({sessions} sessions, {players_per_session} players each, "
+          f"{TICKETS_PER_PLAYER} tickets per player)")
+    print("=" * 84)
+    print(f"{'listing':<36} {'items':>7} {'pages':>6} {'ms':>9} {'statements':>11} {'max/request':>12}")
+
+    with QueryCounter(database.engine) as counter:
+        start = time.perf_counter()
+        listed = list_sessions_per_player(database.engine)
+        elapsed = time.perf_counter() - start
+    print(f"{'per-player queries (before)':<36} {listed:>7} {1:>6} {elapsed * 1000:>9.0f} {counter.count:>11} {'':>12}")
+
+    within_budget = True
+    app_engine = database.engine if database.DB_DRIVER == "sync" else database.async_engine.sync_engine
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        for name, path in (
+            ("GET /api/admin/sessions", "/api/admin/sessions"),
+            ("GET /api/admin/session/S0", "/api/admin/session/S0")
+        ):
+            for limit in PAGE_SIZES:
+                with QueryCounter(app_engine) as counter:
+                    start = time.perf_counter()
+                    items, pages, worst = await list_pages(client, path, limit, counter)
+                    elapsed = time.perf_counter() - start
+                label = f"{name} limit={limit}"
+                print(f"{label:<36} {items:>7} {pages:>6} {elapsed * 1000:>9.0f} {counter.count:>11} {worst:>12}")
+                within_budget &= worst <= QUERY_BUDGET
+    await database.async_engine.dispose()
+
+    print(f"\nQuery budget ({QUERY_BUDGET} per request): {'✅ within budget' if within_budget else '❌ exceeded'}")
+    return within_budget
+
+
+def run_benchmark(sessions: int = 300, players_per_session: int = 20) -> bool:
+    """Run against a scratch database in a temporary working directory"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            return asyncio.run(run(sessions, players_per_session))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    args = [int(arg) for arg in sys.argv[1:3]]
+    sys.exit(0 if run_benchmark(*args) else 1)
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the async (aiosqlite) and sync (threadpool) database drivers.
+
+Runs the app in-process for each BINGO_DB_DRIVER value and has many
+concurrent clients mix session-state polls with strike taps on their own
+tickets, the two request types that dominate a live game. Reports
+requests/s, p50/p99 latency per request type and failed requests (for
+example "database is locked" under write contention). Each driver runs in a fresh
+process against a scratch database. Run from the backend directory:
+
+    python -m benchmarks.bench_async [clients...]
+"""
+import asyncio
+import json
+import logging
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+DURATION = 10.0
+STRIKE_SHARE = 0.3  # The rest of the requests are polls
+DEFAULT_CLIENTS = (50, 200)
+
+
+async def setup(client, clients: int):
+    """One session and one joined player with a ticket per client; returns (admin id, session code, tickets)"""
+    admin = (await client.post("/api/players/create", json={"name": "Admin", "is_admin": True})).json()
+    code = (await client.post("/api/sessions/create", json={"admin_player_id": admin["player_id"]})).json()["session_code"]
+    tickets = []
+    for index in range(clients):
+        player = (await client.post("/api/players/create", json={"name": f"P{index}"})).json()
+        ticket = (await client.post(
+            f"/api/players/{player['player_id']}/tickets", json={"player_id": player["player_id"], "count": 1}
+        )).json()[0]
+        await client.post(f"/api/sessions/{code}/join", params={"player_id": player["player_id"]})
+        cells = [(row, col) for row in range(3) for col in range(9) if ticket["grid"][row][col] is not None]
+        tickets.append((ticket["ticket_id"], cells))
+    return admin["player_id"], code, tickets
+
+
+async def play(client, code: str, ticket_id: str, cells, deadline: float, latencies: dict, errors: dict):
+    """One client: poll the session or strike a cell until the deadline"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        if random.random() < STRIKE_SHARE:
+            kind = "strike"
+            row, col = random.choice(cells)
+            response = await client.post("/api/players/tickets/strike", json={
+                "ticket_id": ticket_id, "row": row, "col": col, "strike": random.random() < 0.8
+            })
+        else:
+            kind = "poll"
+            response = await client.get(f"/api/sessions/{code}")
+        if response.status_code >= 500:
+            errors[kind] += 1
+        else:
+            latencies[kind].append(time.perf_counter() - start)
+
+
+async def run_load(clients: int) -> dict:
+    """Drive the app in this process; returns per-type throughput and latency"""
+    import httpx
+
+    import database
+    database.engine.echo = False
+    database.async_engine.echo = False
+    database.create_db_and_tables()
+    from app.main import app
+
+    # Failed requests come back as 500s instead of raising in the client
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        _, code, tickets = await setup(client, clients)
+        latencies = {"poll": [], "strike": []}
+        errors = {"poll": 0, "strike": 0}
+        deadline = time.perf_counter() + DURATION
+        await asyncio.gather(*(
+            play(client, code, ticket_id, cells, deadline, latencies, errors) for ticket_id, cells in tickets
+        ))
+    await database.async_engine.dispose()
+
+    result = {}
+    for kind, samples in latencies.items():
+        samples.sort()
+        result[kind] = {
+            "rps": len(samples) / DURATION,
+            "p50": statistics.median(samples) * 1000,
+            "p99": samples[int(len(samples) * 0.99)] * 1000,
+            "errors": errors[kind]
+        }
+    return result
+
+
+def measure(driver: str, clients: int) -> dict:
+    """Run one driver at one concurrency in a child process with a scratch database"""
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=backend, BINGO_DB_DRIVER=driver)
+    with tempfile.TemporaryDirectory() as scratch:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_async", "--child", str(clients)],
+            cwd=scratch, env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(client_counts=DEFAULT_CLIENTS):
+    """Compare both drivers under concurrent poll and strike traffic"""
+    print(f"📊 Database driver benchmark ({DURATION:.0f}s per run, {STRIKE_SHARE:.0%} strikes)")
+    print("=" * 92)
+    print(
+        f"{'driver':<7} {'clients':>8} {'poll/s':>8} {'poll p50':>9} {'poll p99':>9} "
+        f"{'strike/s':>9} {'strike p50':>11} {'strike p99':>11} {'errors':>7}"
+    )
+    for clients in client_counts:
+        for driver in ("sync", "async"):
+            stats = measure(driver, clients)
+            poll, strike = stats["poll"], stats["strike"]
+            print(
+                f"{driver:<7} {clients:>8} {poll['rps']:>8.0f} {poll['p50']:>7.1f}ms {poll['p99']:>7.1f}ms "
+                f"{strike['rps']:>9.0f} {strike['p50']:>9.1f}ms {strike['p99']:>9.1f}ms "
+                f"{poll['errors'] + strike['errors']:>7}"
+            )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        logging.disable(logging.CRITICAL)
+        print(json.dumps(asyncio.run(run_load(int(sys.argv[2])))))
+    else:
+        run_benchmark(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_CLIENTS)
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+Benchmark vectorized batch generation against the per-ticket loop.
+
+Run from the backend directory:
+
+    python -m benchmarks.bench_batch [sizes...]
+"""
+import sys
+import time
+
+from utils.batch import batch_to_grids, generate_batch
+from utils.generator import BingoTicketGenerator
+
+
+def timed(function, *args) -> float:
+    """Return the wall time of one call"""
+    start = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - start
+
+
+def run_benchmark(sizes=(1_000, 100_000, 1_000_000)):
+    """Compare generate_batch with generate_tickets at each size"""
+    print("📦 Batch generation benchmark")
+    print("=" * 78)
+    print(f"{'tickets':>10} {'loop (s)':>10} {'batch (s)':>10} {'+lists (s)':>11} {'batch t/s':>14} {'speedup':>9}")
+
+    # Build the lookup tables outside the timings
+    generate_batch(1)
+
+    for size in sizes:
+        loop_time = timed(BingoTicketGenerator.generate_tickets, size)
+        batch_time = timed(generate_batch, size)
+        batch = generate_batch(size)
+        convert_time = timed(batch_to_grids, batch)
+        print(
+            f"{size:>10,} {loop_time:>10.3f} {batch_time:>10.3f} {convert_time:>11.3f} "
+            f"{size / batch_time:>14,.0f} {loop_time / batch_time:>8.1f}x"
+        )
+
+    print("-" * 78)
+    print("+lists: extra cost of converting the batch to nested lists at the API boundary")
+
+
+if __name__ == "__main__":
+    run_benchmark(tuple(int(arg) for arg in sys.argv[1:]) or (1_000, 100_000, 1_000_000))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark the cleanup purge: one big ORM transaction vs the chunked worker.
+
+Fills a scratch database with finished games (and their tickets, members
+and soon-orphaned players), then purges it the old way (objects deleted one
+by one in a single transaction, called straight from the event loop) and
+with CleanupWorker (archive to gzip segments, then chunked set-based
+DELETEs, in a thread executor). Reports
+purge duration, the longest write-lock hold and the longest event-loop
+stall seen by a 5 ms ticker. Run from the backend directory:
+
+    python -m benchmarks.bench_cleanup [finished games] [tickets per game]
+"""
+import asyncio
+import logging
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import delete, insert
+from sqlmodel import Session, select
+
+TICKETS_PER_PLAYER = 4
+
+
+def build(engine, games: int, tickets_per_game: int) -> None:
+    """Finished games last updated long ago, each with its own players and tickets"""
+    from models.player import GameSession, Player, PlayerTicket, SessionPlayer
+    players_per_game = tickets_per_game // TICKETS_PER_PLAYER
+    with Session(engine) as session:
+        if session.get(Player, 1) is None:
+            session.add(Player(player_id="ADMIN1", name="Admin", is_admin=True))
+            session.flush()
+        session.execute(insert(Player), [
+            {"player_id": f"P{game}-{index}", "name": "Bench", "created_at": "2020-01-01"}
+            for game in range(games) for index in range(players_per_game)
+        ])
+        session.execute(insert(GameSession), [
+            {"session_code": f"G{game}", "admin_player_id": "ADMIN1", "is_active": False, "updated_at": "2020-01-01", "last_activity_at": "2020-01-01"}
+            for game in range(games)
+        ])
+        session.execute(insert(SessionPlayer), [
+            {"game_session_id": game + 1, "player_id": f"P{game}-{index}", "tickets_count": TICKETS_PER_PLAYER}
+            for game in range(games) for index in range(players_per_game)
+        ])
+        session.execute(insert(PlayerTicket), [
+            {"game_session_id": game + 1, "player_id": f"P{game}-{index // TICKETS_PER_PLAYER}", "seed": index, "generator_version": 1}
+            for game in range(games) for index in range(tickets_per_game)
+        ])
+        session.commit()
+
+
+def purge_single_transaction(engine) -> float:
+    """The pre-worker purge: per-object deletes, one commit at the end; returns the lock hold in ms"""
+    from models.player import GameSession, Player, PlayerTicket, SessionPlayer
+    with Session(engine) as session:
+        inactive_sessions = session.exec(select(GameSession).where(GameSession.is_active == False)).all()
+        start = time.perf_counter()
+        for game_session in inactive_sessions:
+            session.exec(delete(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id))
+            session.exec(delete(SessionPlayer).where(SessionPlayer.game_session_id == game_session.id))
+            session.delete(game_session)
+        session.commit()
+        hold = time.perf_counter() - start
+
+        orphaned_players = session.exec(select(Player).where(
+            ~Player.game_sessions.any(), ~Player.tickets.any(), Player.is_admin == False
+        )).all()
+        start = time.perf_counter()
+        for player in orphaned_players:
+            session.delete(player)
+        session.commit()
+        return max(hold, time.perf_counter() - start) * 1000
+
+
+async def measure(purge) -> tuple:
+    """(purge seconds, longest event-loop stall ms) with a 5 ms ticker running alongside"""
+    stalls = []
+    done = asyncio.Event()
+
+    async def ticker():
+        last = time.perf_counter()
+        while not done.is_set():
+            await asyncio.sleep(0.005)
+            now = time.perf_counter()
+            stalls.append(now - last - 0.005)
+            last = now
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0.02)
+    start = time.perf_counter()
+    result = await purge()
+    elapsed = time.perf_counter() - start
+    done.set()
+    await ticking
+    return elapsed, max(stalls) * 1000, result
+
+
+async def run(games: int, tickets_per_game: int) -> None:
+    import database
+    from utils.cleanup import CleanupWorker
+
+    database.create_db_and_tables()
+    print(f"📊 Cleanup benchmark ({games} finished games x {tickets_per_game} tickets)")
+    print("=" * 72)
+    print(f"{'purge':<22} {'seconds':>8} {'max lock hold ms':>17} {'max loop stall ms':>18}")
+
+    build(database.engine, games, tickets_per_game)
+
+    async def single_transaction():
+        # Called straight from the event loop, as periodic_cleanup_task used to
+        return purge_single_transaction(database.engine)
+
+    elapsed, stall, hold = await measure(single_transaction)
+    print(f"{'single transaction':<22} {elapsed:>8.2f} {hold:>17.0f} {stall:>18.0f}")
+
+    build(database.engine, games, tickets_per_game)
+    worker = CleanupWorker()
+
+    async def chunked():
+        await asyncio.get_running_loop().run_in_executor(None, worker.run_once, 0)
+        return worker.max_chunk_ms
+
+    elapsed, stall, hold = await measure(chunked)
+    print(f"{'chunked worker':<22} {elapsed:>8.2f} {hold:>17.0f} {stall:>18.0f}")
+    stats = worker.stats()
+    print(f"\nArchived {stats['total_games_archived']} games in {stats['total_archived_bytes'] / 1e6:.1f} MB of segments")
+    print(f"Worker stats: {stats}")
+    await database.async_engine.dispose()
+
+
+def run_benchmark(games: int = 50, tickets_per_game: int = 2000):
+    """Run against a scratch database in a temporary working directory"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            asyncio.run(run(games, tickets_per_game))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    run_benchmark(*[int(arg) for arg in sys.argv[1:3]])
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark number calls: JSON called/remaining lists vs the compact draw state.
+
+Plays full 90-number games with both strategies and reports end-to-end call
+latency (load, update, commit) on an in-memory database, where it is all
+CPU, and on a scratch file database, plus the bytes of parameters sent in
+each UPDATE. Run from the backend directory:
+
+    python -m benchmarks.bench_draw [games]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from models.player import GameSession, Player
+from utils.draw import call_next, reset_draw
+
+MEMORY_GAMES = 500
+
+
+def call_json(game_session: GameSession) -> int:
+    """The pre-draw-order call: pick from remaining, copy and rewrite both lists"""
+    called_number = random.choice(game_session.remaining_numbers)
+    new_remaining = game_session.remaining_numbers.copy()
+    new_remaining.remove(called_number)
+    new_called = game_session.called_numbers.copy()
+    new_called.append(called_number)
+    game_session.remaining_numbers = new_remaining
+    game_session.called_numbers = new_called
+    game_session.current_number = called_number
+    return called_number
+
+
+def new_json_session(code: str) -> GameSession:
+    return GameSession(
+        session_code=code, admin_player_id="BENCH1", called_numbers=[], remaining_numbers=list(range(1, 91))
+    )
+
+
+def new_compact_session(code: str) -> GameSession:
+    game_session = GameSession(session_code=code, admin_player_id="BENCH1")
+    reset_draw(game_session)
+    return game_session
+
+
+def play(engine, name: str, new_session, call, games: int) -> tuple:
+    """(average call latency µs, average UPDATE parameter bytes) over full games"""
+    written = []
+
+    def count_update(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("UPDATE gamesession"):
+            written.append(sum(len(value) if isinstance(value, (bytes, memoryview, str)) else 8 for value in parameters))
+
+    event.listen(engine, "before_cursor_execute", count_update)
+    elapsed = 0.0
+    with Session(engine) as session:
+        for game in range(games):
+            code = f"{name[:4]}{game}"
+            session.add(new_session(code))
+            session.commit()
+            for _ in range(90):
+                start = time.perf_counter()
+                game_session = session.exec(select(GameSession).where(GameSession.session_code == code)).one()
+                call(game_session)
+                session.add(game_session)
+                session.commit()
+                elapsed += time.perf_counter() - start
+    event.remove(engine, "before_cursor_execute", count_update)
+    return elapsed / (games * 90) * 1e6, sum(written) / len(written)
+
+
+def new_engine(url: str):
+    engine = create_engine(url)
+    SQLModel.metadata.create_all(engine)
+    with Session(engine) as session:
+        session.add(Player(player_id="BENCH1", name="Bench"))
+        session.commit()
+    return engine
+
+
+def run_benchmark(games: int = 20):
+    """Compare both call strategies"""
+    with tempfile.TemporaryDirectory() as scratch:
+        file_engine = new_engine(f"sqlite:///{os.path.join(scratch, 'draw.db')}")
+        memory_engine = new_engine("sqlite://")
+
+        print(f"📊 Number call benchmark ({MEMORY_GAMES} games in memory, {games} on a file database)")
+        print("=" * 70)
+        print(f"{'strategy':<14} {'memory µs/call':>15} {'file µs/call':>13} {'UPDATE bytes':>13}")
+        for name, new_session, call in (
+            ("json lists", new_json_session, call_json),
+            ("draw order", new_compact_session, call_next)
+        ):
+            memory_latency, written = play(memory_engine, name, new_session, call, MEMORY_GAMES)
+            file_latency, _ = play(file_engine, name, new_session, call, games)
+            print(f"{name:<14} {memory_latency:>15.0f} {file_latency:>13.0f} {written:>13.0f}")
+        file_engine.dispose()
+        memory_engine.dispose()
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
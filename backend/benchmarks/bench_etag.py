@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark conditional session-state polls (ETag / If-None-Match).
+
+Calls the app directly over ASGI (no sockets, no HTTP client) on a scratch
+database and times `GET /api/sessions/{code}` two ways: a plain poll (full
+state, 200) and a poll whose If-None-Match matches (304 after the version
+lookup), counting SQL statements and body bytes. Then plays a game where
+clients poll every 2 seconds, with or without their last ETag, while a
+number is called every 5 seconds. Run from the backend directory:
+
+    python -m benchmarks.bench_etag [polls]
+"""
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+DEFAULT_POLLS = 2000
+GAME_CLIENTS = 200
+GAME_SECONDS = 60
+POLL_INTERVAL_SECONDS = 2
+CALL_INTERVAL_SECONDS = 5
+
+
+async def asgi_request(
+    app,
+    method: str,
+    path: str,
+    query: str = "",
+    headers: Optional[dict] = None,
+    payload: Optional[dict] = None
+) -> tuple:
+    """(status, headers, body) of one request sent straight to the ASGI app"""
+    headers = dict(headers or {})
+    content = b""
+    if payload is not None:
+        content = json.dumps(payload).encode()
+        headers["content-type"] = "application/json"
+        headers["content-length"] = str(len(content))
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": method, "scheme": "http", "path": path, "raw_path": path.encode(),
+        "query_string": query.encode(), "root_path": "",
+        "headers": [(name.lower().encode(), value.encode()) for name, value in headers.items()],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }
+    received = False
+    status, response_headers, body = 0, {}, bytearray()
+
+    async def receive():
+        nonlocal received
+        if received:
+            await asyncio.Event().wait()  # No disconnect while the response is sent
+        received = True
+        return {"type": "http.request", "body": content, "more_body": False}
+
+    async def send(message):
+        nonlocal status, response_headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            response_headers = {name.decode(): value.decode() for name, value in message["headers"]}
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+
+    await app(scope, receive, send)
+    return status, response_headers, bytes(body)
+
+
+async def time_polls(app, path: str, query: str, headers: Optional[dict], polls: int) -> tuple:
+    """(µs per poll, status, body bytes)"""
+    status, _, body = await asgi_request(app, "GET", path, query, headers)
+    start = time.perf_counter()
+    for _ in range(polls):
+        await asgi_request(app, "GET", path, query, headers)
+    return (time.perf_counter() - start) / polls * 1e6, status, len(body)
+
+
+async def play_game(app, code: str, admin: str, conditional: bool) -> tuple:
+    """(server seconds, polls, 304s) of a simulated game"""
+    await asgi_request(app, "POST", f"/api/sessions/{code}/reset", f"admin_player_id={admin}")
+    etags = [None] * GAME_CLIENTS
+    polls = not_modified = 0
+    elapsed = 0.0
+    # Virtual clock: every client polls once per interval; calls land between rounds
+    for second in range(0, GAME_SECONDS, POLL_INTERVAL_SECONDS):
+        if second % CALL_INTERVAL_SECONDS < POLL_INTERVAL_SECONDS:
+            await asgi_request(app, "POST", f"/api/sessions/{code}/call-number")
+        start = time.perf_counter()
+        for client in range(GAME_CLIENTS):
+            headers = {"If-None-Match": etags[client]} if conditional and etags[client] else None
+            status, response_headers, _ = await asgi_request(app, "GET", f"/api/sessions/{code}", headers=headers)
+            etags[client] = response_headers["etag"]
+            polls += 1
+            not_modified += status == 304
+        elapsed += time.perf_counter() - start
+    return elapsed, polls, not_modified
+
+
+async def run(polls: int) -> None:
+    # Imported here: the database file is opened relative to the scratch directory
+    from sqlalchemy import event
+    from app.main import app
+    from database import DB_DRIVER, async_engine, create_db_and_tables, engine
+
+    create_db_and_tables()
+    statements = []
+    event.listen(
+        engine if DB_DRIVER == "sync" else async_engine.sync_engine,
+        "before_cursor_execute",
+        lambda *args: statements.append(args[2])
+    )
+
+    _, _, body = await asgi_request(app, "POST", "/api/players/create", payload={"name": "Bench", "is_admin": True})
+    admin = json.loads(body)["player_id"]
+    _, _, body = await asgi_request(app, "POST", "/api/sessions/create", payload={"admin_player_id": admin})
+    code = json.loads(body)["session_code"]
+    for _ in range(20):
+        await asgi_request(app, "POST", f"/api/sessions/{code}/call-number")
+
+    path = f"/api/sessions/{code}"
+    print(f"📊 Conditional session poll benchmark ({DB_DRIVER} driver, {polls} polls per case)")
+    print("=" * 72)
+    print(f"{'poll':<38} {'status':>6} {'µs/poll':>8} {'bytes':>6} {'SQL':>4}")
+    for query in ("", "include_remaining=false"):
+        _, headers, _ = await asgi_request(app, "GET", path, query)
+        rows = []
+        for request_headers in (None, {"If-None-Match": headers["etag"]}):
+            latency, status, size = await time_polls(app, path, query, request_headers, polls)
+            statements.clear()
+            await asgi_request(app, "GET", path, query, request_headers)
+            rows.append((latency, status, size, len(statements)))
+
+        label = query or "remaining included"
+        for name, (latency, status, size, sql) in zip(("plain", "If-None-Match"), rows):
+            speedup = f"  {rows[0][0] / latency:.1f}x" if name != "plain" else ""
+            print(f"{name + ', ' + label:<38} {status:>6} {latency:>8.0f} {size:>6} {sql:>4}{speedup}")
+
+    print()
+    print(f"Game: {GAME_CLIENTS} clients polling every {POLL_INTERVAL_SECONDS}s, a call every "
+          f"{CALL_INTERVAL_SECONDS}s, {GAME_SECONDS}s of play")
+    for conditional in (False, True):
+        elapsed, game_polls, not_modified = await play_game(app, code, admin, conditional)
+        print(f"  {'with If-None-Match' if conditional else 'plain polls':<19} {elapsed:5.2f}s server time, "
+              f"{game_polls} polls ({not_modified} answered 304), {game_polls / elapsed:,.0f} polls/s")
+    await async_engine.dispose()
+
+
+def run_benchmark(polls: int = DEFAULT_POLLS):
+    """Run against a scratch database in a temporary working directory"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            asyncio.run(run(polls))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_POLLS)
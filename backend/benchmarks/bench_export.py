@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+Benchmark the streaming ticket export.
+
+Streams exports of growing size through the /api/tickets/export endpoint
+(NDJSON and CSV, with and without persisting to the Ticket table) and reports
+tickets/s, bytes produced and peak RSS. Each run happens in a fresh process
+against a scratch database, so peak RSS reflects that export alone and should
+stay flat as the count grows. Run from the backend directory:
+
+    python -m benchmarks.bench_export
+"""
+import asyncio
+import json
+import logging
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+SIZES = [10_000, 100_000, 1_000_000]
+PERSIST_SIZES = [10_000, 100_000]
+
+
+async def stream_export(app, body: bytes) -> int:
+    """
+    Call the export endpoint straight through ASGI and discard the body.
+
+    TestClient collects the whole response in memory, which would hide
+    whether the endpoint itself streams.
+    """
+    size = 0
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/api/tickets/export", "raw_path": b"/api/tickets/export",
+        "query_string": b"", "root_path": "", "client": ("bench", 0), "server": ("bench", 80),
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())]
+    }
+
+    sent = False
+    finished = asyncio.Event()
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # The client stays connected until the response is complete
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return size
+
+
+def run_export(count: int, fmt: str, persist: bool) -> dict:
+    """Stream one export in this process; returns its measurements"""
+    logging.disable(logging.CRITICAL)
+    import database
+    database.engine.echo = False
+    database.create_db_and_tables()
+    from app.main import app
+
+    body = json.dumps({"count": count, "format": fmt, "persist": persist}).encode()
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    size = asyncio.run(stream_export(app, body))
+    elapsed = time.perf_counter() - start
+
+    return {
+        "rate": count / elapsed,
+        "mb": size / 1e6,
+        "baseline_mb": baseline_kb / 1024,
+        "peak_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    }
+
+
+def measure(count: int, fmt: str, persist: bool) -> dict:
+    """Run one export in a child process with its own scratch database"""
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=backend)
+    with tempfile.TemporaryDirectory() as scratch:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_export", "--child", str(count), fmt, str(int(persist))],
+            cwd=scratch, env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark():
+    """Export throughput and peak RSS across sizes and formats"""
+    print("📊 Streaming export benchmark")
+    print("=" * 78)
+    print(f"{'format':<7} {'persist':<8} {'tickets':>10} {'tickets/s':>11} {'output MB':>10} {'base RSS MB':>12} {'peak RSS MB':>12}")
+
+    for persist, sizes in ((False, SIZES), (True, PERSIST_SIZES)):
+        for fmt in ("ndjson", "csv"):
+            for count in sizes:
+                stats = measure(count, fmt, persist)
+                print(
+                    f"{fmt:<7} {str(persist).lower():<8} {count:>10,} {stats['rate']:>11,.0f} {stats['mb']:>10.1f} "
+                    f"{stats['baseline_mb']:>12.1f} {stats['peak_mb']:>12.1f}"
+                )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 5 and sys.argv[1] == "--child":
+        print(json.dumps(run_export(int(sys.argv[2]), sys.argv[3], sys.argv[4] == "1")))
+    else:
+        run_benchmark()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark ticket issuing with the session duplicate-ticket index.
+
+Pre-fills a session with N tickets, then issues purchases of 10 tickets
+with and without the fingerprint collision check and reports tickets/s.
+Run from the backend directory:
+
+    python -m benchmarks.bench_fingerprint [sizes...]
+"""
+import asyncio
+import os
+import secrets
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel, Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import PlayerTicket
+from utils.batch import generate_batch
+from utils.fingerprint import FINGERPRINT_BYTES, ensure_unique_tickets
+from utils.generator import BingoTicketGenerator
+
+SESSION_ID = 1
+PREFILL_BATCH = 50_000
+PURCHASES = 200
+PURCHASE_SIZE = 10
+
+
+def batch_fingerprints(batch: np.ndarray):
+    """Vectorized ticket_fingerprint for an (n, 3, 9) batch"""
+    numbers = batch.reshape(len(batch), -1).astype(np.int64)
+    bits = np.zeros((len(batch), FINGERPRINT_BYTES * 8), dtype=np.uint8)
+    rows = np.repeat(np.arange(len(batch)), numbers.shape[1])
+    filled = numbers.ravel() > 0
+    # Bit n-1 of the big-endian 96-bit mask sits at position 95 - (n - 1)
+    bits[rows[filled], FINGERPRINT_BYTES * 8 - numbers.ravel()[filled]] = 1
+    return [row.tobytes() for row in np.packbits(bits, axis=1)]
+
+
+def prefill(engine, count: int) -> None:
+    """Insert `count` fingerprinted tickets into the benchmark session"""
+    now = datetime.now().isoformat()
+    with Session(engine) as session:
+        for start in range(0, count, PREFILL_BATCH):
+            size = min(PREFILL_BATCH, count - start)
+            rows = [
+                {
+                    "ticket_id": uuid4(), "player_id": "BENCH1", "game_session_id": SESSION_ID,
+                    "seed": secrets.randbits(63), "generator_version": 1, "fingerprint": fingerprint,
+                    "created_at": now, "updated_at": now
+                }
+                for fingerprint in batch_fingerprints(generate_batch(size))
+            ]
+            session.execute(insert(PlayerTicket).prefix_with("OR IGNORE"), rows)
+        session.commit()
+
+
+async def issue(async_engine, checked: bool) -> float:
+    """Issue PURCHASES purchases; returns tickets/second"""
+    start = time.perf_counter()
+    async with AsyncSession(async_engine, expire_on_commit=False) as session:
+        for _ in range(PURCHASES):
+            tickets = BingoTicketGenerator.generate_seeded_tickets(PURCHASE_SIZE)
+            tickets = await ensure_unique_tickets(
+                session, SESSION_ID if checked else None, tickets, BingoTicketGenerator.generate_seeded_tickets
+            )
+            for seed, version, _, fingerprint in tickets:
+                session.add(PlayerTicket(
+                    player_id="BENCH2", game_session_id=SESSION_ID if checked else None,
+                    seed=seed, generator_version=version, fingerprint=fingerprint
+                ))
+            await session.commit()
+    return PURCHASES * PURCHASE_SIZE / (time.perf_counter() - start)
+
+
+def run_benchmark(sizes=(10_000, 100_000, 1_000_000)):
+    """Compare issuing throughput with and without the index check"""
+    print("🔍 Duplicate-ticket index benchmark")
+    print("=" * 62)
+    print(f"{'session tickets':>16} {'prefill (s)':>12} {'unchecked t/s':>15} {'checked t/s':>13}")
+
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bench.db")
+            engine = create_engine(f"sqlite:///{path}")
+            SQLModel.metadata.create_all(engine)
+
+            start = time.perf_counter()
+            prefill(engine, size)
+            prefill_time = time.perf_counter() - start
+
+            async_engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+            unchecked = asyncio.run(issue(async_engine, checked=False))
+            checked = asyncio.run(issue(async_engine, checked=True))
+            asyncio.run(async_engine.dispose())
+            engine.dispose()
+
+        print(f"{size:>16,} {prefill_time:>12.1f} {unchecked:>15,.0f} {checked:>13,.0f}")
+
+    print("-" * 62)
+    print(f"{PURCHASES} purchases of {PURCHASE_SIZE} tickets, one commit per purchase")
+
+
+if __name__ == "__main__":
+    run_benchmark(tuple(int(arg) for arg in sys.argv[1:]) or (10_000, 100_000, 1_000_000))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Benchmark ticket generation throughput.
+
+Compares the layout-table generator against the legacy retry-loop generator
+and reports full-strip (6 tickets, 1-90 once) throughput, one strip at a
+time and vectorized (table build included).
+Run from the backend directory:
+
+    python -m benchmarks.bench_generator [count]
+"""
+import sys
+import time
+
+from utils.batch import generate_strip_batch
+from utils.generator import BingoTicketGenerator, STRIP_SIZE
+
+
+def measure(label: str, generate, count: int, unit: str = "tickets") -> float:
+    """Call `generate` `count` times and print calls/second"""
+    start = time.perf_counter()
+    for _ in range(count):
+        generate()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed
+    print(f"{label:<12} {count:>8} {unit:<7} in {elapsed:7.3f}s  ->  {rate:>10,.0f} {unit}/s")
+    return rate
+
+
+def run_benchmark(count: int = 50_000):
+    """Run the generator comparison"""
+    print("🎫 Ticket generator benchmark")
+    print("=" * 60)
+
+    legacy_rate = measure("legacy", BingoTicketGenerator.generate_legacy_ticket, count)
+    layout_rate = measure("layout", BingoTicketGenerator.generate_ticket, count)
+
+    print("-" * 60)
+    print(f"Speedup: {layout_rate / legacy_rate:.2f}x")
+    print()
+
+    # The first strip builds the heights index; keep it out of the timing
+    BingoTicketGenerator.generate_strip()
+    strip_rate = measure("strip", BingoTicketGenerator.generate_strip, count // 5, unit="strips")
+    print(f"Strip tickets/s: {strip_rate * STRIP_SIZE:,.0f}")
+
+    # Cold: the first batch builds its heights table, which is timed here
+    strips = count // 5
+    start = time.perf_counter()
+    generate_strip_batch(strips)
+    elapsed = time.perf_counter() - start
+    print(f"{'strip batch':<12} {strips:>8} {'strips':<7} in {elapsed:7.3f}s  ->  {strips / elapsed:>10,.0f} strips/s")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
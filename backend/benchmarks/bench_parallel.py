@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Benchmark process-pool ticket generation scaling.
+
+Generates the same order with 1, 2, 4, ... workers up to the CPU count and
+reports speedup over a single worker. Run from the backend directory:
+
+    python -m benchmarks.bench_parallel [count]
+"""
+import os
+import sys
+import time
+
+from utils.batch import generate_batch
+from utils.generation_service import TicketGenerationService
+
+
+def run_benchmark(count: int = 1_000_000):
+    """Time generate_array for every worker count"""
+    cpus = os.cpu_count() or 1
+    worker_counts = sorted({2 ** i for i in range(cpus.bit_length()) if 2 ** i <= cpus} | {cpus})
+
+    print(f"⚙️  Parallel generation benchmark: {count:,} tickets, {cpus} CPUs")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    generate_batch(count)
+    serial = time.perf_counter() - start
+    print(f"{'in-process':>12} {serial:8.3f}s  {count / serial:>12,.0f} tickets/s")
+
+    baseline = None
+    for workers in worker_counts:
+        service = TicketGenerationService(max_workers=workers, inline_threshold=0)
+        # Warm the pool so process start-up is not part of the timing
+        service.generate_array(workers * 1_000)
+
+        start = time.perf_counter()
+        service.generate_array(count)
+        elapsed = time.perf_counter() - start
+        service.shutdown()
+
+        baseline = baseline or elapsed
+        print(
+            f"{workers:>4} workers {elapsed:8.3f}s  {count / elapsed:>12,.0f} tickets/s"
+            f"  speedup {baseline / elapsed:4.2f}x  efficiency {baseline / elapsed / workers:4.0%}"
+        )
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark ticket persistence: per-row ORM add + refresh vs one bulk INSERT.
+
+Persists batches of player tickets the way the ticket endpoints used to
+(session.add per ticket, commit, then session.refresh per ticket) and the
+way they do now (client-side ids and timestamps, one executemany INSERT),
+on the async driver against a scratch database with the default storage
+profile. Reports latency per request, per ticket and SQL statements sent.
+Run from the backend directory:
+
+    python -m benchmarks.bench_persistence [tickets per request...]
+"""
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database import apply_storage_profile
+from models.player import Player, PlayerTicket
+from utils.fingerprint import ticket_fingerprint
+from utils.generator import BingoTicketGenerator
+from utils.persistence import insert_rows, player_ticket_rows
+
+DEFAULT_SIZES = (10, 100, 10_000)
+ROWS_PER_SIZE = 20_000  # Requests per size = ROWS_PER_SIZE // size, at least 3
+
+
+async def persist_per_row(session: AsyncSession, tickets) -> list:
+    """The pre-bulk path: one ORM add per ticket, then one SELECT per ticket to read back ids"""
+    created_tickets = []
+    for seed, version, _, fingerprint in tickets:
+        ticket = PlayerTicket(player_id="BENCH1", seed=seed, generator_version=version, fingerprint=fingerprint)
+        session.add(ticket)
+        created_tickets.append(ticket)
+    await session.commit()
+    for ticket in created_tickets:
+        await session.refresh(ticket)
+    return [(ticket.ticket_id, ticket.created_at) for ticket in created_tickets]
+
+
+async def persist_bulk(session: AsyncSession, tickets) -> list:
+    """The current path: rows built client-side, one executemany INSERT"""
+    rows = player_ticket_rows("BENCH1", tickets)
+    await insert_rows(session, PlayerTicket, rows)
+    await session.commit()
+    return [(row["ticket_id"], row["created_at"]) for row in rows]
+
+
+async def measure(engine, persist, size: int) -> tuple:
+    """(ms per request, statements per request)"""
+    requests = max(3, ROWS_PER_SIZE // size)
+    batches = []
+    for _ in range(requests):
+        seeded = BingoTicketGenerator.generate_seeded_tickets(size)
+        batches.append([(seed, version, grid, ticket_fingerprint(grid)) for seed, version, grid in seeded])
+
+    statements = []
+
+    def count(*args):
+        statements.append(1)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+    elapsed = 0.0
+    for tickets in batches:
+        async with AsyncSession(engine, expire_on_commit=False) as session:
+            start = time.perf_counter()
+            created = await persist(session, tickets)
+            elapsed += time.perf_counter() - start
+        assert len(created) == size
+    event.remove(engine.sync_engine, "before_cursor_execute", count)
+    return elapsed / requests * 1000, len(statements) / requests
+
+
+async def run(sizes) -> None:
+    with tempfile.TemporaryDirectory() as scratch:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{os.path.join(scratch, 'persist.db')}")
+        event.listen(engine.sync_engine, "connect", apply_storage_profile)
+        async with engine.begin() as connection:
+            await connection.run_sync(SQLModel.metadata.create_all)
+        async with AsyncSession(engine) as session:
+            session.add(Player(player_id="BENCH1", name="Bench"))
+            await session.commit()
+
+        print("📊 Ticket persistence benchmark (async driver)")
+        print("=" * 72)
+        print(f"{'tickets':>8} {'path':<10} {'ms/request':>11} {'µs/ticket':>10} {'statements':>11} {'speedup':>8}")
+        for size in sizes:
+            per_row_ms, per_row_statements = await measure(engine, persist_per_row, size)
+            bulk_ms, bulk_statements = await measure(engine, persist_bulk, size)
+            print(f"{size:>8} {'per-row':<10} {per_row_ms:>11.1f} {per_row_ms * 1000 / size:>10.0f} "
+                  f"{per_row_statements:>11.0f}")
+            print(f"{size:>8} {'bulk':<10} {bulk_ms:>11.1f} {bulk_ms * 1000 / size:>10.0f} "
+                  f"{bulk_statements:>11.0f} {per_row_ms / bulk_ms:>7.1f}x")
+        await engine.dispose()
+
+
+def run_benchmark(sizes=DEFAULT_SIZES):
+    """Compare both persistence paths at each request size"""
+    asyncio.run(run(sizes))
+
+
+if __name__ == "__main__":
+    run_benchmark(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_SIZES)
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Contention benchmark for the SQLite storage profiles in database.py.
+
+For each BINGO_STORAGE_PROFILE, runs the app in a fresh process on a scratch
+database with many clients polling the session and striking their tickets
+while the host calls numbers back to back. Reports throughput, p99 latency
+per request type and failed requests ("database is locked"), plus the
+latency of back-to-back single-row commits, which isolates the cost of the
+journal and sync settings. Run from the
+backend directory:
+
+    python -m benchmarks.bench_profiles [clients] [driver]
+"""
+import asyncio
+import json
+import logging
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_async import DURATION, play, setup
+
+PROFILES = ("legacy", "wal", "durable")
+SERIAL_COMMITS = 500
+
+
+def commit_latency(engine) -> float:
+    """Average microseconds per single-row UPDATE + commit on one connection"""
+    from sqlalchemy import text
+
+    with engine.connect() as connection:
+        start = time.perf_counter()
+        for _ in range(SERIAL_COMMITS):
+            connection.execute(text("UPDATE playerticket SET strike_mask = strike_mask | 1 WHERE id = 1"))
+            connection.commit()
+        return (time.perf_counter() - start) / SERIAL_COMMITS * 1e6
+
+
+async def host(client, code: str, admin_id: str, deadline: float, latencies: dict, errors: dict):
+    """Call numbers as fast as the server answers, restarting the game when all 90 are out"""
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        response = await client.post(f"/api/sessions/{code}/call-number")
+        if response.status_code == 400:
+            await client.post(f"/api/sessions/{code}/reset", params={"admin_player_id": admin_id})
+            continue
+        if response.status_code >= 500:
+            errors["call"] += 1
+        else:
+            latencies["call"].append(time.perf_counter() - start)
+
+
+async def run_load(clients: int) -> dict:
+    """Mixed poll, strike and call load in this process"""
+    import httpx
+
+    import database
+    database.create_db_and_tables()
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        admin_id, code, tickets = await setup(client, clients)
+        latencies = {"poll": [], "strike": [], "call": []}
+        errors = {"poll": 0, "strike": 0, "call": 0}
+        deadline = time.perf_counter() + DURATION
+        await asyncio.gather(
+            host(client, code, admin_id, deadline, latencies, errors),
+            *(play(client, code, ticket_id, cells, deadline, latencies, errors) for ticket_id, cells in tickets)
+        )
+    await database.async_engine.dispose()
+
+    result = {"commit_us": commit_latency(database.engine)}
+    for kind, samples in latencies.items():
+        samples.sort()
+        result[kind] = {
+            "rps": len(samples) / DURATION,
+            "p99": samples[int(len(samples) * 0.99)] * 1000 if samples else 0.0,
+            "errors": errors[kind]
+        }
+    return result
+
+
+def measure(profile: str, clients: int, driver: str) -> dict:
+    """Run one profile in a child process with a scratch database"""
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    env = dict(os.environ, PYTHONPATH=backend, BINGO_STORAGE_PROFILE=profile, BINGO_DB_DRIVER=driver)
+    with tempfile.TemporaryDirectory() as scratch:
+        output = subprocess.run(
+            [sys.executable, "-m", "benchmarks.bench_profiles", "--child", str(clients)],
+            cwd=scratch, env=env, capture_output=True, text=True, check=True
+        ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def run_benchmark(clients: int = 20, driver: str = "async"):
+    """Compare the storage profiles under the same mixed load"""
+    print(f"📊 Storage profile contention benchmark ({clients} clients + 1 caller, {driver} driver, {DURATION:.0f}s)")
+    print("=" * 104)
+    print(
+        f"{'profile':<8} {'poll/s':>8} {'poll p99':>10} {'strike/s':>9} {'strike p99':>11} "
+        f"{'call/s':>7} {'call p99':>10} {'errors':>7} {'commit µs':>10}"
+    )
+    for profile in PROFILES:
+        stats = measure(profile, clients, driver)
+        poll, strike, call = stats["poll"], stats["strike"], stats["call"]
+        errors = poll["errors"] + strike["errors"] + call["errors"]
+        print(
+            f"{profile:<8} {poll['rps']:>8.0f} {poll['p99']:>8.1f}ms {strike['rps']:>9.0f} {strike['p99']:>9.1f}ms "
+            f"{call['rps']:>7.0f} {call['p99']:>8.1f}ms {errors:>7} {stats['commit_us']:>10.0f}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--child":
+        logging.disable(logging.CRITICAL)
+        print(json.dumps(asyncio.run(run_load(int(sys.argv[2])))))
+    else:
+        run_benchmark(
+            int(sys.argv[1]) if len(sys.argv) > 1 else 20,
+            sys.argv[2] if len(sys.argv) > 2 else "async"
+        )
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Generator benchmark and statistical-quality suite.
+
+For every generator reports throughput, memory per ticket, validity (via the
+vectorized validate_batch) and the legacy fallback rate, then compares the
+output against the exact distribution of uniformly drawn layout-table
+patterns:
+
+- per-column count distribution (how often a column holds 1, 2 or 3 numbers)
+- number frequency uniformity within each column
+- row-pattern entropy (which 5 of 9 columns a row fills)
+
+Deviations are reported as chi-square z-scores (Wilson-Hilferty); z above 4
+flags a biased generator. Strongly negative z means the output is more even
+than chance, which strips produce on purpose since each one deals all 90
+numbers once. Run from the backend directory:
+
+    python -m benchmarks.bench_quality [tickets]
+"""
+import math
+import sys
+import time
+import tracemalloc
+from unittest import mock
+
+import numpy as np
+
+from utils.batch import generate_batch, generate_strip_batch, grids_to_batch, layout_masks, validate_batch
+from utils.generator import LAYOUT_COUNT, STRIP_SIZE, BingoTicketGenerator
+
+Z_LIMIT = 4.0
+MEMORY_SAMPLE = 2_000
+_WEIGHTS = 1 << np.arange(9)
+
+
+def chi_square_z(observed: np.ndarray, expected: np.ndarray) -> float:
+    """z-score of the chi-square statistic over categories with non-zero expectation"""
+    keep = expected > 0
+    chi2 = float((((observed - expected) ** 2)[keep] / expected[keep]).sum())
+    dof = int(keep.sum()) - 1
+    if dof <= 0:
+        return 0.0
+    # Wilson-Hilferty: (chi2/dof)^(1/3) is close to normal
+    return ((chi2 / dof) ** (1 / 3) - (1 - 2 / (9 * dof))) / math.sqrt(2 / (9 * dof))
+
+
+def entropy_bits(probabilities: np.ndarray) -> float:
+    """Shannon entropy of a distribution, in bits"""
+    p = probabilities[probabilities > 0]
+    return float(-(p * np.log2(p)).sum())
+
+
+def reference_distribution():
+    """Exact column-height and row-pattern distributions of uniform layouts"""
+    masks = layout_masks(np.arange(LAYOUT_COUNT))
+    heights = ((masks[:, :, None] >> np.arange(9)) & 1).sum(axis=1)
+    column_heights = np.stack([np.bincount(heights[:, col], minlength=4)[1:] for col in range(9)]) / LAYOUT_COUNT
+    row_patterns = np.bincount(masks.ravel(), minlength=512) / masks.size
+    return column_heights, row_patterns
+
+
+def quality(batch: np.ndarray, column_heights: np.ndarray, row_patterns: np.ndarray) -> dict:
+    """Statistical checks of one generator's output"""
+    n = len(batch)
+    filled = batch > 0
+
+    heights = filled.sum(axis=1)
+    observed_heights = np.stack([np.bincount(heights[:, col], minlength=4)[1:] for col in range(9)])
+    height_z = chi_square_z(observed_heights.ravel(), (column_heights * n).ravel())
+
+    # Within a column every number should be equally likely
+    offsets = (batch.astype(np.int16) - 1) % 10
+    number_z = []
+    for col in range(9):
+        counts = np.bincount(offsets[:, :, col][filled[:, :, col]], minlength=10)
+        number_z.append(chi_square_z(counts, np.full(10, counts.sum() / 10)))
+
+    patterns = (filled * _WEIGHTS).sum(axis=2).ravel()
+    observed_patterns = np.bincount(patterns, minlength=512)
+
+    return {
+        "height_z": height_z,
+        "number_z": max(number_z, key=abs),
+        "entropy": entropy_bits(observed_patterns / observed_patterns.sum()),
+        "pattern_z": chi_square_z(observed_patterns, row_patterns * patterns.size)
+    }
+
+
+def throughput(generate, count: int) -> float:
+    """Tickets per second for generate(count)"""
+    start = time.perf_counter()
+    generate(count)
+    return count / (time.perf_counter() - start)
+
+
+def memory_per_ticket(generate) -> tuple:
+    """(peak traced bytes, allocated blocks kept) per ticket for a small run"""
+    tracemalloc.start()
+    blocks_before = sys.getallocatedblocks()
+    tickets = generate(MEMORY_SAMPLE)
+    blocks = sys.getallocatedblocks() - blocks_before
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del tickets
+    return peak / MEMORY_SAMPLE, blocks / MEMORY_SAMPLE
+
+
+def run_suite(count: int = 200_000):
+    """Benchmark and check every generator"""
+    legacy_fallbacks = 0
+    simple_ticket = BingoTicketGenerator._generate_simple_ticket
+
+    def counting_fallback():
+        nonlocal legacy_fallbacks
+        legacy_fallbacks += 1
+        return simple_ticket()
+
+    def legacy(n):
+        with mock.patch.object(BingoTicketGenerator, "_generate_simple_ticket", counting_fallback):
+            return [BingoTicketGenerator.generate_legacy_ticket() for _ in range(n)]
+
+    generators = [
+        # name, generate(n), sample size, compare against uniform layouts
+        ("legacy", legacy, max(count // 10, 1), True),
+        ("layout", BingoTicketGenerator.generate_tickets, count, True),
+        ("strip", lambda n: BingoTicketGenerator.generate_tickets(n, "strip"), count, False),
+        ("batch", generate_batch, count, True),
+        ("strip-vec", lambda n: generate_strip_batch(-(-n // STRIP_SIZE))[:n], count, False),
+        # What purchases store: tickets rebuilt from their seed's own random stream
+        ("seeded", lambda n: [grid for _, _, grid in BingoTicketGenerator.generate_seeded_tickets(n)], count, True),
+        ("seed-strip", lambda n: [grid for _, _, grid in BingoTicketGenerator.generate_seeded_tickets(n, "strip")], count, False)
+    ]
+
+    print(f"📊 Generator benchmark and quality suite ({count:,} tickets, legacy {count // 10:,})")
+    print("=" * 100)
+    print(
+        f"{'generator':<10} {'tickets/s':>11} {'bytes/t':>8} {'blocks/t':>9} {'valid':>8} {'fallback':>9} "
+        f"{'height z':>9} {'number z':>9} {'entropy':>8} {'pattern z':>10}"
+    )
+
+    column_heights, row_patterns = reference_distribution()
+    reference_entropy = entropy_bits(row_patterns)
+    generate_batch(1)
+    generate_strip_batch(1)
+    BingoTicketGenerator.generate_strip()
+
+    flagged = []
+    for name, generate, size, uniform in generators:
+        rate = throughput(generate, min(size, 20_000))
+        bytes_per_ticket, blocks_per_ticket = memory_per_ticket(generate)
+
+        legacy_fallbacks = 0
+        output = generate(size)
+        batch = output if isinstance(output, np.ndarray) else grids_to_batch(output)
+        # The legacy generator never sorted its columns
+        valid = validate_batch(batch, require_sorted=name != "legacy").mean()
+        fallback = legacy_fallbacks / size if name == "legacy" else 0.0
+
+        stats = quality(batch, column_heights, row_patterns)
+        checked = ("number_z",) + (("height_z", "pattern_z") if uniform else ())
+        if valid < 1 or any(stats[key] > Z_LIMIT for key in checked):
+            flagged.append(name)
+
+        height_z = f"{stats['height_z']:>9.1f}" if uniform else f"{'-':>9}"
+        pattern_z = f"{stats['pattern_z']:>10.1f}" if uniform else f"{'-':>10}"
+        print(
+            f"{name:<10} {rate:>11,.0f} {bytes_per_ticket:>8.0f} {blocks_per_ticket:>9.1f} {valid:>8.2%} {fallback:>9.2%} "
+            f"{height_z} {stats['number_z']:>9.1f} {stats['entropy']:>8.3f} {pattern_z}"
+        )
+
+    print("-" * 100)
+    print(f"Reference row-pattern entropy: {reference_entropy:.3f} bits (uniform layouts); z > {Z_LIMIT:g} flags bias")
+    print("Strips are not uniform layouts by design; only validity and number frequency apply")
+    if flagged:
+        print(f"❌ Flagged: {', '.join(flagged)}")
+    else:
+        print("✅ All generators valid and unbiased")
+
+
+if __name__ == "__main__":
+    run_suite(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Benchmark finding idle sessions: filtering updated_at vs the activity index.
+
+Fills a scratch file database with game sessions (a third finished, and
+a few idle past the TTL, as between reaper runs) and times the reaper's query both ways: a filter on
+is_active and the unindexed ISO-string updated_at, which scans the whole
+table, and the range scan of the (is_active, last_activity_at) index the
+reaper uses. Run from the backend directory:
+
+    python -m benchmarks.bench_reaper [sessions...]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from models.player import GameSession, Player
+
+DEFAULT_SIZES = (10_000, 100_000, 500_000)
+IDLE_SESSIONS = 10
+IDLE_HOURS = 6
+SCANS = 50
+CHUNK = 500
+
+
+def scan_updated_at(session: Session, cutoff: str) -> list:
+    """The filter without an index: every session row is read"""
+    return session.exec(
+        select(GameSession.id)
+        .where(GameSession.is_active == True, GameSession.updated_at < cutoff)
+        .limit(CHUNK)
+    ).all()
+
+
+def scan_last_activity(session: Session, cutoff: str) -> list:
+    """The reaper's query: a range of the activity index"""
+    return session.exec(
+        select(GameSession.id)
+        .where(GameSession.is_active == True, GameSession.last_activity_at < cutoff)
+        .order_by(GameSession.last_activity_at)
+        .limit(CHUNK)
+    ).all()
+
+
+def build(engine, sessions: int) -> None:
+    now = datetime.now()
+    idle_every = sessions // IDLE_SESSIONS
+    rows = []
+    for index in range(sessions):
+        idle = index % idle_every == 0
+        stamp = (now - timedelta(hours=IDLE_HOURS * 2 if idle else index % IDLE_HOURS)).isoformat()
+        rows.append({
+            "session_code": f"S{index}",
+            "admin_player_id": "BENCH1",
+            "is_active": idle or index % 3 != 0,
+            "updated_at": stamp,
+            "last_activity_at": stamp
+        })
+    with Session(engine) as session:
+        session.execute(insert(Player), [{"player_id": "BENCH1", "name": "Bench", "is_admin": True}])
+        session.execute(insert(GameSession), rows)
+        session.commit()
+
+
+def time_scan(engine, scan, cutoff: str) -> tuple:
+    with Session(engine) as session:
+        found = len(scan(session, cutoff))
+        start = time.perf_counter()
+        for _ in range(SCANS):
+            scan(session, cutoff)
+        return (time.perf_counter() - start) / SCANS * 1000, found
+
+
+def run_benchmark(sizes=DEFAULT_SIZES):
+    print(f"📊 Idle-session scan benchmark ({IDLE_SESSIONS} idle sessions, up to {CHUNK} per scan)")
+    print("=" * 72)
+    print(f"{'sessions':>9} {'updated_at filter ms':>21} {'activity index ms':>18} {'speedup':>8} {'found':>6}")
+
+    cutoff = (datetime.now() - timedelta(hours=IDLE_HOURS)).isoformat()
+    for sessions in sizes:
+        with tempfile.TemporaryDirectory() as scratch:
+            engine = create_engine(f"sqlite:///{os.path.join(scratch, 'bench.db')}")
+            SQLModel.metadata.create_all(engine)
+            build(engine, sessions)
+
+            unindexed_ms, found = time_scan(engine, scan_updated_at, cutoff)
+            indexed_ms, indexed_found = time_scan(engine, scan_last_activity, cutoff)
+            assert found == indexed_found
+            print(f"{sessions:>9} {unindexed_ms:>21.2f} {indexed_ms:>18.3f} {unindexed_ms / indexed_ms:>7.0f}x {found:>6}")
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    run_benchmark([int(arg) for arg in sys.argv[1:]] or DEFAULT_SIZES)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark retention of the legacy Ticket table: no retention, row deletes,
+and day partitions.
+
+Replays a number of days of /api/tickets/generate traffic into three
+scratch databases and expires data each day: never (one ever-growing
+table), with DELETE ... WHERE created_at < cutoff on one table indexed on
+created_at, and by dropping expired day partitions (what the retention
+worker does). Reports file size over time, free pages and the cost of each
+day's expiry. Run from the backend directory:
+
+    python -m benchmarks.bench_retention [days] [tickets per day] [retention days]
+"""
+import logging
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+
+from sqlalchemy import Index, create_engine, event, insert, text
+
+CHECKPOINTS = 4
+
+
+def file_size(engine) -> tuple:
+    """(file bytes, free bytes) after folding the WAL into the database file"""
+    with engine.connect() as connection:
+        connection.exec_driver_sql("PRAGMA wal_checkpoint(TRUNCATE)")
+        page_size = connection.exec_driver_sql("PRAGMA page_size").scalar()
+        free = connection.exec_driver_sql("PRAGMA freelist_count").scalar() * page_size
+    return os.path.getsize(engine.url.database), free
+
+
+def day_rows(day: date, per_day: int, offset: int) -> list:
+    created_at = datetime.combine(day, datetime.min.time()).isoformat()
+    return [
+        {"id": uuid4(), "seed": offset + index, "generator_version": 1, "created_at": created_at}
+        for index in range(per_day)
+    ]
+
+
+def scratch_engine(path: str):
+    """An engine with the app's storage profile"""
+    import database
+    engine = create_engine(f"sqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def apply_profile(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in database.profile.pragmas():
+            cursor.execute(pragma)
+        cursor.close()
+
+    return engine
+
+
+def run(days: int, per_day: int, retention: int) -> None:
+    import database
+    from models.ticket import Ticket
+    from utils.retention import DayPartitions, RetentionWorker
+
+    database.create_db_and_tables()
+    single = scratch_engine("single.db")
+    row_delete = scratch_engine("row_delete.db")
+    Ticket.__table__.create(single)
+    Ticket.__table__.create(row_delete)
+    created_at_index = Index("ix_ticket_created_at", Ticket.__table__.c.created_at)
+    created_at_index.create(row_delete)
+    Ticket.__table__.indexes.discard(created_at_index)
+
+    partitions = DayPartitions(Ticket.__table__, "created_at", retention)
+    worker = RetentionWorker(partitions=(partitions,))
+
+    expiry_ms = {"row delete": [], "partitions": []}
+    start_day = date.today() - timedelta(days=days)
+    print(f"{'day':>4} {'no retention MB':>16} {'row delete MB':>14} {'partitions MB':>14} {'(free MB)':>10}")
+    for index in range(days):
+        day = start_day + timedelta(days=index)
+        rows = day_rows(day, per_day, index * per_day)
+
+        with single.begin() as connection:
+            connection.execute(insert(Ticket.__table__), rows)
+
+        with row_delete.begin() as connection:
+            connection.execute(insert(Ticket.__table__), rows)
+        cutoff = datetime.combine(day - timedelta(days=retention), datetime.min.time()).isoformat()
+        start = time.perf_counter()
+        with row_delete.begin() as connection:
+            connection.execute(text("DELETE FROM ticket WHERE created_at < :cutoff"), {"cutoff": cutoff})
+        expiry_ms["row delete"].append((time.perf_counter() - start) * 1000)
+
+        with database.engine.begin() as connection:
+            connection.execute(insert(partitions.ensure(day)), rows)
+        start = time.perf_counter()
+        worker.run_once(today=day)
+        expiry_ms["partitions"].append((time.perf_counter() - start) * 1000)
+
+        if (index + 1) % max(1, days // CHECKPOINTS) == 0 or index + 1 == days:
+            sizes = [file_size(engine) for engine in (single, row_delete, database.engine)]
+            print(
+                f"{index + 1:>4} {sizes[0][0] / 1e6:>16.1f} {sizes[1][0] / 1e6:>14.1f} "
+                f"{sizes[2][0] / 1e6:>14.1f} {sizes[2][1] / 1e6:>10.1f}"
+            )
+
+    print(f"\nDaily expiry once retention is reached ({retention} days kept):")
+    for name, timings in expiry_ms.items():
+        steady = timings[retention + 1:] or timings
+        print(f"  {name:<11} median {sorted(steady)[len(steady) // 2]:8.1f} ms   max {max(steady):8.1f} ms")
+    for engine in (single, row_delete, database.engine):
+        engine.dispose()
+
+
+def run_benchmark(days: int = 60, per_day: int = 20_000, retention: int = 14):
+    """Run against scratch databases in a temporary working directory"""
+    print(f"📊 Ticket retention benchmark ({days} days x {per_day:,} tickets, {retention} days kept)")
+    print("=" * 72)
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            run(days, per_day, retention)
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    run_benchmark(*[int(arg) for arg in sys.argv[1:4]])
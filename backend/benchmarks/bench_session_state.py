@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark session-state polls: counting tickets vs the session counters.
+
+Builds one session per size on a scratch file database (tickets spread over
+players four at a time) and times the database work of a poll both ways:
+the old handler, which loaded every ticket of the session twice to count
+tickets and players, and the current one, which reads tickets_count and
+players_count from the session row. Run from the backend directory:
+
+    python -m benchmarks.bench_session_state [tickets...]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import event, insert
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from models.player import GameSession, Player, PlayerTicket, SessionPlayer
+from utils.draw import called_numbers, remaining_numbers, reset_draw
+from utils.generator import BingoTicketGenerator
+
+DEFAULT_SIZES = (100, 1_000, 10_000)
+TICKETS_PER_PLAYER = 4
+POLLS = 200
+
+
+def poll_counting(session: Session, code: str) -> tuple:
+    """The pre-counter poll: two full ticket loads for the counts"""
+    game_session = session.exec(select(GameSession).where(GameSession.session_code == code)).first()
+    tickets_count = len(session.exec(
+        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
+    ).all())
+    tickets = session.exec(select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)).all()
+    players_count = len({ticket.player_id for ticket in tickets})
+    return called_numbers(game_session), remaining_numbers(game_session), tickets_count, players_count
+
+
+def poll_counters(session: Session, code: str) -> tuple:
+    """The current poll: one session row"""
+    game_session = session.exec(select(GameSession).where(GameSession.session_code == code)).first()
+    return (
+        called_numbers(game_session), remaining_numbers(game_session),
+        game_session.tickets_count, game_session.players_count
+    )
+
+
+def build_session(engine, code: str, tickets: int) -> None:
+    """A session with `tickets` seed-addressed tickets and matching memberships and counters"""
+    players = -(-tickets // TICKETS_PER_PLAYER)
+    with Session(engine) as session:
+        game_session = GameSession(session_code=code, admin_player_id="BENCH1")
+        reset_draw(game_session)
+        session.add(game_session)
+        session.commit()
+        session.refresh(game_session)
+
+        player_ids = [f"{code}-{index}" for index in range(players)]
+        session.execute(insert(Player), [{"player_id": player_id, "name": player_id} for player_id in player_ids])
+        session.execute(insert(PlayerTicket), [
+            {
+                "player_id": player_ids[index // TICKETS_PER_PLAYER],
+                "game_session_id": game_session.id,
+                "seed": seed,
+                "generator_version": version
+            }
+            for index, (seed, version, _) in enumerate(BingoTicketGenerator.generate_seeded_tickets(tickets))
+        ])
+        session.execute(insert(SessionPlayer), [
+            {
+                "game_session_id": game_session.id,
+                "player_id": player_id,
+                "tickets_count": min(TICKETS_PER_PLAYER, tickets - index * TICKETS_PER_PLAYER)
+            }
+            for index, player_id in enumerate(player_ids)
+        ])
+        game_session.tickets_count = tickets
+        game_session.players_count = players
+        session.add(game_session)
+        session.commit()
+
+
+def measure(engine, poll, code: str) -> tuple:
+    """(µs per poll, objects loaded by one poll)"""
+    with Session(engine) as session:
+        expected = poll(session, code)
+        start = time.perf_counter()
+        for _ in range(POLLS):
+            session.expunge_all()
+            assert poll(session, code)[2:] == expected[2:]
+        elapsed = time.perf_counter() - start
+
+        loaded = []
+
+        def count_loaded(session, instance):
+            loaded.append(instance)
+
+        session.expunge_all()
+        event.listen(session, "loaded_as_persistent", count_loaded)
+        poll(session, code)
+        event.remove(session, "loaded_as_persistent", count_loaded)
+    return elapsed / POLLS * 1e6, len(loaded)
+
+
+def run_benchmark(sizes=DEFAULT_SIZES):
+    """Compare both poll strategies for each session size"""
+    with tempfile.TemporaryDirectory() as scratch:
+        engine = create_engine(f"sqlite:///{os.path.join(scratch, 'state.db')}")
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Player(player_id="BENCH1", name="Bench"))
+            session.commit()
+
+        print(f"📊 Session state poll benchmark ({POLLS} polls per session)")
+        print("=" * 70)
+        print(f"{'tickets':>8} {'strategy':<10} {'µs/poll':>10} {'objects loaded':>15} {'speedup':>8}")
+        for tickets in sizes:
+            code = f"S{tickets}"
+            build_session(engine, code, tickets)
+            counting_latency, counting_rows = measure(engine, poll_counting, code)
+            counter_latency, counter_rows = measure(engine, poll_counters, code)
+            print(f"{tickets:>8} {'counting':<10} {counting_latency:>10.0f} {counting_rows:>15}")
+            print(f"{tickets:>8} {'counters':<10} {counter_latency:>10.0f} {counter_rows:>15} "
+                  f"{counting_latency / counter_latency:>7.0f}x")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run_benchmark(tuple(int(arg) for arg in sys.argv[1:]) or DEFAULT_SIZES)
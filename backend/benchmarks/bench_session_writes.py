@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Benchmark session join and reset: per-ticket ORM updates vs set-based UPDATEs.
+
+Fills two identical sessions on a scratch database (players joining with
+their tickets, then a reset of the whole room) and runs the old per-ticket
+handlers against one and the current handlers against the other. Reports
+request latency and how long each request held the SQLite write lock, from
+its first write statement until its commit returned; every other writer
+waits out that window. Run from the backend directory:
+
+    python -m benchmarks.bench_session_writes [tickets] [tickets per player]
+"""
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import Session as OrmSession
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import GameSession, Player, PlayerTicket
+from utils.fingerprint import ensure_unique_tickets, ticket_fingerprint
+from utils.generator import BingoTicketGenerator, resolve_grid
+from utils.membership import add_session_tickets
+
+WRITE_PREFIXES = ("INSERT", "UPDATE", "DELETE")
+
+
+class LockTimer:
+    """Times from the first write statement of a transaction to the end of its commit"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.started = None
+        self.holds = []
+
+    def before_execute(self, conn, cursor, statement, parameters, context, executemany):
+        if self.started is None and statement.lstrip().upper().startswith(WRITE_PREFIXES):
+            self.started = time.perf_counter()
+
+    def after_commit(self, session):
+        if self.started is not None:
+            self.holds.append(time.perf_counter() - self.started)
+            self.started = None
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self.before_execute)
+        event.listen(OrmSession, "after_commit", self.after_commit)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self.before_execute)
+        event.remove(OrmSession, "after_commit", self.after_commit)
+
+
+async def join_per_ticket(session_code: str, player_id: str, session: AsyncSession) -> int:
+    """The pre-set-based join: every ticket modified and flushed on its own"""
+    game_session = (await session.exec(select(GameSession).where(GameSession.session_code == session_code))).first()
+    player_tickets = (await session.exec(
+        select(PlayerTicket).where(PlayerTicket.player_id == player_id, PlayerTicket.game_session_id == None)
+    )).all()
+    unique_tickets = await ensure_unique_tickets(
+        session,
+        game_session.id,
+        [(ticket.seed, ticket.generator_version, resolve_grid(ticket)) for ticket in player_tickets],
+        BingoTicketGenerator.generate_seeded_tickets
+    )
+    tickets_added = 0
+    for ticket, (seed, version, grid, fingerprint) in zip(player_tickets, unique_tickets):
+        if seed != ticket.seed:
+            ticket.seed = seed
+            ticket.generator_version = version
+            ticket.grid = None
+            ticket.strike_mask = 0
+            ticket.strikes = None
+        ticket.fingerprint = fingerprint
+        ticket.game_session_id = game_session.id
+        ticket.updated_at = datetime.now().isoformat()
+        session.add(ticket)
+        tickets_added += 1
+    await add_session_tickets(session, game_session.id, player_id, tickets_added)
+    await session.commit()
+    return tickets_added
+
+
+async def reset_per_ticket(session_code: str, admin_player_id: str, session: AsyncSession) -> int:
+    """The pre-set-based reset: load every ticket in the session and clear it"""
+    game_session = (await session.exec(select(GameSession).where(GameSession.session_code == session_code))).first()
+    session_tickets = (await session.exec(
+        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id)
+    )).all()
+    for ticket in session_tickets:
+        ticket.strike_mask = 0
+        ticket.strikes = None
+        ticket.updated_at = datetime.now().isoformat()
+        session.add(ticket)
+    game_session.updated_at = datetime.now().isoformat()
+    session.add(game_session)
+    await session.commit()
+    return len(session_tickets)
+
+
+async def join_set_based(session_code: str, player_id: str, session: AsyncSession) -> int:
+    from app.api.sessions import join_session
+    return (await join_session(session_code, player_id, session)).data["tickets_added"]
+
+
+async def reset_set_based(session_code: str, admin_player_id: str, session: AsyncSession) -> int:
+    from app.api.sessions import reset_session
+    return (await reset_session(session_code, admin_player_id, session)).data["tickets_reset"]
+
+
+def build(engine, code: str, tickets: int, per_player: int) -> list:
+    """A session plus players holding `tickets` unassigned tickets, all struck; returns the player ids"""
+    player_ids = [f"{code}-{index}" for index in range(-(-tickets // per_player))]
+    with Session(engine) as session:
+        session.add(GameSession(session_code=code, admin_player_id="ADMIN1", draw_order=bytes(range(1, 91))))
+        session.execute(insert(Player), [{"player_id": player_id, "name": player_id} for player_id in player_ids])
+        session.execute(insert(PlayerTicket), [
+            {
+                "player_id": player_ids[index // per_player],
+                "seed": seed,
+                "generator_version": version,
+                "fingerprint": ticket_fingerprint(grid),
+                "strike_mask": (1 << 27) - 1
+            }
+            for index, (seed, version, grid) in enumerate(BingoTicketGenerator.generate_seeded_tickets(tickets))
+        ])
+        session.commit()
+    return player_ids
+
+
+async def run(tickets: int, per_player: int) -> None:
+    import database
+    database.create_db_and_tables()
+    engine = database.async_engine.sync_engine if database.DB_DRIVER != "sync" else database.engine
+
+    print(f"📊 Session join/reset benchmark ({tickets} tickets, {per_player} per player, "
+          f"{database.DB_DRIVER} driver, {database.STORAGE_PROFILE} profile)")
+    print("=" * 86)
+    print(f"{'operation':<18} {'requests':>9} {'ms/request':>11} {'lock p50 ms':>12} {'lock max ms':>12} {'lock total ms':>14}")
+
+    for name, join, reset in (
+        ("per-ticket", join_per_ticket, reset_per_ticket),
+        ("set-based", join_set_based, reset_set_based)
+    ):
+        code = name[:4].upper()
+        player_ids = build(database.engine, code, tickets, per_player)
+        for operation, calls in (
+            ("join", [(join, code, player_id) for player_id in player_ids]),
+            ("reset", [(reset, code, "ADMIN1")])
+        ):
+            elapsed = 0.0
+            with LockTimer(engine) as timer:
+                for handler, session_code, player_id in calls:
+                    async for session in database.get_session():
+                        start = time.perf_counter()
+                        await handler(session_code, player_id, session)
+                        elapsed += time.perf_counter() - start
+            label = f"{operation} {name}"
+            holds = timer.holds
+            print(f"{label:<18} {len(calls):>9} {elapsed / len(calls) * 1000:>11.1f} "
+                  f"{statistics.median(holds) * 1000:>12.1f} {max(holds) * 1000:>12.1f} {sum(holds) * 1000:>14.1f}")
+    await database.async_engine.dispose()
+
+
+def run_benchmark(tickets: int = 20_000, per_player: int = 100):
+    """Run against a scratch database in a temporary working directory"""
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            asyncio.run(run(tickets, per_player))
+        finally:
+            os.chdir(cwd)
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    run_benchmark(*[int(arg) for arg in sys.argv[1:3]])
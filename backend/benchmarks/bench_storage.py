@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Benchmark seed-addressed ticket storage against stored JSON grids.
+
+Fills two scratch SQLite databases with the same number of PlayerTicket rows,
+one storing grids and one storing (seed, generator version), then compares
+file size and random read latency (cold and hot rebuild cache). Run from the
+backend directory:
+
+    python -m benchmarks.bench_storage [count]
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from models.player import PlayerTicket
+from utils.batch import batch_to_grids, generate_batch
+from utils.generator import BingoTicketGenerator, _grid_for_seed, resolve_grid
+
+INSERT_BATCH = 50_000
+READS = 20_000
+
+
+def fill(engine, count: int, seeded: bool) -> float:
+    """Insert `count` tickets; returns average payload bytes per ticket"""
+    payload = 0
+    now = datetime.now().isoformat()
+    with Session(engine) as session:
+        for start in range(0, count, INSERT_BATCH):
+            size = min(INSERT_BATCH, count - start)
+            if seeded:
+                tickets = BingoTicketGenerator.generate_seeded_tickets(size)
+                rows = [{"seed": seed, "generator_version": version} for seed, version, _ in tickets]
+                payload += size * 9  # 8-byte seed + 1-byte version
+            else:
+                grids = batch_to_grids(generate_batch(size))
+                rows = [{"grid": grid} for grid in grids]
+                payload += sum(len(json.dumps(grid)) for grid in grids)
+            for row in rows:
+                row.update(ticket_id=uuid4(), player_id="BENCH1", created_at=now, updated_at=now)
+            session.execute(insert(PlayerTicket), rows)
+        session.commit()
+    return payload / count
+
+
+def read_latency(engine, ids) -> float:
+    """Average microseconds to fetch a ticket by primary key and get its grid"""
+    with Session(engine) as session:
+        start = time.perf_counter()
+        for ticket_id in ids:
+            ticket = session.exec(select(PlayerTicket).where(PlayerTicket.id == ticket_id)).one()
+            resolve_grid(ticket)
+        elapsed = time.perf_counter() - start
+        session.expunge_all()
+    return elapsed / len(ids) * 1e6
+
+
+def run_benchmark(count: int = 1_000_000):
+    """Compare both storage layouts at `count` tickets"""
+    print(f"💾 Ticket storage benchmark: {count:,} tickets")
+    print("=" * 72)
+    print(f"{'layout':<8} {'db size':>12} {'bytes/row':>10} {'payload':>9} {'fill (s)':>9} {'read cold':>10} {'read hot':>9}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, seeded in (("grid", False), ("seed", True)):
+            path = os.path.join(directory, f"{label}.db")
+            engine = create_engine(f"sqlite:///{path}")
+            SQLModel.metadata.create_all(engine)
+
+            start = time.perf_counter()
+            payload = fill(engine, count, seeded)
+            fill_time = time.perf_counter() - start
+
+            ids = [random.randint(1, count) for _ in range(READS)]
+            _grid_for_seed.cache_clear()
+            cold = read_latency(engine, ids)
+            hot = read_latency(engine, ids)
+            engine.dispose()
+
+            size = os.path.getsize(path)
+            print(
+                f"{label:<8} {size / 1e6:>10.1f}MB {size / count:>10.0f} {payload:>8.0f}B "
+                f"{fill_time:>9.1f} {cold:>8.0f}us {hot:>7.0f}us"
+            )
+
+    print("-" * 72)
+    print("payload: bytes per ticket spent on the ticket itself (JSON grid vs seed + version)")
+    print("read hot: second pass over the same ids (page cache warm; rebuild cache warm when seeded)")
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Benchmark pushing session state over Server-Sent Events vs polling it.
+
+Starts the app under uvicorn in a subprocess (scratch database), opens
+N streams to `/api/sessions/{code}/stream` from raw asyncio sockets and
+reads the server's CPU time from /proc while they sit idle (heartbeats
+only) and while numbers are called, checking every stream receives every
+call. Then the same N clients poll `GET /api/sessions/{code}` every 2
+seconds, as the frontend did, for comparison. Linux only. Run from the
+backend directory:
+
+    python -m benchmarks.bench_stream [clients]
+"""
+import asyncio
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+
+DEFAULT_CLIENTS = 2000
+PHASE_SECONDS = 20
+CALLS = 20
+CALL_SPACING_SECONDS = 0.5
+POLL_INTERVAL_SECONDS = 2
+CONNECT_BATCH = 200
+
+CLOCK_TICKS = os.sysconf("SC_CLK_TCK")
+
+
+def cpu_seconds(pid: int) -> float:
+    """User + system CPU time of a process"""
+    with open(f"/proc/{pid}/stat") as stat:
+        fields = stat.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / CLOCK_TICKS
+
+
+def rss_mb(pid: int) -> float:
+    with open(f"/proc/{pid}/status") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class StreamClient:
+    """One raw SSE connection counting the `call` events it receives"""
+
+    def __init__(self):
+        self.calls = 0
+        self.heartbeats = 0
+        self.writer = None
+
+    async def connect(self, port: int, path: str) -> None:
+        reader, self.writer = await asyncio.open_connection("127.0.0.1", port)
+        self.writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\nAccept: text/event-stream\r\n\r\n".encode())
+        await self.writer.drain()
+        status = await reader.readline()
+        assert b" 200 " in status, status
+        self.task = asyncio.create_task(self.read(reader))
+
+    async def read(self, reader) -> None:
+        # Chunk size lines are separate lines, so frames' lines arrive intact
+        while line := await reader.readline():
+            if line == b"event: call\n":
+                self.calls += 1
+            elif line.startswith(b": heartbeat"):
+                self.heartbeats += 1
+
+    def close(self) -> None:
+        self.task.cancel()
+        self.writer.close()
+
+
+async def poll(port: int, path: str, interval: float, until: float, counts: list) -> None:
+    """One client polling over a keep-alive connection"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    request = f"GET {path} HTTP/1.1\r\nHost: bench\r\n\r\n".encode()
+    await asyncio.sleep(random.uniform(0, interval))  # Spread the clients out
+    try:
+        while time.monotonic() < until:
+            writer.write(request)
+            headers = await reader.readuntil(b"\r\n\r\n")
+            length = int(headers.lower().split(b"content-length:")[1].split(b"\r\n")[0])
+            await reader.readexactly(length)
+            counts[0] += 1
+            await asyncio.sleep(interval)
+    finally:
+        writer.close()
+
+
+async def measure(pid: int, seconds: float) -> float:
+    """Server CPU % over a window"""
+    start_cpu, start = cpu_seconds(pid), time.monotonic()
+    await asyncio.sleep(seconds)
+    return (cpu_seconds(pid) - start_cpu) / (time.monotonic() - start) * 100
+
+
+async def run_clients(pid: int, port: int, clients: int) -> None:
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", timeout=30) as http:
+        admin = (await http.post("/api/players/create", json={"name": "Bench", "is_admin": True})).json()
+        code = (await http.post("/api/sessions/create", json={"admin_player_id": admin["player_id"]})).json()["session_code"]
+        await asyncio.sleep(3)  # Let the startup cleanup and reservoir refill finish
+        baseline = await measure(pid, 5)
+        rss_before = rss_mb(pid)
+
+        # Streams
+        streams = [StreamClient() for _ in range(clients)]
+        start = time.perf_counter()
+        for batch in range(0, clients, CONNECT_BATCH):
+            await asyncio.gather(*[
+                stream.connect(port, f"/api/sessions/{code}/stream")
+                for stream in streams[batch:batch + CONNECT_BATCH]
+            ])
+        connect_s = time.perf_counter() - start
+        stats = (await http.get("/api/admin/streams/stats")).json()
+        assert stats["connections"] == clients, stats
+        await asyncio.sleep(1)
+        rss_streams = rss_mb(pid)
+
+        idle = await measure(pid, PHASE_SECONDS)
+        heartbeats = min(stream.heartbeats for stream in streams)
+
+        fanout_ms = []
+        start_cpu, start = cpu_seconds(pid), time.monotonic()
+        for call in range(1, CALLS + 1):
+            sent = time.perf_counter()
+            response = await http.post(f"/api/sessions/{code}/call-number")
+            assert response.status_code == 200, response.text
+            while sum(stream.calls >= call for stream in streams) < clients:
+                if time.perf_counter() - sent > 30:
+                    raise RuntimeError(f"call {call} not delivered to every stream")
+                await asyncio.sleep(0.002)
+            fanout_ms.append((time.perf_counter() - sent) * 1000)
+            await asyncio.sleep(CALL_SPACING_SECONDS)
+        calling = (cpu_seconds(pid) - start_cpu) / (time.monotonic() - start) * 100
+        delivered = sum(stream.calls for stream in streams)
+
+        for stream in streams:
+            stream.close()
+        await asyncio.sleep(2)
+
+        # Polling, as before the stream
+        counts = [0]
+        until = time.monotonic() + PHASE_SECONDS
+        pollers = [
+            asyncio.create_task(poll(port, f"/api/sessions/{code}", POLL_INTERVAL_SECONDS, until, counts))
+            for _ in range(clients)
+        ]
+        polling = await measure(pid, PHASE_SECONDS)
+        await asyncio.gather(*pollers, return_exceptions=True)
+
+    print(f"Server CPU at rest:                 {baseline:6.1f}%")
+    print(f"{clients} streams opened in {connect_s:.1f}s, server RSS {rss_before:.0f} → {rss_streams:.0f} MB "
+          f"({(rss_streams - rss_before) * 1024 / clients:.1f} KB per stream)")
+    print(f"Server CPU, {clients} idle streams:      {idle:6.1f}%  (≥{heartbeats} heartbeats each)")
+    print(f"Server CPU, {clients} streams + calls:   {calling:6.1f}%  "
+          f"({delivered}/{clients * CALLS} call events delivered)")
+    print(f"Fan-out to all streams: median {statistics.median(fanout_ms):.0f} ms, max {max(fanout_ms):.0f} ms")
+    print(f"Server CPU, {clients} clients polling:   {polling:6.1f}%  "
+          f"({counts[0] / PHASE_SECONDS:.0f} req/s served of {clients / POLL_INTERVAL_SECONDS:.0f} offered)")
+
+
+def run_benchmark(clients: int = DEFAULT_CLIENTS):
+    print(f"📊 Session stream vs polling benchmark ({clients} clients, {PHASE_SECONDS}s per phase)")
+    print("=" * 72)
+
+    port = free_port()
+    backend = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    with tempfile.TemporaryDirectory() as scratch:
+        server = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port),
+             "--log-level", "warning", "--timeout-graceful-shutdown", "1", "--backlog", "4096"],
+            cwd=scratch,
+            env={**os.environ, "PYTHONPATH": backend},
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        try:
+            for _ in range(100):
+                try:
+                    httpx.get(f"http://127.0.0.1:{port}/")
+                    break
+                except httpx.TransportError:
+                    time.sleep(0.1)
+            asyncio.run(run_clients(server.pid, port, clients))
+        finally:
+            server.terminate()
+            server.wait(30)
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_CLIENTS)
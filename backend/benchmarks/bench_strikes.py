@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Benchmark strike updates: JSON read-modify-write vs the atomic bitmask UPDATE.
+
+Measures single-tap latency for both, then has several threads strike
+different cells of the same ticket at once and counts strikes that are
+missing afterwards (lost updates) and taps that failed with a lock error.
+The JSON variant is the pre-bitmask handler: load the row, mutate the dict
+in place, commit. SQLAlchemy does not track in-place changes to a JSON
+column, so that handler only ever saved a ticket's first strike; the lost
+count includes those as well as race losses. Run from the backend directory:
+
+    python -m benchmarks.bench_strikes [taps]
+"""
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+from sqlalchemy.exc import OperationalError
+from sqlmodel import SQLModel, Session, create_engine, select
+
+from models.player import Player, PlayerTicket
+from utils.generator import BingoTicketGenerator
+from utils.strikes import resolve_strikes, strike_statement
+
+THREADS = 8
+ROUNDS = 20
+
+
+def strike_json(session: Session, ticket_id: int, row: int, col: int) -> None:
+    """The old handler: read the ticket, change the dict, write it back"""
+    ticket = session.exec(select(PlayerTicket).where(PlayerTicket.id == ticket_id)).one()
+    if not ticket.strikes:
+        ticket.strikes = {}
+    ticket.strikes[f"{row}-{col}"] = True
+    ticket.updated_at = datetime.now().isoformat()
+    session.add(ticket)
+    session.commit()
+
+
+def strike_mask(session: Session, ticket_id: int, row: int, col: int) -> None:
+    """The bitmask handler: one UPDATE"""
+    ticket = session.exec(select(PlayerTicket).where(PlayerTicket.id == ticket_id)).one()
+    session.execute(strike_statement(ticket, row, col, True), execution_options={"synchronize_session": False})
+    session.commit()
+
+
+def new_ticket(engine, legacy: bool) -> int:
+    """Insert an unstruck ticket and return its id"""
+    seed, version, _ = BingoTicketGenerator.generate_seeded_tickets(1)[0]
+    with Session(engine) as session:
+        ticket = PlayerTicket(player_id="BENCH1", seed=seed, generator_version=version, strikes={} if legacy else None)
+        session.add(ticket)
+        session.commit()
+        return ticket.id
+
+
+def struck_count(engine, ticket_id: int) -> int:
+    with Session(engine) as session:
+        return len(resolve_strikes(session.get(PlayerTicket, ticket_id)))
+
+
+def latency(engine, strike, legacy: bool, taps: int) -> list:
+    """Per-tap latency in microseconds for sequential taps"""
+    samples = []
+    ticket_id = None
+    with Session(engine) as session:
+        for tap in range(taps):
+            if tap % 27 == 0:
+                ticket_id = new_ticket(engine, legacy)
+            cell = tap % 27
+            start = time.perf_counter()
+            strike(session, ticket_id, cell // 9, cell % 9)
+            samples.append((time.perf_counter() - start) * 1e6)
+    return samples
+
+
+def race(engine, strike, legacy: bool) -> tuple:
+    """(lost strikes, lock errors) when THREADS threads each strike one cell at once"""
+    lost = errors = 0
+    for _ in range(ROUNDS):
+        ticket_id = new_ticket(engine, legacy)
+        barrier = threading.Barrier(THREADS)
+        failed = []
+
+        def tap(cell):
+            with Session(engine) as session:
+                barrier.wait()
+                try:
+                    strike(session, ticket_id, cell // 9, cell % 9)
+                except OperationalError:
+                    failed.append(cell)
+
+        threads = [threading.Thread(target=tap, args=(cell,)) for cell in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        errors += len(failed)
+        lost += THREADS - len(failed) - struck_count(engine, ticket_id)
+    return lost, errors
+
+
+def run_benchmark(taps: int = 2_000):
+    """Compare both strike paths on a scratch database"""
+    with tempfile.TemporaryDirectory() as scratch:
+        engine = create_engine(f"sqlite:///{os.path.join(scratch, 'strikes.db')}", connect_args={"check_same_thread": False})
+        SQLModel.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Player(player_id="BENCH1", name="Bench"))
+            session.commit()
+
+        print(f"📊 Strike update benchmark ({taps:,} sequential taps, {ROUNDS} races of {THREADS} threads)")
+        print("=" * 78)
+        print(f"{'strategy':<10} {'p50 µs':>9} {'p99 µs':>9} {'taps/s':>9} {'lost strikes':>13} {'lock errors':>12}")
+        for name, strike, legacy in (("json rmw", strike_json, True), ("bitmask", strike_mask, False)):
+            samples = sorted(latency(engine, strike, legacy, taps))
+            lost, errors = race(engine, strike, legacy)
+            print(
+                f"{name:<10} {statistics.median(samples):>9.0f} {samples[int(len(samples) * 0.99)]:>9.0f} "
+                f"{len(samples) / (sum(samples) / 1e6):>9,.0f} {lost:>13} {errors:>12}"
+            )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    run_benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 2_000)
@@ -0,0 +1,21 @@
+"""pytest setup for the backend test scripts"""
+import os
+import tempfile
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def scratch_directory():
+    """
+    Run the whole session in one scratch directory. database opens
+    ./bingo.db where it is first imported, once per process, so the
+    in-process tests share that file; each recreates its tables first.
+    """
+    cwd = os.getcwd()
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        try:
+            yield scratch
+        finally:
+            os.chdir(cwd)
@@ -1,22 +1,175 @@
+import asyncio
+import os
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import create_async_engine
 from sqlmodel import SQLModel, create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
 from models.ticket import Ticket
 from models.game import NumberSession
 from models.player import Player, PlayerTicket, GameSession
+from models.archive import ArchivedGame
+from migrations import run_migrations
 
 
 # SQLite database URL
 DATABASE_URL = "sqlite:///./bingo.db"
+ASYNC_DATABASE_URL = "sqlite+aiosqlite:///./bingo.db"
+
+# Driver used by request handlers: "async" (aiosqlite) or "sync" (the
+# blocking driver, each call run in the threadpool)
+DB_DRIVER = os.getenv("BINGO_DB_DRIVER", "async")
+
+
+class StorageProfile(BaseModel):
+    """SQLite settings applied to every new connection, plus pool sizing"""
+    journal_mode: Optional[str] = None  # None keeps SQLite's rollback journal
+    synchronous: Optional[str] = None  # None keeps SQLite's default (FULL)
+    busy_timeout_ms: int = 5000  # How long a writer waits for the lock before "database is locked"
+    mmap_size: int = 0  # Bytes of the file read through memory mapping
+    cache_size: Optional[int] = None  # Page cache; negative values are KiB
+    cached_statements: int = 128  # Prepared statements kept per connection
+    pool_size: int = 5
+    max_overflow: int = 10
+
+    def pragmas(self) -> List[str]:
+        """PRAGMA statements run on each new connection"""
+        pragmas = [f"PRAGMA busy_timeout = {self.busy_timeout_ms}"]
+        if self.journal_mode:
+            pragmas.append(f"PRAGMA journal_mode = {self.journal_mode}")
+        if self.synchronous:
+            pragmas.append(f"PRAGMA synchronous = {self.synchronous}")
+        if self.mmap_size:
+            pragmas.append(f"PRAGMA mmap_size = {self.mmap_size}")
+        if self.cache_size is not None:
+            pragmas.append(f"PRAGMA cache_size = {self.cache_size}")
+        return pragmas
+
+
+STORAGE_PROFILES: Dict[str, StorageProfile] = {
+    # SQLite defaults, as before storage profiles
+    "legacy": StorageProfile(),
+    # Pools stay small: SQLite has one writer and handlers share one event
+    # loop, so extra connections only hold the write lock while queued
+    # WAL lets polls read while a strike or call writes; NORMAL only syncs at
+    # checkpoints, so a power cut can lose the last commits but never corrupts
+    "wal": StorageProfile(
+        journal_mode="WAL",
+        synchronous="NORMAL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        cached_statements=256,
+        pool_size=5,
+        max_overflow=10
+    ),
+    # WAL with a sync on every commit
+    "durable": StorageProfile(
+        journal_mode="WAL",
+        synchronous="FULL",
+        mmap_size=256 * 1024 * 1024,
+        cache_size=-64 * 1024,
+        cached_statements=256,
+        pool_size=5,
+        max_overflow=10
+    ),
+}
+
+STORAGE_PROFILE = os.getenv("BINGO_STORAGE_PROFILE", "wal")
+if STORAGE_PROFILE not in STORAGE_PROFILES:
+    raise ValueError(f"Unknown BINGO_STORAGE_PROFILE {STORAGE_PROFILE!r}, expected one of {sorted(STORAGE_PROFILES)}")
+profile = STORAGE_PROFILES[STORAGE_PROFILE]
+
+# Log every SQL statement (development only)
+SQL_ECHO = os.getenv("BINGO_SQL_ECHO", "false").lower() in ("1", "true", "yes")
+
+# Create engines; the sync engine also serves table creation and background jobs
+engine_options = dict(
+    echo=SQL_ECHO,
+    pool_size=profile.pool_size,
+    max_overflow=profile.max_overflow,
+    connect_args={"cached_statements": profile.cached_statements}
+)
+engine = create_engine(DATABASE_URL, **engine_options)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **engine_options)
+
+
+@event.listens_for(engine, "connect")
+@event.listens_for(async_engine.sync_engine, "connect")
+def apply_storage_profile(dbapi_connection, connection_record):
+    """Run the profile's pragmas on each new connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in profile.pragmas():
+        cursor.execute(pragma)
+    cursor.close()
+
 
-# Create engine
-engine = create_engine(DATABASE_URL, echo=True)
+class ThreadedSession:
+    """
+    Awaitable facade over a sync Session, so handlers are written once for
+    both drivers. Every database call runs in the threadpool.
+    """
+
+    def __init__(self, session: Session):
+        self.sync_session = session
+
+    def add(self, instance) -> None:
+        self.sync_session.add(instance)
+
+    def add_all(self, instances) -> None:
+        self.sync_session.add_all(instances)
+
+    async def exec(self, statement, **kwargs):
+        return await run_in_threadpool(self.sync_session.exec, statement, **kwargs)
+
+    async def execute(self, statement, params=None, **kwargs):
+        return await run_in_threadpool(self.sync_session.execute, statement, params, **kwargs)
+
+    async def get(self, entity, ident, **kwargs):
+        return await run_in_threadpool(self.sync_session.get, entity, ident, **kwargs)
+
+    async def delete(self, instance) -> None:
+        await run_in_threadpool(self.sync_session.delete, instance)
+
+    async def flush(self) -> None:
+        await run_in_threadpool(self.sync_session.flush)
+
+    async def commit(self) -> None:
+        await run_in_threadpool(self.sync_session.commit)
+
+    async def rollback(self) -> None:
+        await run_in_threadpool(self.sync_session.rollback)
+
+    async def refresh(self, instance) -> None:
+        await run_in_threadpool(self.sync_session.refresh, instance)
 
 
 def create_db_and_tables():
-    """Create database tables"""
+    """Create missing tables, then bring existing ones up to date"""
     SQLModel.metadata.create_all(engine)
+    run_migrations(engine)
+
+
+# A sync session keeps its connection across threadpool calls; with more
+# sessions than connections, threads blocked on the pool starve the
+# sessions holding one, so requests wait here for a connection instead
+_sync_sessions = asyncio.Semaphore(profile.pool_size + profile.max_overflow)
+
 
+async def get_session():
+    """
+    Get database session.
 
-def get_session():
-    """Get database session"""
-    with Session(engine) as session:
-        yield session
+    Objects are not expired on commit: with the async driver an expired
+    attribute cannot be reloaded lazily.
+    """
+    if DB_DRIVER == "sync":
+        async with _sync_sessions:
+            with Session(engine, expire_on_commit=False) as session:
+                yield ThreadedSession(session)
+    else:
+        async with AsyncSession(async_engine, expire_on_commit=False) as session:
+            yield session
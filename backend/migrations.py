@@ -0,0 +1,170 @@
+"""
+Versioned schema migrations for existing databases.
+
+create_all only creates missing tables, so every column or index added to a
+model after its table first shipped gets a migration here. The schema
+version lives in SQLite's PRAGMA user_version; run_migrations applies every
+migration above it in order at startup. Migrations are idempotent (columns
+and indexes are only added when missing) so they are also safe on databases
+that create_all built with part of the current schema.
+"""
+import json
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Connection, Engine, text
+
+from utils.fingerprint import ticket_fingerprint
+from utils.generator import grid_from_seed
+from utils.strikes import strikes_to_mask
+
+logger = logging.getLogger(__name__)
+
+
+def _columns(connection: Connection, table: str) -> List[str]:
+    return [row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")]
+
+
+def _add_column(connection: Connection, table: str, column: str, ddl: str) -> None:
+    """ALTER TABLE ... ADD COLUMN unless the column already exists"""
+    if column not in _columns(connection, table):
+        connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+
+
+def _create_index(connection: Connection, name: str, table: str, columns: str, unique: bool = False) -> None:
+    connection.exec_driver_sql(
+        f"CREATE {'UNIQUE ' if unique else ''}INDEX IF NOT EXISTS {name} ON {table} ({columns})"
+    )
+
+
+def seed_addressed_tickets(connection: Connection) -> None:
+    """Tickets store a seed and generator version instead of the grid"""
+    for table in ("playerticket", "ticket"):
+        _add_column(connection, table, "seed", "BIGINT")
+        _add_column(connection, table, "generator_version", "INTEGER")
+
+
+def ticket_fingerprints(connection: Connection) -> None:
+    """Fingerprint existing tickets and keep duplicates out of a session"""
+    _add_column(connection, "playerticket", "fingerprint", "BLOB")
+
+    seen = set()
+    rows = connection.execute(text(
+        "SELECT id, game_session_id, seed, generator_version, grid, fingerprint FROM playerticket ORDER BY id"
+    )).all()
+    for ticket_id, game_session_id, seed, version, grid, fingerprint in rows:
+        if fingerprint is None:
+            grid = grid_from_seed(seed, version) if seed is not None else json.loads(grid)
+            fingerprint = ticket_fingerprint(grid)
+        # Duplicates issued before the check keep a NULL fingerprint so the
+        # unique index can be built
+        key = (game_session_id, fingerprint)
+        if game_session_id is not None and key in seen:
+            fingerprint = None
+        seen.add(key)
+        connection.execute(
+            text("UPDATE playerticket SET fingerprint = :fingerprint WHERE id = :id"),
+            {"fingerprint": fingerprint, "id": ticket_id}
+        )
+
+    _create_index(
+        connection, "ix_playerticket_session_fingerprint", "playerticket", "game_session_id, fingerprint", unique=True
+    )
+
+
+def strike_masks(connection: Connection) -> None:
+    """Strikes move from the JSON dict to a bitmask"""
+    _add_column(connection, "playerticket", "strike_mask", "INTEGER NOT NULL DEFAULT 0")
+
+    rows = connection.execute(text(
+        "SELECT id, strikes FROM playerticket WHERE strikes IS NOT NULL AND strikes != 'null'"
+    )).all()
+    for ticket_id, strikes in rows:
+        connection.execute(
+            text("UPDATE playerticket SET strike_mask = strike_mask | :mask, strikes = NULL WHERE id = :id"),
+            {"mask": strikes_to_mask(json.loads(strikes) or {}), "id": ticket_id}
+        )
+
+
+def draw_state(connection: Connection) -> None:
+    """Game sessions keep a draw order, cursor and called mask (existing games convert at their next call)"""
+    _add_column(connection, "gamesession", "draw_order", "BLOB")
+    _add_column(connection, "gamesession", "draw_cursor", "INTEGER NOT NULL DEFAULT 0")
+    _add_column(connection, "gamesession", "called_mask", "BLOB")
+
+
+def hot_path_indexes(connection: Connection) -> None:
+    """Indexes for session state, player tickets, strikes and the legacy game"""
+    _create_index(connection, "ix_playerticket_game_session_id", "playerticket", "game_session_id")
+    _create_index(connection, "ix_playerticket_player_id", "playerticket", "player_id")
+    _create_index(connection, "ix_playerticket_ticket_id", "playerticket", "ticket_id")
+    _create_index(connection, "ix_numbersession_updated_at", "numbersession", "updated_at")
+
+
+def session_memberships(connection: Connection) -> None:
+    """Session players get a link table and sessions keep ticket and player counters"""
+    _add_column(connection, "gamesession", "tickets_count", "INTEGER NOT NULL DEFAULT 0")
+    _add_column(connection, "gamesession", "players_count", "INTEGER NOT NULL DEFAULT 0")
+
+    # create_all has already created the (empty) sessionplayer table
+    connection.exec_driver_sql("""
+        INSERT OR REPLACE INTO sessionplayer (game_session_id, player_id, tickets_count, joined_at)
+        SELECT game_session_id, player_id, COUNT(*), MIN(created_at)
+        FROM playerticket WHERE game_session_id IS NOT NULL
+        GROUP BY game_session_id, player_id
+    """)
+    connection.exec_driver_sql("""
+        UPDATE gamesession SET
+            tickets_count = (SELECT COALESCE(SUM(tickets_count), 0) FROM sessionplayer WHERE game_session_id = gamesession.id),
+            players_count = (SELECT COUNT(*) FROM sessionplayer WHERE game_session_id = gamesession.id)
+    """)
+
+
+def player_name_index(connection: Connection) -> None:
+    """Index for the admin player directory's name search"""
+    _create_index(connection, "ix_player_name_lower", "player", "lower(name), player_id")
+
+
+def session_last_activity(connection: Connection) -> None:
+    """Game sessions track their last activity, indexed for the idle-session reaper"""
+    _add_column(connection, "gamesession", "last_activity_at", "VARCHAR NOT NULL DEFAULT ''")
+    connection.exec_driver_sql("UPDATE gamesession SET last_activity_at = updated_at WHERE last_activity_at = ''")
+    _create_index(connection, "ix_gamesession_active_last_activity", "gamesession", "is_active, last_activity_at")
+
+
+def session_versions(connection: Connection) -> None:
+    """Game sessions carry a state version for conditional polls"""
+    _add_column(connection, "gamesession", "version", "INTEGER NOT NULL DEFAULT 1")
+
+
+# (user_version, migration); append new migrations with the next version
+MIGRATIONS: List[Tuple[int, Callable[[Connection], None]]] = [
+    (1, seed_addressed_tickets),
+    (2, ticket_fingerprints),
+    (3, strike_masks),
+    (4, draw_state),
+    (5, hot_path_indexes),
+    (6, session_memberships),
+    (7, player_name_index),
+    (8, session_last_activity),
+    (9, session_versions),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def run_migrations(engine: Engine) -> int:
+    """Apply pending migrations; returns the schema version"""
+    with engine.connect() as connection:
+        version = connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+    for target, migrate in MIGRATIONS:
+        if target <= version:
+            continue
+        logger.info(f"Migrating database to version {target}: {migrate.__doc__}")
+        with engine.begin() as connection:
+            migrate(connection)
+            connection.exec_driver_sql(f"PRAGMA user_version = {target}")
+        version = target
+
+    return version
@@ -0,0 +1,20 @@
+from typing import Optional
+from sqlmodel import SQLModel, Field, BigInteger
+from datetime import datetime
+
+
+class ArchivedGame(SQLModel, table=True):
+    """Offset index entry for a finished game stored in an archive segment"""
+    id: Optional[int] = Field(default=None, primary_key=True)
+    session_code: str = Field(index=True)  # Codes are reused once a game is gone; newest id wins
+    game_session_id: int  # The live row's id before it was deleted
+    game_updated_at: str  # The game as archived; a game changed since then is archived again
+
+    # Where the game's gzip frame lives
+    segment: str  # File name inside the archive directory
+    offset: int = Field(sa_type=BigInteger)
+    length: int
+
+    tickets_count: int = Field(default=0)
+    players_count: int = Field(default=0)
+    archived_at: str = Field(default_factory=lambda: datetime.now().isoformat())
@@ -18,4 +18,4 @@ class NumberSession(SQLModel, table=True):
     remaining: List[int] = Field(default=[], sa_column=Column(JSON))
     current_number: Optional[int] = Field(default=None)
     created_at: Optional[str] = Field(default=None)
-    updated_at: Optional[str] = Field(default=None)
+    updated_at: Optional[str] = Field(default=None, index=True)
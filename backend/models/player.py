@@ -1,6 +1,6 @@
 from typing import Optional, List, Dict
 from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, JSON, Column, Relationship
+from sqlmodel import SQLModel, Field, JSON, Column, Relationship, BigInteger, LargeBinary, Index, text
 from datetime import datetime
 import random
 import string
@@ -11,8 +11,21 @@ def generate_player_id() -> str:
     return ''.join(random.choices(string.ascii_uppercase + string.digits, k=6))
 
 
+class SessionPlayer(SQLModel, table=True):
+    """Link between a game session and a player who has tickets in it"""
+    game_session_id: int = Field(foreign_key="gamesession.id", primary_key=True)
+    player_id: str = Field(foreign_key="player.player_id", primary_key=True, index=True)
+    tickets_count: int = Field(default=0)  # The player's tickets in the session
+    joined_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+
+
 class Player(SQLModel, table=True):
     """Database model for players"""
+    __table_args__ = (
+        # Case-insensitive name prefix search in directory order
+        Index("ix_player_name_lower", text("lower(name)"), "player_id"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     player_id: str = Field(unique=True, index=True)  # Short ID like "ABC123"
     name: str
@@ -21,19 +34,29 @@ class Player(SQLModel, table=True):
     
     # Relationships
     tickets: List["PlayerTicket"] = Relationship(back_populates="player")
-    game_sessions: List["GameSession"] = Relationship(back_populates="players")
+    game_sessions: List["GameSession"] = Relationship(back_populates="players", link_model=SessionPlayer)
 
 
 class PlayerTicket(SQLModel, table=True):
     """Database model for player tickets with strike information"""
+    __table_args__ = (
+        # One ticket per number set within a session
+        Index("ix_playerticket_session_fingerprint", "game_session_id", "fingerprint", unique=True),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
-    ticket_id: UUID = Field(default_factory=uuid4)
-    player_id: str = Field(foreign_key="player.player_id")
-    game_session_id: Optional[int] = Field(default=None, foreign_key="gamesession.id")
+    ticket_id: UUID = Field(default_factory=uuid4, index=True)
+    player_id: str = Field(foreign_key="player.player_id", index=True)
+    game_session_id: Optional[int] = Field(default=None, foreign_key="gamesession.id", index=True)
     
-    # Ticket data
-    grid: List[List[Optional[int]]] = Field(sa_column=Column(JSON))  # Original ticket
-    strikes: Dict[str, bool] = Field(default={}, sa_column=Column(JSON))  # {"row-col": True/False}
+    # Ticket data: either a seed-addressed ticket (seed + generator version,
+    # grid rebuilt on demand) or a stored grid for tickets created before seeds
+    seed: Optional[int] = Field(default=None, sa_type=BigInteger)
+    generator_version: Optional[int] = Field(default=None)
+    grid: Optional[List[List[Optional[int]]]] = Field(default=None, sa_column=Column(JSON))  # Original ticket
+    fingerprint: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))  # 90-bit number set
+    strike_mask: int = Field(default=0)  # Bit row * 9 + col set for each struck cell
+    strikes: Optional[Dict[str, bool]] = Field(default=None, sa_column=Column(JSON))  # Strikes recorded before strike_mask
     
     created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
@@ -45,22 +68,39 @@ class PlayerTicket(SQLModel, table=True):
 
 class GameSession(SQLModel, table=True):
     """Database model for game sessions supporting multiplayer"""
+    __table_args__ = (
+        # Idle-session reaper and finished-game cleanup range scans
+        Index("ix_gamesession_active_last_activity", "is_active", "last_activity_at"),
+    )
+
     id: Optional[int] = Field(default=None, primary_key=True)
     session_code: str = Field(unique=True, index=True)  # Short session code
     admin_player_id: str = Field(foreign_key="player.player_id")
     
     # Game state
     current_number: Optional[int] = Field(default=None)
-    called_numbers: List[int] = Field(default=[], sa_column=Column(JSON))
-    remaining_numbers: List[int] = Field(default_factory=lambda: list(range(1, 91)), sa_column=Column(JSON))
+    # The shuffled 1-90 draw is fixed at creation; a call advances the cursor
+    draw_order: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))  # 90 bytes
+    draw_cursor: int = Field(default=0)  # Numbers called so far
+    called_mask: Optional[bytes] = Field(default=None, sa_column=Column(LargeBinary))  # 90-bit called set
+    called_numbers: Optional[List[int]] = Field(default=None, sa_column=Column(JSON))  # Sessions created before draw_order
+    remaining_numbers: Optional[List[int]] = Field(default=None, sa_column=Column(JSON))
+    
+    # Membership counters, kept up to date by join, ticket generation and deletes
+    tickets_count: int = Field(default=0)
+    players_count: int = Field(default=0)
     
     # Session info
     is_active: bool = Field(default=True)
+    # Bumped in the database by every change to the polled session state; the ETag of GET /api/sessions/{code}
+    version: int = Field(default=1)
     created_at: str = Field(default_factory=lambda: datetime.now().isoformat())
     updated_at: str = Field(default_factory=lambda: datetime.now().isoformat())
+    # Last call, join, strike or admin action (strikes bump it at most once a minute)
+    last_activity_at: str = Field(default_factory=lambda: datetime.now().isoformat())
     
     # Relationships
-    players: List[Player] = Relationship(back_populates="game_sessions")
+    players: List[Player] = Relationship(back_populates="game_sessions", link_model=SessionPlayer)
     tickets: List[PlayerTicket] = Relationship(back_populates="game_session")
 
 
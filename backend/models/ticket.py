@@ -1,6 +1,6 @@
 from typing import Optional, List
 from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field, JSON, Column
+from sqlmodel import SQLModel, Field, JSON, Column, BigInteger
 from pydantic import BaseModel
 
 
@@ -17,5 +17,7 @@ class TicketGrid(BaseModel):
 class Ticket(SQLModel, table=True):
     """Database model for bingo tickets"""
     id: Optional[UUID] = Field(default_factory=uuid4, primary_key=True)
-    grid: List[List[Optional[int]]] = Field(sa_column=Column(JSON))
+    seed: Optional[int] = Field(default=None, sa_type=BigInteger)  # Seed-addressed ticket
+    generator_version: Optional[int] = Field(default=None)
+    grid: Optional[List[List[Optional[int]]]] = Field(default=None, sa_column=Column(JSON))  # Tickets stored before seeds
     created_at: Optional[str] = Field(default=None)
@@ -6,5 +6,8 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=True,
-        log_level="info"
+        log_level="info",
+        # Session streams never finish on their own; cut them after this many
+        # seconds on shutdown (clients reconnect)
+        timeout_graceful_shutdown=5
     )
@@ -1,4 +1,4 @@
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Literal
 from uuid import UUID
 from pydantic import BaseModel
 
@@ -24,6 +24,7 @@ class PlayerTicketCreate(BaseModel):
     player_id: str
     count: int = 1
     session_code: Optional[str] = None
+    mode: Literal["single", "strip"] = "single"  # "strip": tickets come from full 1-90 strips of 6
 
 
 class PlayerTicketResponse(BaseModel):
@@ -57,7 +58,7 @@ class GameSessionResponse(BaseModel):
     admin_player_id: str
     current_number: Optional[int]
     called_numbers: List[int]
-    remaining_numbers: List[int]
+    remaining_numbers: Optional[List[int]] = None  # Omitted when include_remaining=false
     is_active: bool
     created_at: str
     updated_at: str
@@ -68,7 +69,7 @@ class GameSessionState(BaseModel):
     session_code: str
     current_number: Optional[int]
     called_numbers: List[int]
-    remaining_numbers: List[int]
+    remaining_numbers: Optional[List[int]] = None  # Omitted when include_remaining=false
     players_count: int
     tickets_count: int
     is_active: bool
@@ -103,11 +104,87 @@ class AdminSessionInfo(BaseModel):
     total_tickets: int
     current_number: Optional[int]
     called_numbers: List[int]
-    remaining_numbers: List[int]
+    remaining_numbers: Optional[List[int]] = None  # Omitted when include_remaining=false
     is_active: bool
 
 
+class ArchivedPlayer(BaseModel):
+    """A player as recorded in an archived game"""
+    player_id: str
+    name: str
+    tickets_count: int
+    joined_at: str
+
+
+class ArchivedGameResponse(BaseModel):
+    """A finished game read back from the archive"""
+    session_code: str
+    admin_player_id: str
+    current_number: Optional[int]
+    called_numbers: List[int]
+    players: List[ArchivedPlayer]
+    tickets: List[PlayerTicketResponse]
+    created_at: str
+    updated_at: str  # When the game was last played
+    archived_at: str
+
+
 # General Response Schemas
+class CleanupStatsResponse(BaseModel):
+    """Progress of the background cleanup worker"""
+    running: bool
+    runs: int
+    errors: int
+    last_run_at: Optional[str]
+    last_duration_ms: float
+    last_lag_seconds: float  # How overdue the oldest finished game was when the last run started
+    last_rows_deleted: Dict[str, int]  # Per table
+    total_rows_deleted: Dict[str, int]
+    last_games_archived: int
+    total_games_archived: int
+    total_archived_bytes: int  # Compressed bytes appended to archive segments
+    chunk_size: int
+    chunks: int
+    last_chunk_ms: float  # Write-lock hold of the most recent chunk
+    max_chunk_ms: float
+
+
+class ReaperStatsResponse(BaseModel):
+    """Progress of the idle-session reaper"""
+    idle_ttl_hours: float
+    runs: int
+    errors: int
+    last_run_at: Optional[str]
+    last_duration_ms: float
+    last_lag_seconds: float  # How long the longest-idle active session was past the TTL when the last run started
+    last_reaped: int
+    total_reaped: int
+
+
+class RetentionStatsResponse(BaseModel):
+    """Retention of the legacy Ticket and NumberSession tables"""
+    retention_days: Dict[str, int]  # Day partitions kept besides today's, per table
+    partitions: Dict[str, int]  # Day partitions present, per table
+    runs: int
+    errors: int
+    last_run_at: Optional[str]
+    last_duration_ms: float
+    last_dropped: List[str]
+    total_dropped: int
+    max_drop_ms: float
+    legacy_rows_deleted: Dict[str, int]  # Expired rows drained from the pre-partition tables
+    database_bytes: int
+    free_bytes: int  # Freed pages waiting to be reused
+
+
+class StreamStatsResponse(BaseModel):
+    """Open session event streams"""
+    connections: int
+    peak_connections: int
+    channels: int  # Sessions with at least one open stream
+    events_published: int
+
+
 class SuccessResponse(BaseModel):
     """General success response"""
     success: bool
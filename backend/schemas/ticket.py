@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Literal
 from uuid import UUID
 from pydantic import BaseModel
 
@@ -6,6 +6,15 @@ from pydantic import BaseModel
 class TicketGenerateRequest(BaseModel):
     """Request schema for generating tickets"""
     count: int = 1
+    mode: Literal["single", "strip"] = "single"  # "strip": tickets come from full 1-90 strips of 6
+
+
+class TicketExportRequest(BaseModel):
+    """Request schema for streaming a large ticket export"""
+    count: int
+    mode: Literal["single", "strip"] = "single"
+    format: Literal["ndjson", "csv"] = "ndjson"
+    persist: bool = False  # Also store the tickets in the Ticket table
 
 
 class TicketResponse(BaseModel):
@@ -17,3 +26,17 @@ class TicketResponse(BaseModel):
 class TicketGenerateResponse(BaseModel):
     """Response schema for ticket generation"""
     tickets: List[List[List[Optional[int]]]]
+
+
+class ReservoirStatsResponse(BaseModel):
+    """Response schema for ticket reservoir statistics"""
+    size: int
+    capacity: int
+    low_water: int
+    hits: int
+    misses: int
+    hit_rate: float
+    refills: int
+    last_refill_ms: float
+    avg_refill_ms: float
+    max_refill_ms: float
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Test that the admin listings stay within their query budget.
+
+Serves the paged admin endpoints in-process against a scratch database,
+follows X-Next-Cursor through every page and fails if a page is missed or
+any request executes more than QUERY_BUDGET SQL statements. No server
+needed; run from the backend directory:
+
+    python test_admin_queries.py
+"""
+import asyncio
+import logging
+import os
+import tempfile
+
+from benchmarks.bench_admin_listing import QUERY_BUDGET, QueryCounter, build, list_pages
+
+SESSIONS = 120
+PLAYERS_PER_SESSION = 130
+PAGE_SIZE = 50
+
+
+async def check_listings():
+    import httpx
+
+    from sqlmodel import SQLModel
+
+    # Imported here: the database file is opened relative to the scratch directory
+    import database
+    from app.main import app
+
+    # Another test in this process may have used the database already
+    SQLModel.metadata.drop_all(database.engine)
+    database.create_db_and_tables()
+    build(database.engine, SESSIONS, PLAYERS_PER_SESSION)
+    app_engine = database.engine if database.DB_DRIVER == "sync" else database.async_engine.sync_engine
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            for path, expected in (
+                ("/api/admin/sessions", SESSIONS),
+                ("/api/admin/session/S0", PLAYERS_PER_SESSION)
+            ):
+                with QueryCounter(app_engine) as counter:
+                    items, pages, worst = await list_pages(client, path, PAGE_SIZE, counter)
+                print(f"   {path}: {items} items in {pages} pages, at most {worst} statements per request")
+                assert items == expected, f"{path}: listed {items} of {expected}"
+                assert pages == -(-expected // PAGE_SIZE), f"{path}: {pages} pages"
+                assert worst <= QUERY_BUDGET, f"{path}: {worst} statements in one request (budget {QUERY_BUDGET})"
+
+            # Newest sessions come first, so the first page holds the live games
+            response = await client.get("/api/admin/sessions", params={"admin_player_id": "ADMIN1", "limit": 3})
+            codes = [info["session_code"] for info in response.json()]
+            assert codes == [f"S{SESSIONS - 1}", f"S{SESSIONS - 2}", f"S{SESSIONS - 3}"], codes
+    finally:
+        # Left open, aiosqlite's threads keep a failed run from exiting
+        await database.async_engine.dispose()
+
+
+def test_admin_listing_query_budget():
+    """Admin listings: every page reached, within QUERY_BUDGET statements each"""
+    print(f"\n🛡️ Testing admin listing query budget ({QUERY_BUDGET} statements per request)")
+    asyncio.run(check_listings())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    # Under pytest, conftest.py provides the scratch directory
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        test_admin_listing_query_budget()
+    print("✅ Admin listings within the query budget")
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Golden-seed regression test for seed-addressed tickets.
+
+Purchased tickets are stored as (seed, generator version) and rebuilt from
+the seed on every read, so a seed must give the same grid forever. These
+grids were recorded once; if this test fails, the generator changed
+behind an existing version number: give the change a new version instead.
+No server needed; run from the backend directory:
+
+    python test_generator_seeds.py
+"""
+from utils.generator import (
+    GENERATOR_VERSION,
+    PY_RANDOM_GENERATOR_VERSION,
+    PY_RANDOM_STRIP_GENERATOR_VERSION,
+    STRIP_GENERATOR_VERSION,
+    SeedRandom,
+    grid_from_seed,
+)
+
+STRIP_SEED = 987654321
+LARGEST_STRIP_SEED = 2 ** 60 - 1
+
+# The numbers of each row; a number fixes its column, so this is the whole grid
+GOLDEN_SINGLE = {
+    PY_RANDOM_GENERATOR_VERSION: {
+        0: [[1, 56, 64, 79, 83], [7, 15, 37, 70, 85], [29, 38, 45, 58, 90]],
+        12345: [[15, 24, 35, 52, 65], [26, 37, 43, 69, 73], [1, 46, 57, 79, 83]],
+        2 ** 63 - 1: [[3, 32, 43, 52, 73], [28, 35, 59, 61, 89], [18, 38, 46, 60, 74]],
+    },
+    GENERATOR_VERSION: {
+        0: [[20, 35, 45, 54, 74], [5, 36, 48, 60, 79], [26, 37, 49, 64, 86]],
+        12345: [[6, 12, 40, 44, 61], [8, 18, 30, 76, 82], [9, 50, 53, 70, 77]],
+        2 ** 63 - 1: [[2, 23, 64, 72, 83], [15, 34, 55, 70, 87], [6, 19, 37, 45, 74]],
+    },
+}
+
+GOLDEN_STRIP = {
+    PY_RANDOM_STRIP_GENERATOR_VERSION: {
+        STRIP_SEED << 3 | 0: [[5, 48, 51, 61, 81], [8, 25, 53, 68, 85], [13, 26, 32, 57, 71]],
+        STRIP_SEED << 3 | 1: [[3, 34, 42, 52, 65], [11, 22, 45, 60, 83], [9, 12, 35, 72, 86]],
+        STRIP_SEED << 3 | 2: [[16, 21, 37, 46, 87], [1, 23, 39, 64, 79], [4, 20, 29, 50, 55]],
+        STRIP_SEED << 3 | 3: [[2, 27, 36, 63, 82], [14, 47, 66, 77, 89], [19, 40, 58, 69, 80]],
+        STRIP_SEED << 3 | 4: [[28, 43, 54, 74, 84], [17, 31, 67, 75, 88], [10, 33, 44, 70, 78]],
+        STRIP_SEED << 3 | 5: [[15, 24, 41, 56, 73], [6, 18, 30, 49, 62], [7, 38, 59, 76, 90]],
+        LARGEST_STRIP_SEED << 3 | 5: [[11, 31, 54, 72, 89], [8, 47, 62, 76, 90], [26, 40, 48, 67, 80]],
+    },
+    STRIP_GENERATOR_VERSION: {
+        STRIP_SEED << 3 | 0: [[16, 47, 56, 63, 82], [1, 21, 32, 58, 67], [2, 29, 40, 68, 75]],
+        STRIP_SEED << 3 | 1: [[30, 34, 42, 76, 86], [5, 51, 69, 77, 87], [13, 39, 54, 79, 88]],
+        STRIP_SEED << 3 | 2: [[6, 17, 37, 44, 84], [19, 53, 62, 73, 90], [20, 22, 57, 64, 74]],
+        STRIP_SEED << 3 | 3: [[4, 12, 24, 45, 61], [8, 14, 26, 46, 70], [9, 33, 52, 78, 83]],
+        STRIP_SEED << 3 | 4: [[7, 23, 35, 41, 80], [10, 27, 49, 60, 85], [15, 38, 50, 66, 89]],
+        STRIP_SEED << 3 | 5: [[11, 25, 31, 55, 71], [3, 18, 43, 59, 81], [28, 36, 48, 65, 72]],
+        LARGEST_STRIP_SEED << 3 | 5: [[12, 26, 43, 62, 87], [3, 33, 54, 63, 73], [15, 30, 49, 56, 70]],
+    },
+}
+
+
+def row_numbers(grid) -> list:
+    """The numbers of each row of a grid, left to right"""
+    return [[number for number in row if number is not None] for row in grid]
+
+
+def check_golden(golden: dict):
+    for version, grids in golden.items():
+        for seed, expected in grids.items():
+            grid = grid_from_seed(seed, version)
+            assert row_numbers(grid) == expected, (seed, version, grid)
+            for row, numbers in zip(grid, expected):
+                # Each number sits in its own column
+                assert [row.index(number) for number in numbers] == [(number - 1) // 10 for number in numbers]
+
+
+def test_seed_random_stream():
+    """The repo-owned stream never changes"""
+    rng = SeedRandom(12345)
+    assert [rng.random() for _ in range(3)] == [0.1277076494883964, 0.8299256504161784, 0.7842052933603179]
+    for _ in range(61):
+        rng.random()
+    # First number of the second block
+    assert rng.random() == 0.14692908882613287
+    rng = SeedRandom(7)
+    assert rng.sample(range(90), 5) == [31, 11, 10, 49, 52]
+    assert rng.randrange(1000) == 382
+
+
+def test_single_seeds():
+    """Single tickets rebuild to their recorded grids, current and older versions"""
+    check_golden(GOLDEN_SINGLE)
+
+
+def test_strip_seeds():
+    """Strip tickets rebuild to their recorded grids, current and older versions"""
+    check_golden(GOLDEN_STRIP)
+    for version in GOLDEN_STRIP:
+        numbers = sorted(
+            number
+            for position in range(6)
+            for row in row_numbers(grid_from_seed(STRIP_SEED << 3 | position, version))
+            for number in row
+        )
+        assert numbers == list(range(1, 91)), version
+
+
+if __name__ == "__main__":
+    print("\n🎟️ Testing golden seeds")
+    test_seed_random_stream()
+    test_single_seeds()
+    test_strip_seeds()
+    print("✅ Every seed rebuilt its recorded grid")
@@ -212,8 +212,8 @@ def run_multiplayer_tests():
         
         session_code = session['session_code']
         
-        # Generate tickets
-        player_tickets = test_generate_tickets(players, session_code)
+        # Generate tickets (bought without a session code, so joining brings them in)
+        player_tickets = test_generate_tickets(players)
         
         # Join session
         test_join_session(session_code, players)
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Test that concurrent number calls never announce the same number.
+
+Fires CONCURRENT_CALLS calls at one session at once, in-process against a
+scratch database, and checks each got its own number and the session
+recorded every one. Then calls past the end of the draw and checks exactly
+the remaining numbers are handed out. No server needed; run from the
+backend directory (BINGO_DB_DRIVER=sync to test the threadpool driver):
+
+    python test_session_calls.py
+"""
+import asyncio
+import logging
+import os
+import tempfile
+
+CONCURRENT_CALLS = 30
+NUMBER_COUNT = 90
+
+
+def etag_version(response) -> int:
+    """Session version in a state response's ETag ("<id>-<version>")"""
+    return int(response.headers["etag"].strip('"').split("-")[1])
+
+
+async def call_concurrently(client, code: str, calls: int) -> list:
+    """Responses of `calls` simultaneous calls"""
+    return await asyncio.gather(*[client.post(f"/api/sessions/{code}/call-number") for _ in range(calls)])
+
+
+async def check_calls():
+    import httpx
+
+    from sqlmodel import SQLModel
+
+    # Imported here: the database file is opened relative to the scratch directory
+    import database
+    from app.main import app
+
+    # Another test in this process may have used the database already
+    SQLModel.metadata.drop_all(database.engine)
+    database.create_db_and_tables()
+    try:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test", timeout=60) as client:
+            admin = (await client.post("/api/players/create", json={"name": "Admin", "is_admin": True})).json()
+            code = (await client.post(
+                "/api/sessions/create", json={"admin_player_id": admin["player_id"]}
+            )).json()["session_code"]
+            version = etag_version(await client.get(f"/api/sessions/{code}"))
+
+            responses = await call_concurrently(client, code, CONCURRENT_CALLS)
+            assert [response.status_code for response in responses] == [200] * CONCURRENT_CALLS, \
+                [response.text for response in responses if response.status_code != 200]
+            numbers = [response.json()["called_number"] for response in responses]
+            print(f"   {CONCURRENT_CALLS} concurrent calls: {len(set(numbers))} distinct numbers")
+            assert len(set(numbers)) == CONCURRENT_CALLS, sorted(numbers)
+
+            response = await client.get(f"/api/sessions/{code}")
+            state = response.json()
+            assert sorted(state["called_numbers"]) == sorted(numbers), state["called_numbers"]
+            assert len(state["remaining_numbers"]) == NUMBER_COUNT - CONCURRENT_CALLS
+            assert etag_version(response) == version + CONCURRENT_CALLS, response.headers["etag"]
+
+            # Past the end of the draw: only the numbers left are called
+            left = NUMBER_COUNT - CONCURRENT_CALLS
+            responses = await call_concurrently(client, code, left + 5)
+            statuses = [response.status_code for response in responses]
+            assert statuses.count(200) == left and statuses.count(400) == 5, statuses
+            numbers += [response.json()["called_number"] for response in responses if response.status_code == 200]
+            assert sorted(numbers) == list(range(1, NUMBER_COUNT + 1))
+            print(f"   {left + 5} calls for the last {left} numbers: every number called once")
+    finally:
+        # Left open, aiosqlite's threads keep a failed run from exiting
+        await database.async_engine.dispose()
+
+
+def test_concurrent_calls_get_distinct_numbers():
+    """Concurrent calls: one number each, none lost"""
+    print(f"\n🎱 Testing {CONCURRENT_CALLS} concurrent number calls")
+    asyncio.run(check_calls())
+
+
+if __name__ == "__main__":
+    logging.disable(logging.CRITICAL)
+    # Under pytest, conftest.py provides the scratch directory
+    with tempfile.TemporaryDirectory() as scratch:
+        os.chdir(scratch)
+        test_concurrent_calls_get_distinct_numbers()
+    print("✅ Concurrent calls each got their own number")
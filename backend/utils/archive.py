@@ -0,0 +1,151 @@
+import gzip
+import json
+import os
+import threading
+from typing import Dict, List, Tuple
+
+from sqlmodel import Session, select
+
+from models.archive import ArchivedGame
+from models.player import GameSession, Player, PlayerTicket, SessionPlayer
+from utils.draw import called_numbers
+from utils.generator import resolve_grid
+from utils.strikes import resolve_strikes
+
+# Segment files live here, next to bingo.db unless configured
+ARCHIVE_DIR = os.getenv("BINGO_ARCHIVE_DIR", "archive")
+# A new segment is started once the current one reaches this size
+SEGMENT_MAX_BYTES = 64 * 1024 * 1024
+SEGMENT_PREFIX = "games-"
+SEGMENT_SUFFIX = ".jsonl.gz"
+COMPRESS_LEVEL = 6
+ARCHIVE_FORMAT_VERSION = 1
+
+
+def game_record(session: Session, game_session: GameSession) -> Dict:
+    """
+    A finished game as one JSON-ready dict: the draw, its players and every
+    ticket with its grid and strikes spelled out, so the record stands on
+    its own without the live tables or the generator.
+    """
+    members = session.exec(
+        select(SessionPlayer, Player.name)
+        .join(Player, Player.player_id == SessionPlayer.player_id)
+        .where(SessionPlayer.game_session_id == game_session.id)
+        .order_by(SessionPlayer.player_id)
+    ).all()
+    tickets = session.exec(
+        select(PlayerTicket).where(PlayerTicket.game_session_id == game_session.id).order_by(PlayerTicket.id)
+    ).all()
+
+    return {
+        "format": ARCHIVE_FORMAT_VERSION,
+        "session_code": game_session.session_code,
+        "game_session_id": game_session.id,
+        "admin_player_id": game_session.admin_player_id,
+        "current_number": game_session.current_number,
+        "called_numbers": called_numbers(game_session),
+        "created_at": game_session.created_at,
+        "updated_at": game_session.updated_at,
+        "players": [
+            {
+                "player_id": member.player_id,
+                "name": name,
+                "tickets_count": member.tickets_count,
+                "joined_at": member.joined_at
+            }
+            for member, name in members
+        ],
+        "tickets": [
+            {
+                "ticket_id": str(ticket.ticket_id),
+                "player_id": ticket.player_id,
+                "grid": resolve_grid(ticket),
+                "strikes": resolve_strikes(ticket),
+                "created_at": ticket.created_at,
+                "updated_at": ticket.updated_at
+            }
+            for ticket in tickets
+        ]
+    }
+
+
+class GameArchive:
+    """
+    Append-only segment files of gzip-framed game records.
+
+    Each game is one complete gzip member holding one JSON line, so a frame
+    is read back with a seek and a single decompress, and a whole segment
+    still reads with zcat. Frames are located through the ArchivedGame
+    offset index; bytes left by an append that never got indexed are
+    simply never read.
+    """
+
+    def __init__(self, directory: str = ARCHIVE_DIR, segment_max_bytes: int = SEGMENT_MAX_BYTES):
+        self.directory = directory
+        self.segment_max_bytes = segment_max_bytes
+        self._lock = threading.Lock()
+
+    def _segments(self) -> List[str]:
+        if not os.path.isdir(self.directory):
+            return []
+        return sorted(
+            name for name in os.listdir(self.directory)
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX)
+        )
+
+    def _current_segment(self) -> str:
+        segments = self._segments()
+        if segments and os.path.getsize(os.path.join(self.directory, segments[-1])) < self.segment_max_bytes:
+            return segments[-1]
+        number = int(segments[-1][len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]) + 1 if segments else 1
+        return f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}"
+
+    def append(self, record: Dict) -> Tuple[str, int, int]:
+        """Write one record durably; returns (segment, offset, length) for the index"""
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        frame = gzip.compress(line.encode(), compresslevel=COMPRESS_LEVEL, mtime=0)
+
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            segment = self._current_segment()
+            path = os.path.join(self.directory, segment)
+            created = not os.path.exists(path)
+            with open(path, "ab") as segment_file:
+                offset = segment_file.seek(0, os.SEEK_END)
+                segment_file.write(frame)
+                segment_file.flush()
+                os.fsync(segment_file.fileno())
+            if created and hasattr(os, "O_DIRECTORY"):
+                # Make the new file's directory entry durable too
+                directory_fd = os.open(self.directory, os.O_DIRECTORY)
+                try:
+                    os.fsync(directory_fd)
+                finally:
+                    os.close(directory_fd)
+        return segment, offset, len(frame)
+
+    def read(self, segment: str, offset: int, length: int) -> Dict:
+        """Decompress the single frame at offset (blocking file IO)"""
+        with open(os.path.join(self.directory, os.path.basename(segment)), "rb") as segment_file:
+            segment_file.seek(offset)
+            frame = segment_file.read(length)
+        return json.loads(gzip.decompress(frame))
+
+    def append_game(self, record: Dict) -> ArchivedGame:
+        """Append a game_record() and return its (unsaved) index entry"""
+        segment, offset, length = self.append(record)
+        return ArchivedGame(
+            session_code=record["session_code"],
+            game_session_id=record["game_session_id"],
+            game_updated_at=record["updated_at"],
+            segment=segment,
+            offset=offset,
+            length=length,
+            tickets_count=len(record["tickets"]),
+            players_count=len(record["players"])
+        )
+
+
+# Shared instance used by the cleanup worker and the read API
+game_archive = GameArchive()
@@ -0,0 +1,217 @@
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from utils.generator import (
+    COLUMN_RANGES, LAYOUT_COUNT, STRIP_SIZE, _FULL_MASK,
+    _BASE_HEIGHTS, _HEIGHT_WEIGHTS, _LAYOUT_COMPLETIONS, _LAYOUT_CUMULATIVE, _LAYOUT_PAIRS, _MASK_HEIGHTS
+)
+
+# Tickets generated per vectorized pass; bounds the temporary arrays to a few MB
+CHUNK_SIZE = 1 << 16
+
+_COLUMN_STARTS = np.array([min_val for min_val, _ in COLUMN_RANGES], dtype=np.int8)
+_COLUMN_SIZE = 10
+
+
+@lru_cache(maxsize=None)
+def _batch_tables() -> Tuple[np.ndarray, ...]:
+    """
+    NumPy views of the layout table plus every sorted pick of 1-3 column offsets.
+
+    Returns (cumulative counts, pair row masks, pair completion start,
+    flattened completions, pick counts per height, sorted picks).
+    """
+    cumulative = np.array(_LAYOUT_CUMULATIVE, dtype=np.int64)
+    pairs = np.array(_LAYOUT_PAIRS, dtype=np.int64)
+
+    # Completions of every required mask laid out back to back
+    starts = np.zeros(_FULL_MASK + 1, dtype=np.int64)
+    flat: List[int] = []
+    for required in range(_FULL_MASK + 1):
+        starts[required] = len(flat)
+        flat.extend(_LAYOUT_COMPLETIONS[required])
+    pair_starts = starts[_FULL_MASK & ~(pairs[:, 0] | pairs[:, 1])]
+    completion_counts = np.diff(cumulative, prepend=0)
+    # Subtracting the pair's first index turns a global pattern index into
+    # a position in the flattened completions
+    pair_starts = pair_starts - (cumulative - completion_counts)
+
+    # picks[h - 1, i] is the i-th sorted choice of h offsets out of 10,
+    # padded with the last offset so take_along_axis never reads garbage
+    pick_counts = np.array([len(list(combinations(range(_COLUMN_SIZE), h))) for h in (1, 2, 3)])
+    picks = np.zeros((3, pick_counts.max(), 3), dtype=np.int8)
+    for height in (1, 2, 3):
+        for i, chosen in enumerate(combinations(range(_COLUMN_SIZE), height)):
+            picks[height - 1, i] = chosen + (chosen[-1],) * (3 - height)
+
+    return cumulative, pairs, pair_starts, np.array(flat, dtype=np.int64), pick_counts, picks
+
+
+def layout_masks(index: np.ndarray) -> np.ndarray:
+    """Row masks, shape (len(index), 3), of the layout-table patterns at `index`"""
+    cumulative, pairs, pair_starts, completions, _, _ = _batch_tables()
+    pair = np.searchsorted(cumulative, index, side="right")
+    masks = np.empty((len(index), 3), dtype=np.int64)
+    masks[:, :2] = pairs[pair]
+    masks[:, 2] = completions[pair_starts[pair] + index]
+    return masks
+
+
+def _generate_chunk(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Generate one chunk of tickets as an (n, 3, 9) int8 array"""
+    _, _, _, _, pick_counts, picks = _batch_tables()
+
+    # One uniform pattern index per ticket, mapped to its three row masks
+    masks = layout_masks(rng.integers(0, LAYOUT_COUNT, size=n))
+
+    occupied = (masks[:, :, None] >> np.arange(9)) & 1  # (n, 3, 9)
+    heights = occupied.sum(axis=1)  # (n, 9), 1-3 per column
+
+    # A uniform sorted pick of `height` offsets per column
+    choice = (rng.random((n, 9)) * pick_counts[heights - 1]).astype(np.int64)
+    values = picks[heights - 1, choice]  # (n, 9, 3)
+
+    # The k-th filled cell of a column (top to bottom) takes the k-th pick
+    rank = np.cumsum(occupied, axis=1) - 1
+    rank[rank < 0] = 0
+    cells = np.take_along_axis(values.transpose(0, 2, 1), rank, axis=1)
+    return np.where(occupied == 1, cells + _COLUMN_STARTS, 0).astype(np.int8)
+
+
+def generate_batch(n: int, seed: Optional[int] = None) -> np.ndarray:
+    """
+    Generate `n` tickets as an (n, 3, 9) int8 array (0 marks a blank cell).
+
+    Same distribution as BingoTicketGenerator.generate_ticket: a uniform
+    layout-table pattern per ticket and a uniform sorted sample per column.
+    Passing `seed` makes the batch reproducible.
+    """
+    rng = np.random.default_rng(seed)
+    batch = np.empty((n, 3, 9), dtype=np.int8)
+    for start in range(0, n, CHUNK_SIZE):
+        stop = min(start + CHUNK_SIZE, n)
+        batch[start:stop] = _generate_chunk(stop - start, rng)
+    return batch
+
+
+@lru_cache(maxsize=None)
+def _strip_tables() -> Tuple[np.ndarray, ...]:
+    """
+    Every layout-table pattern grouped by its packed column heights.
+
+    Returns (sorted heights keys, group starts, group sizes, row masks of
+    every pattern ordered by key), the vectorized counterpart of
+    generator._layouts_by_heights.
+    """
+    masks = layout_masks(np.arange(LAYOUT_COUNT)).astype(np.int16)
+    heights = np.array(_MASK_HEIGHTS, dtype=np.int64)[masks].sum(axis=1)
+    order = np.argsort(heights, kind="stable")
+    keys, starts, sizes = np.unique(heights[order], return_index=True, return_counts=True)
+    return keys, starts, sizes, masks[order]
+
+
+def _generate_strip_chunk(n: int, rng: np.random.Generator) -> np.ndarray:
+    """Generate `n` strips as an (n * 6, 3, 9) int8 array"""
+    keys, starts, sizes, patterns = _strip_tables()
+
+    # Column heights, dealt as in generate_strip: every ticket starts with 1
+    # number per column and needs 6 extras, every column hands out 4 extras
+    # (at most 2 per ticket), forced where later columns could not absorb them
+    need = np.full((n, STRIP_SIZE), 6)
+    heights = np.full((n, STRIP_SIZE), _BASE_HEIGHTS)
+    for col in range(9):
+        forced = np.maximum(0, need - 2 * (8 - col))
+        optional = np.minimum(2, need) - forced
+        units = 4 - forced.sum(axis=1)
+
+        # A uniform choice of `units` among the optional slots (up to 2 per
+        # ticket): the slots with the smallest random keys, unusable ones last
+        slot_keys = rng.random((n, STRIP_SIZE, 2))
+        slot_keys[optional[:, :, None] <= np.arange(2)] = 2
+        ranked = np.sort(slot_keys.reshape(n, -1), axis=1)
+        cutoff = np.concatenate([np.full((n, 1), -1.0), ranked], axis=1)[np.arange(n), units]
+        extras = forced + (slot_keys <= cutoff[:, None, None]).sum(axis=2)
+
+        need -= extras
+        heights += extras * _HEIGHT_WEIGHTS[col]
+
+    # A uniform pattern with those heights per ticket
+    group = np.searchsorted(keys, heights)
+    index = starts[group] + (rng.random((n, STRIP_SIZE)) * sizes[group]).astype(np.int64)
+    occupied = (patterns[index][..., None] >> np.arange(9)) & 1  # (n, 6, 3, 9)
+
+    # Each column's 10 cells in strip order (ticket, then row) take a random
+    # permutation of its numbers; sorting by (ticket, number) puts every
+    # ticket's share top to bottom
+    cells = np.nonzero(occupied.transpose(0, 3, 1, 2).reshape(n * 9, -1))[1].reshape(n * 9, _COLUMN_SIZE)
+    tickets, rows = cells // 3, cells % 3
+    offsets = rng.random((n * 9, _COLUMN_SIZE)).argsort(axis=1)
+    offsets = np.sort(tickets * 16 + offsets, axis=1) & 15
+
+    columns = np.tile(np.repeat(np.arange(9), _COLUMN_SIZE), n)
+    strips = np.repeat(np.arange(n), 9 * _COLUMN_SIZE)
+    batch = np.zeros((n, STRIP_SIZE, 3, 9), dtype=np.int8)
+    batch[strips, tickets.ravel(), rows.ravel(), columns] = offsets.ravel() + _COLUMN_STARTS[columns]
+    return batch.reshape(n * STRIP_SIZE, 3, 9)
+
+
+def generate_strip_batch(n: int, seed=None) -> np.ndarray:
+    """
+    Generate `n` full strips as an (n * 6, 3, 9) int8 array.
+
+    Every run of 6 tickets holds 1-90 once. Same distribution as
+    BingoTicketGenerator.generate_strip, but not the same strips for a
+    given seed, so seed-addressed strips still come from generate_strip.
+    """
+    rng = np.random.default_rng(seed)
+    per_chunk = CHUNK_SIZE // STRIP_SIZE
+    batch = np.empty((n * STRIP_SIZE, 3, 9), dtype=np.int8)
+    for start in range(0, n, per_chunk):
+        stop = min(start + per_chunk, n)
+        batch[start * STRIP_SIZE:stop * STRIP_SIZE] = _generate_strip_chunk(stop - start, rng)
+    return batch
+
+
+def batch_to_grids(batch: np.ndarray) -> List[List[List[Optional[int]]]]:
+    """Convert a batch to the nested-list grids used by the API"""
+    return [[[cell or None for cell in row] for row in ticket] for ticket in batch.tolist()]
+
+
+def grids_to_batch(grids: List[List[List[Optional[int]]]]) -> np.ndarray:
+    """Convert nested-list grids to an (n, 3, 9) int8 batch"""
+    return np.array([[[cell or 0 for cell in row] for row in grid] for grid in grids], dtype=np.int8).reshape(-1, 3, 9)
+
+
+def validate_batch(batch: np.ndarray, require_sorted: bool = True) -> np.ndarray:
+    """
+    Vectorized ticket validation; returns one bool per ticket.
+
+    Checks the same rules as BingoTicketGenerator._verify_ticket (5 numbers
+    per row, 1-3 per column, numbers within their column's range, no
+    repeats) and, with `require_sorted`, that columns ascend top to bottom.
+    """
+    batch = batch.astype(np.int16)
+    filled = batch > 0
+
+    rows_ok = (filled.sum(axis=2) == 5).all(axis=1)
+    heights = filled.sum(axis=1)
+    columns_ok = ((heights >= 1) & (heights <= 3)).all(axis=1)
+
+    starts = _COLUMN_STARTS.astype(np.int16)
+    in_range = ~filled | ((batch >= starts) & (batch < starts + _COLUMN_SIZE))
+    range_ok = in_range.all(axis=(1, 2))
+
+    # Numbers of a column in top-to-bottom order with blanks skipped: compare
+    # every pair of filled cells (r1 < r2) in the same column
+    unique_ok = np.ones(len(batch), dtype=bool)
+    sorted_ok = np.ones(len(batch), dtype=bool)
+    for upper, lower in ((0, 1), (0, 2), (1, 2)):
+        both = filled[:, upper] & filled[:, lower]
+        unique_ok &= ~(both & (batch[:, upper] == batch[:, lower])).any(axis=1)
+        sorted_ok &= ~(both & (batch[:, upper] > batch[:, lower])).any(axis=1)
+
+    valid = rows_ok & columns_ok & range_ok & unique_ok
+    return valid & sorted_ok if require_sorted else valid
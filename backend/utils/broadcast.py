@@ -0,0 +1,198 @@
+import asyncio
+import json
+from collections import deque
+from typing import AsyncIterator, Deque, Dict, Optional, Tuple
+from uuid import uuid4
+
+# Comment line sent when a stream has been quiet this long; keeps proxies from
+# closing it and lets clients notice a dead connection
+HEARTBEAT_SECONDS = 15
+# Events kept per session so a reconnecting client can resume
+REPLAY_BUFFER_SIZE = 128
+# Reconnection delay suggested to EventSource clients
+RETRY_MS = 3000
+
+
+def sse_frame(event: str, data: str, event_id: Optional[str] = None) -> str:
+    """One Server-Sent Events message"""
+    id_line = f"id: {event_id}\n" if event_id is not None else ""
+    return f"{id_line}event: {event}\ndata: {data}\n\n"
+
+
+class SessionChannel:
+    """
+    The event stream of one game session.
+
+    Events are numbered from 1 and kept in a bounded replay buffer. The
+    token changes whenever the channel is recreated, so event ids from an
+    earlier channel (or an earlier server process) are never mistaken for
+    current ones.
+    """
+
+    def __init__(self, buffer_size: int = REPLAY_BUFFER_SIZE):
+        self.token = uuid4().hex[:8]
+        self.sequence = 0
+        self.events: Deque[Tuple[int, str]] = deque(maxlen=buffer_size)
+        self.subscribers = 0
+        self._changed = asyncio.Event()
+
+    def append(self, event: str, data: dict) -> None:
+        self.sequence += 1
+        payload = json.dumps(data, separators=(",", ":"))
+        self.events.append((self.sequence, sse_frame(event, payload, f"{self.token}:{self.sequence}")))
+        # Wake every waiting subscriber, then start a fresh event for the next wait
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    def resume_position(self, last_event_id: Optional[str]) -> Optional[int]:
+        """The sequence to resume after, or None if the buffer can't cover it"""
+        if not last_event_id:
+            return None
+        token, _, sequence = last_event_id.partition(":")
+        if token != self.token or not sequence.isdigit():
+            return None
+        position = int(sequence)
+        oldest = self.events[0][0] if self.events else self.sequence + 1
+        if position > self.sequence or position < oldest - 1:
+            return None
+        return position
+
+    def frames_after(self, position: int) -> str:
+        return "".join(frame for sequence, frame in self.events if sequence > position)
+
+    async def wait(self, timeout: float) -> bool:
+        """Wait for the next event; False on timeout"""
+        try:
+            await asyncio.wait_for(self._changed.wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+
+class Subscription:
+    """Where a new stream starts: its channel and the sequence to resume after (None: send a snapshot)"""
+
+    def __init__(self, session_code: str, channel: SessionChannel, position: Optional[int]):
+        self.session_code = session_code
+        self.channel = channel
+        self.position = position
+
+
+class SessionBroadcaster:
+    """
+    In-process fan-out of game session events to Server-Sent Events streams.
+
+    Handlers publish after they commit. Each event is serialized once into
+    the session's replay buffer; every stream then copies the frames after
+    its own position, so a slow client never holds up the others. A channel
+    exists only while someone is subscribed. Channels belong to the event
+    loop; other threads go through publish_threadsafe.
+    """
+
+    def __init__(self, heartbeat: float = HEARTBEAT_SECONDS, buffer_size: int = REPLAY_BUFFER_SIZE):
+        self.heartbeat = heartbeat
+        self.buffer_size = buffer_size
+        self._channels: Dict[str, SessionChannel] = {}
+        self._closed = False
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.connections = 0
+        self.peak_connections = 0
+        self.events_published = 0
+
+    def publish(self, session_code: str, event: str, data: dict) -> None:
+        """Send an event to every stream of a session (no-op when nobody listens)"""
+        channel = self._channels.get(session_code)
+        if channel is not None:
+            channel.append(event, data)
+            self.events_published += 1
+
+    def publish_threadsafe(self, session_code: str, event: str, data: dict) -> None:
+        """publish() from a worker thread: the event is appended on the streams' event loop"""
+        loop = self._loop
+        if loop is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(self.publish, session_code, event, data)
+
+    def listening(self, session_code: str) -> bool:
+        """Whether a session has open streams (a hint when read from another thread)"""
+        return session_code in self._channels
+
+    def subscribe(self, session_code: str, last_event_id: Optional[str] = None) -> Subscription:
+        """
+        Fix a new stream's starting point.
+
+        Call before reading the snapshot, so nothing published while it is
+        read is missed (events already in the snapshot may arrive again).
+        """
+        self._loop = asyncio.get_running_loop()
+        channel = self._channels.get(session_code)
+        if channel is None:
+            channel = self._channels[session_code] = SessionChannel(self.buffer_size)
+        return Subscription(session_code, channel, channel.resume_position(last_event_id))
+
+    def release(self, subscription: Subscription) -> None:
+        """Drop a subscription that will never stream (e.g. the session doesn't exist)"""
+        channel = subscription.channel
+        if channel.subscribers == 0 and self._channels.get(subscription.session_code) is channel:
+            del self._channels[subscription.session_code]
+
+    async def stream(self, subscription: Subscription, snapshot: Optional[str] = None) -> AsyncIterator[str]:
+        """
+        SSE frames for one client: a `state` snapshot when it can't resume,
+        then every event of the session, with heartbeats while quiet.
+        """
+        code = subscription.session_code
+        channel = self._channels.get(code)
+        if channel is None:
+            channel = self._channels[code] = SessionChannel(self.buffer_size)
+        position = subscription.position if channel is subscription.channel else None
+
+        channel.subscribers += 1
+        self.connections += 1
+        self.peak_connections = max(self.peak_connections, self.connections)
+        try:
+            yield f"retry: {RETRY_MS}\n\n"
+            if position is None:
+                if snapshot is not None and channel is subscription.channel:
+                    yield sse_frame("state", snapshot, f"{channel.token}:{channel.sequence}")
+                else:
+                    # The channel was replaced before the stream started; the client refetches
+                    yield sse_frame("resync", "{}", f"{channel.token}:{channel.sequence}")
+                position = channel.sequence
+
+            while True:
+                if channel.sequence > position:
+                    if channel.resume_position(f"{channel.token}:{position}") is None:
+                        # Fell behind the replay buffer
+                        yield sse_frame("resync", "{}", f"{channel.token}:{channel.sequence}")
+                    else:
+                        yield channel.frames_after(position)
+                    position = channel.sequence
+                    continue
+                if self._closed:
+                    return
+                if not await channel.wait(self.heartbeat):
+                    yield ": heartbeat\n\n"
+        finally:
+            channel.subscribers -= 1
+            self.connections -= 1
+            if channel.subscribers == 0 and self._channels.get(code) is channel:
+                del self._channels[code]
+
+    def close(self) -> None:
+        """End every stream after a final `close` event (server shutdown)"""
+        self._closed = True
+        for channel in self._channels.values():
+            channel.append("close", {})
+
+    def stats(self) -> dict:
+        return {
+            "connections": self.connections,
+            "peak_connections": self.peak_connections,
+            "channels": len(self._channels),
+            "events_published": self.events_published
+        }
+
+
+# Shared instance used by the session handlers
+session_broadcaster = SessionBroadcaster()
@@ -1,130 +1,282 @@
 import asyncio
 import logging
+import threading
+import time
 from datetime import datetime, timedelta
-from sqlmodel import Session, select, delete
+from typing import Dict, Optional
+
+from sqlalchemy import delete, func, insert, tuple_
+from sqlmodel import Session, select
 from database import engine
-from models.player import GameSession, PlayerTicket, Player
+from models.archive import ArchivedGame
+from models.player import GameSession, PlayerTicket, Player, SessionPlayer
+from utils.archive import GameArchive, game_archive, game_record
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Rows deleted per transaction; bounds how long each chunk holds the write lock
+CLEANUP_CHUNK_SIZE = 500
+# Pause between chunks so requests waiting on the write lock get in
+CHUNK_PAUSE_SECONDS = 0.01
+CLEANUP_INTERVAL_SECONDS = 12 * 60 * 60
+FINISHED_GAME_HOURS = 24
+# Players this new may not have generated tickets or joined a session yet
+ORPHAN_GRACE_MINUTES = 60
+
 
-def cleanup_finished_games(hours_threshold: int = 24) -> int:
+class CleanupWorker:
     """
-    Clean up finished games older than specified hours.
-    
-    Args:
-        hours_threshold: Games older than this many hours will be deleted (default: 24)
-        
-    Returns:
-        Number of games cleaned up
+    Archives finished games, then deletes them and orphaned players in
+    bounded chunks.
+
+    Every chunk is one set-based DELETE ... WHERE key IN (SELECT key ...
+    LIMIT n) in its own short transaction. The periodic task runs each
+    purge in a thread executor so the event loop keeps serving requests,
+    and progress is kept for the stats endpoint.
     """
-    cutoff_time = datetime.now() - timedelta(hours=hours_threshold)
-    cutoff_time_str = cutoff_time.isoformat()
-    
-    with Session(engine) as session:
-        # Find inactive sessions older than threshold
-        stmt = select(GameSession).where(
+
+    def __init__(
+        self,
+        chunk_size: int = CLEANUP_CHUNK_SIZE,
+        chunk_pause: float = CHUNK_PAUSE_SECONDS,
+        interval: float = CLEANUP_INTERVAL_SECONDS,
+        archive: GameArchive = game_archive
+    ):
+        self.chunk_size = chunk_size
+        self.chunk_pause = chunk_pause
+        self.interval = interval
+        self.archive = archive
+        self._run_lock = threading.Lock()
+
+        self.running = False
+        self.runs = 0
+        self.errors = 0
+        self.last_run_at: Optional[str] = None
+        self.last_duration_ms = 0.0
+        self.last_lag_seconds = 0.0
+        self.last_rows_deleted: Dict[str, int] = {}
+        self.total_rows_deleted: Dict[str, int] = {}
+        self.last_games_archived = 0
+        self.total_games_archived = 0
+        self.total_archived_bytes = 0
+        self.chunks = 0
+        self.last_chunk_ms = 0.0
+        self.max_chunk_ms = 0.0
+
+    def delete_in_chunks(self, model, key, *where) -> int:
+        """Delete the rows of `model` matching `where`, chunk by chunk; returns rows deleted"""
+        columns = key if isinstance(key, tuple) else (key,)
+        target = tuple_(*columns) if len(columns) > 1 else columns[0]
+        statement = delete(model).where(target.in_(select(*columns).where(*where).limit(self.chunk_size)))
+
+        deleted = 0
+        while True:
+            start = time.perf_counter()
+            with engine.begin() as connection:
+                rowcount = connection.execute(statement).rowcount
+            self._record_chunk(model.__tablename__, rowcount, (time.perf_counter() - start) * 1000)
+
+            deleted += rowcount
+            if rowcount < self.chunk_size:
+                return deleted
+            time.sleep(self.chunk_pause)
+
+    def _record_chunk(self, table: str, rowcount: int, elapsed_ms: float) -> None:
+        self.chunks += 1
+        self.last_chunk_ms = elapsed_ms
+        self.max_chunk_ms = max(self.max_chunk_ms, elapsed_ms)
+        self.last_rows_deleted[table] = self.last_rows_deleted.get(table, 0) + rowcount
+        self.total_rows_deleted[table] = self.total_rows_deleted.get(table, 0) + rowcount
+
+    def archive_finished_games(self, cutoff_time_str: str) -> int:
+        """
+        Append every finished game without a current archive entry to the
+        archive and index it; returns games archived.
+
+        Each game is read in its own short session, written to its segment,
+        then indexed in one small transaction.
+        """
+        unarchived = select(GameSession.id).where(
             GameSession.is_active == False,
-            GameSession.updated_at < cutoff_time_str
+            GameSession.last_activity_at < cutoff_time_str,
+            tuple_(GameSession.id, GameSession.session_code, GameSession.updated_at).not_in(
+                select(ArchivedGame.game_session_id, ArchivedGame.session_code, ArchivedGame.game_updated_at)
+            )
+        ).order_by(GameSession.id)
+        with Session(engine) as session:
+            game_session_ids = session.exec(unarchived).all()
+
+        for game_session_id in game_session_ids:
+            with Session(engine) as session:
+                record = game_record(session, session.get(GameSession, game_session_id))
+            entry = self.archive.append_game(record)
+            with engine.begin() as connection:
+                connection.execute(insert(ArchivedGame).values(**entry.model_dump(exclude={"id"})))
+
+            self.last_games_archived += 1
+            self.total_games_archived += 1
+            self.total_archived_bytes += entry.length
+        return len(game_session_ids)
+
+    def cleanup_finished_games(self, hours_threshold: int = FINISHED_GAME_HOURS) -> int:
+        """
+        Archive, then clean up finished games with no activity for the
+        specified hours (an indexed range scan on last_activity_at).
+
+        Only games whose archive entry matches their current state are
+        deleted. Tickets and memberships go first (foreign key order); a
+        purge that is interrupted part way is picked up by the next run.
+
+        Returns:
+            Number of games cleaned up
+        """
+        cutoff_time_str = (datetime.now() - timedelta(hours=hours_threshold)).isoformat()
+        self.archive_finished_games(cutoff_time_str)
+
+        archived = (
+            GameSession.is_active == False,
+            GameSession.last_activity_at < cutoff_time_str,
+            tuple_(GameSession.id, GameSession.session_code, GameSession.updated_at).in_(
+                select(ArchivedGame.game_session_id, ArchivedGame.session_code, ArchivedGame.game_updated_at)
+            )
+        )
+        finished = select(GameSession.id).where(*archived)
+
+        self.delete_in_chunks(PlayerTicket, PlayerTicket.id, PlayerTicket.game_session_id.in_(finished))
+        self.delete_in_chunks(
+            SessionPlayer,
+            (SessionPlayer.game_session_id, SessionPlayer.player_id),
+            SessionPlayer.game_session_id.in_(finished)
         )
-        
-        inactive_sessions = session.exec(stmt).all()
-        
-        if not inactive_sessions:
+        games_cleaned = self.delete_in_chunks(GameSession, GameSession.id, *archived)
+
+        if games_cleaned:
+            logger.info(f"Successfully archived and cleaned up {games_cleaned} finished games")
+        else:
             logger.info("No finished games to clean up")
-            return 0
-        
-        games_cleaned = 0
-        
-        for game_session in inactive_sessions:
-            try:
-                # Delete associated tickets first (foreign key constraint)
-                ticket_delete_stmt = delete(PlayerTicket).where(
-                    PlayerTicket.game_session_id == game_session.id
-                )
-                session.exec(ticket_delete_stmt)
-                
-                # Delete the game session
-                session.delete(game_session)
-                
-                games_cleaned += 1
-                logger.info(f"Cleaned up game session: {game_session.session_code}")
-                
-            except Exception as e:
-                logger.error(f"Error cleaning up game session {game_session.session_code}: {e}")
-                session.rollback()
-                continue
-        
-        # Commit all deletions
-        session.commit()
-        
-        logger.info(f"Successfully cleaned up {games_cleaned} finished games")
         return games_cleaned
 
+    def cleanup_orphaned_players(self, grace_minutes: int = ORPHAN_GRACE_MINUTES) -> int:
+        """
+        Clean up players who have no active sessions and no tickets.
 
-def cleanup_orphaned_players() -> int:
-    """
-    Clean up players who have no active sessions and no tickets.
-    
-    Returns:
-        Number of players cleaned up
-    """
-    with Session(engine) as session:
-        # Find players with no game sessions and no tickets
-        stmt = select(Player).where(
+        Players registered within the grace window are kept: the purge runs
+        alongside requests, so a player may be between creation and their
+        first tickets.
+
+        Returns:
+            Number of players cleaned up
+        """
+        cutoff_time_str = (datetime.now() - timedelta(minutes=grace_minutes)).isoformat()
+        players_cleaned = self.delete_in_chunks(
+            Player,
+            Player.id,
             ~Player.game_sessions.any(),  # No game sessions
             ~Player.tickets.any(),        # No tickets
-            Player.is_admin == False      # Not an admin
+            Player.is_admin == False,     # Not an admin
+            Player.created_at < cutoff_time_str
         )
-        
-        orphaned_players = session.exec(stmt).all()
-        
-        if not orphaned_players:
+
+        if players_cleaned:
+            logger.info(f"Successfully cleaned up {players_cleaned} orphaned players")
+        else:
             logger.info("No orphaned players to clean up")
-            return 0
-        
-        players_cleaned = 0
-        
-        for player in orphaned_players:
+        return players_cleaned
+
+    def finished_game_lag(self, hours_threshold: int = FINISHED_GAME_HOURS) -> float:
+        """Seconds the oldest finished game has been overdue for deletion (0 when caught up)"""
+        with Session(engine) as session:
+            oldest = session.exec(
+                select(func.min(GameSession.last_activity_at)).where(GameSession.is_active == False)
+            ).one()
+        if oldest is None:
+            return 0.0
+        due = datetime.fromisoformat(oldest) + timedelta(hours=hours_threshold)
+        return max(0.0, (datetime.now() - due).total_seconds())
+
+    def run_once(self, hours_threshold: int = FINISHED_GAME_HOURS) -> dict:
+        """One full purge (blocking; call from a thread). Runs never overlap."""
+        with self._run_lock:
+            self.running = True
+            self.last_rows_deleted = {}
+            self.last_games_archived = 0
+            start = time.perf_counter()
             try:
-                session.delete(player)
-                players_cleaned += 1
-                logger.info(f"Cleaned up orphaned player: {player.name} ({player.player_id})")
-                
+                self.last_lag_seconds = self.finished_game_lag(hours_threshold)
+                games_cleaned = self.cleanup_finished_games(hours_threshold)
+                players_cleaned = self.cleanup_orphaned_players()
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.running = False
+                self.runs += 1
+                self.last_run_at = datetime.now().isoformat()
+                self.last_duration_ms = (time.perf_counter() - start) * 1000
+
+        logger.info(
+            f"Cleanup completed: {games_cleaned} games, {players_cleaned} players removed "
+            f"in {self.last_duration_ms:.0f}ms"
+        )
+        return {
+            "games_cleaned": games_cleaned,
+            "players_cleaned": players_cleaned,
+            "timestamp": self.last_run_at
+        }
+
+    async def run(self) -> None:
+        """Background task: purge every interval, off the event loop"""
+        while True:
+            try:
+                logger.info("Starting periodic database cleanup...")
+                await asyncio.get_running_loop().run_in_executor(None, self.run_once)
             except Exception as e:
-                logger.error(f"Error cleaning up player {player.player_id}: {e}")
-                session.rollback()
-                continue
-        
-        session.commit()
-        
-        logger.info(f"Successfully cleaned up {players_cleaned} orphaned players")
-        return players_cleaned
+                logger.error(f"Error during periodic cleanup: {e}")
+
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        """Rows deleted, games archived, run duration, lag and chunk lock times"""
+        return {
+            "running": self.running,
+            "runs": self.runs,
+            "errors": self.errors,
+            "last_run_at": self.last_run_at,
+            "last_duration_ms": self.last_duration_ms,
+            "last_lag_seconds": self.last_lag_seconds,
+            "last_rows_deleted": dict(self.last_rows_deleted),
+            "total_rows_deleted": dict(self.total_rows_deleted),
+            "last_games_archived": self.last_games_archived,
+            "total_games_archived": self.total_games_archived,
+            "total_archived_bytes": self.total_archived_bytes,
+            "chunk_size": self.chunk_size,
+            "chunks": self.chunks,
+            "last_chunk_ms": self.last_chunk_ms,
+            "max_chunk_ms": self.max_chunk_ms
+        }
+
+
+# Shared instance used by the app
+cleanup_worker = CleanupWorker()
+
+
+def cleanup_finished_games(hours_threshold: int = FINISHED_GAME_HOURS) -> int:
+    """Archive and clean up finished games older than specified hours (blocking)"""
+    return cleanup_worker.cleanup_finished_games(hours_threshold)
+
+
+def cleanup_orphaned_players(grace_minutes: int = ORPHAN_GRACE_MINUTES) -> int:
+    """Clean up players who have no active sessions and no tickets (blocking)"""
+    return cleanup_worker.cleanup_orphaned_players(grace_minutes)
 
 
 async def periodic_cleanup_task():
     """
     Background task that runs cleanup every 12 hours.
     """
-    while True:
-        try:
-            logger.info("Starting periodic database cleanup...")
-            
-            # Clean up finished games older than 24 hours
-            games_cleaned = cleanup_finished_games(hours_threshold=24)
-            
-            # Clean up orphaned players
-            players_cleaned = cleanup_orphaned_players()
-            
-            logger.info(f"Cleanup completed: {games_cleaned} games, {players_cleaned} players removed")
-            
-        except Exception as e:
-            logger.error(f"Error during periodic cleanup: {e}")
-        
-        # Wait 12 hours before next cleanup (43200 seconds)
-        await asyncio.sleep(12 * 60 * 60)
+    await cleanup_worker.run()
 
 
 def manual_cleanup():
@@ -133,14 +285,4 @@ def manual_cleanup():
     Useful for testing or one-time cleanup operations.
     """
     logger.info("Running manual database cleanup...")
-    
-    games_cleaned = cleanup_finished_games(hours_threshold=24)
-    players_cleaned = cleanup_orphaned_players()
-    
-    logger.info(f"Manual cleanup completed: {games_cleaned} games, {players_cleaned} players removed")
-    
-    return {
-        "games_cleaned": games_cleaned,
-        "players_cleaned": players_cleaned,
-        "timestamp": datetime.now().isoformat()
-    }
+    return cleanup_worker.run_once()
@@ -0,0 +1,99 @@
+import base64
+from typing import Iterator, Optional
+
+from sqlalchemy import Select, func, tuple_
+from sqlmodel import Session, select
+
+from models.player import Player
+from schemas.multiplayer import PlayerResponse
+
+# Players read per query when streaming the whole directory
+DIRECTORY_CHUNK_SIZE = 1_000
+
+# SQLite's lower() only folds ASCII; keys computed here must match it
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+# Name-search cursors are "<lowercased name>|<player_id>" in URL-safe base64
+# (names need not be header-safe); player IDs never contain "|"
+CURSOR_SEPARATOR = "|"
+
+
+def name_key(name: str) -> str:
+    """A name as SQLite's lower() sees it"""
+    return name.translate(_ASCII_LOWER)
+
+
+def _prefix_range(column, prefix: str) -> tuple:
+    """column >= prefix AND column < the next prefix, a range an index can seek"""
+    upper = prefix[:-1] + chr(ord(prefix[-1]) + 1)
+    return column >= prefix, column < upper
+
+
+def directory_query(
+    limit: int,
+    after: Optional[str] = None,
+    name_prefix: Optional[str] = None,
+    id_prefix: Optional[str] = None
+) -> Select:
+    """
+    One keyset page of the player directory.
+
+    Without a name search players are ordered by player_id (unique index).
+    A name search is case-insensitive and walks the (lower(name), player_id)
+    index, so every page is a single index range scan however deep it is.
+    Raises ValueError for a malformed name-search cursor.
+    """
+    query = select(Player)
+
+    if id_prefix:
+        query = query.where(*_prefix_range(Player.player_id, id_prefix.upper()))
+
+    if name_prefix:
+        lower_name = func.lower(Player.name)
+        query = query.where(*_prefix_range(lower_name, name_key(name_prefix)))
+        if after is not None:
+            after_name, _, after_id = base64.urlsafe_b64decode(after).decode().rpartition(CURSOR_SEPARATOR)
+            query = query.where(tuple_(lower_name, Player.player_id) > tuple_(after_name, after_id))
+        return query.order_by(lower_name, Player.player_id).limit(limit)
+
+    if after is not None:
+        query = query.where(Player.player_id > after)
+    return query.order_by(Player.player_id).limit(limit)
+
+
+def directory_cursor(player: Player, name_prefix: Optional[str] = None) -> str:
+    """Cursor that continues a directory listing after `player`"""
+    if name_prefix:
+        return base64.urlsafe_b64encode(
+            f"{name_key(player.name)}{CURSOR_SEPARATOR}{player.player_id}".encode()
+        ).decode()
+    return player.player_id
+
+
+def player_response(player: Player) -> PlayerResponse:
+    return PlayerResponse(
+        id=player.id,
+        player_id=player.player_id,
+        name=player.name,
+        is_admin=player.is_admin,
+        created_at=player.created_at
+    )
+
+
+def directory_ndjson(
+    session: Session,
+    name_prefix: Optional[str] = None,
+    id_prefix: Optional[str] = None,
+    chunk_size: int = DIRECTORY_CHUNK_SIZE
+) -> Iterator[str]:
+    """Stream every matching player as NDJSON, one keyset page in memory at a time"""
+    after = None
+    while True:
+        players = session.exec(directory_query(chunk_size, after, name_prefix, id_prefix)).all()
+        if not players:
+            return
+        yield "".join(player_response(player).model_dump_json() + "\n" for player in players)
+        if len(players) < chunk_size:
+            return
+        after = directory_cursor(players[-1], name_prefix)
+        session.expunge_all()
@@ -0,0 +1,154 @@
+import random
+from datetime import datetime
+from typing import List, Optional
+
+from sqlalchemy import update
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import GameSession
+from utils.membership import UNSYNCHRONIZED
+
+NUMBER_COUNT = 90
+CALLED_MASK_BYTES = 12  # 90 bits, bit n - 1 for number n
+
+# The whole draw is fixed when the game starts, so use the OS generator
+_draw_random = random.SystemRandom()
+
+
+def new_draw_order() -> bytes:
+    """A shuffled 1-90 draw, one byte per number"""
+    numbers = list(range(1, NUMBER_COUNT + 1))
+    _draw_random.shuffle(numbers)
+    return bytes(numbers)
+
+
+def _mask_of(numbers: List[int]) -> bytes:
+    mask = 0
+    for number in numbers:
+        mask |= 1 << (number - 1)
+    return mask.to_bytes(CALLED_MASK_BYTES, "big")
+
+
+def reset_draw(game_session: GameSession) -> None:
+    """Start a fresh draw with nothing called"""
+    game_session.draw_order = new_draw_order()
+    game_session.draw_cursor = 0
+    game_session.called_mask = bytes(CALLED_MASK_BYTES)
+    game_session.current_number = None
+    game_session.called_numbers = None
+    game_session.remaining_numbers = None
+
+
+def _converted_draw(called: List[int]) -> dict:
+    """Draw columns of a session created before draw_order, keeping the numbers already called"""
+    remaining = [number for number in range(1, NUMBER_COUNT + 1) if number not in set(called)]
+    _draw_random.shuffle(remaining)
+    return {
+        "draw_order": bytes(called + remaining),
+        "draw_cursor": len(called),
+        "called_mask": _mask_of(called),
+        "called_numbers": None,
+        "remaining_numbers": None
+    }
+
+
+def ensure_draw_order(game_session: GameSession) -> None:
+    """Move a session created before draw_order onto it, keeping the numbers already called"""
+    if game_session.draw_order is not None:
+        return
+    for column, value in _converted_draw(list(game_session.called_numbers or [])).items():
+        setattr(game_session, column, value)
+
+
+def is_called(game_session: GameSession, number: int) -> bool:
+    """O(1) membership test against the called-number mask"""
+    if game_session.called_mask is None:
+        return number in (game_session.called_numbers or [])
+    index = number - 1
+    return bool(game_session.called_mask[CALLED_MASK_BYTES - 1 - index // 8] >> (index % 8) & 1)
+
+
+def called_numbers(game_session: GameSession) -> List[int]:
+    """Numbers called so far, in call order"""
+    if game_session.draw_order is None:
+        return list(game_session.called_numbers or [])
+    return list(game_session.draw_order[:game_session.draw_cursor])
+
+
+def remaining_count(game_session: GameSession) -> int:
+    if game_session.draw_order is None:
+        return NUMBER_COUNT - len(game_session.called_numbers or [])
+    return NUMBER_COUNT - game_session.draw_cursor
+
+
+def remaining_numbers(game_session: GameSession) -> List[int]:
+    """Numbers not yet called, ascending (never the upcoming draw order)"""
+    return [number for number in range(1, NUMBER_COUNT + 1) if not is_called(game_session, number)]
+
+
+def call_next(game_session: GameSession) -> int:
+    """Advance the draw by one number; the caller checks remaining_count first"""
+    if game_session.draw_order is None:
+        ensure_draw_order(game_session)
+    cursor = game_session.draw_cursor
+    number = game_session.draw_order[cursor]
+    mask = int.from_bytes(game_session.called_mask, "big") | 1 << (number - 1)
+    game_session.called_mask = mask.to_bytes(CALLED_MASK_BYTES, "big")
+    game_session.draw_cursor = cursor + 1
+    game_session.current_number = number
+    return number
+
+
+async def advance_draw(session: AsyncSession, game_session: GameSession) -> Optional[int]:
+    """
+    Call the next number of a session's draw; None when none remain.
+
+    The cursor moves in one UPDATE, so concurrent calls each get their own
+    number. That UPDATE holds the write lock until commit, so the called
+    mask rebuilt from the called prefix can't interleave with another call.
+    `game_session` is brought up to date without being marked changed. The
+    caller commits.
+    """
+    if game_session.draw_order is None:
+        # Whichever concurrent call converts the session first wins
+        await session.execute(
+            update(GameSession)
+            .where(GameSession.id == game_session.id, GameSession.draw_order == None)
+            .values(**_converted_draw(list(game_session.called_numbers or []))),
+            execution_options=UNSYNCHRONIZED
+        )
+
+    now = datetime.now().isoformat()
+    advanced = (await session.execute(
+        update(GameSession)
+        .where(GameSession.id == game_session.id, GameSession.draw_cursor < NUMBER_COUNT)
+        .values(
+            draw_cursor=GameSession.draw_cursor + 1,
+            updated_at=now,
+            last_activity_at=now,
+            version=GameSession.version + 1
+        )
+        .returning(GameSession.draw_cursor, GameSession.draw_order, GameSession.version),
+        execution_options=UNSYNCHRONIZED
+    )).first()
+    if advanced is None:
+        return None
+
+    cursor, draw_order, version = advanced
+    number = draw_order[cursor - 1]
+    called_mask = _mask_of(list(draw_order[:cursor]))
+    await session.execute(
+        update(GameSession)
+        .where(GameSession.id == game_session.id)
+        .values(called_mask=called_mask, current_number=number),
+        execution_options=UNSYNCHRONIZED
+    )
+
+    for column, value in {
+        "draw_order": draw_order, "draw_cursor": cursor, "called_mask": called_mask, "current_number": number,
+        "called_numbers": None, "remaining_numbers": None, "updated_at": now, "last_activity_at": now,
+        "version": version
+    }.items():
+        set_committed_value(game_session, column, value)
+    return number
@@ -0,0 +1,81 @@
+import csv
+import io
+import json
+from datetime import date
+from typing import Iterator, List, Optional, Tuple
+
+from sqlalchemy import insert
+from sqlmodel import Session
+
+from utils.batch import batch_to_grids
+from utils.generation_service import generation_service
+from utils.generator import BingoTicketGenerator, Grid
+from utils.persistence import ticket_rows
+from utils.retention import ticket_partitions
+
+# Tickets generated, serialized (and inserted) per step; bounds memory per export
+EXPORT_CHUNK_SIZE = 10_000
+MAX_EXPORT_COUNT = 1_000_000
+
+CSV_HEADER = [f"r{row + 1}c{col + 1}" for row in range(3) for col in range(9)]
+
+
+def iter_ticket_chunks(
+    count: int,
+    mode: str = "single",
+    session: Optional[Session] = None,
+    chunk_size: int = EXPORT_CHUNK_SIZE
+) -> Iterator[Tuple[Optional[List[str]], List[Grid]]]:
+    """
+    Lazily generate `count` tickets as (ids, grids) chunks.
+
+    Without a session tickets come from the generation service's vectorized
+    chunks (generated ahead on its process pool when there is more than one
+    CPU) and ids are None; strip-mode chunks hold whole strips. With a
+    session tickets are seed-addressed and each chunk is written to today's
+    Ticket partition in one executemany insert before it is yielded, so an
+    interrupted export keeps every ticket already sent.
+    """
+    if session is None:
+        for batch in generation_service.iter_arrays(count, mode, chunk_size):
+            yield None, batch_to_grids(batch)
+        return
+
+    for start in range(0, count, chunk_size):
+        size = min(chunk_size, count - start)
+        seeded_tickets = BingoTicketGenerator.generate_seeded_tickets(size, mode)
+        rows = ticket_rows(seeded_tickets)
+        session.execute(insert(ticket_partitions.ensure(date.today())), rows)
+        session.commit()
+        yield [str(row["id"]) for row in rows], [grid for _, _, grid in seeded_tickets]
+
+
+def ndjson_chunks(chunks: Iterator[Tuple[Optional[List[str]], List[Grid]]]) -> Iterator[str]:
+    """Serialize ticket chunks as NDJSON, one {"index", ["id"], "grid"} object per line"""
+    index = 0
+    for ids, grids in chunks:
+        lines = []
+        for offset, grid in enumerate(grids):
+            line = {"index": index + offset, "grid": grid}
+            if ids is not None:
+                line["id"] = ids[offset]
+            lines.append(json.dumps(line, separators=(",", ":")))
+        index += len(grids)
+        yield "\n".join(lines) + "\n"
+
+
+def csv_chunks(chunks: Iterator[Tuple[Optional[List[str]], List[Grid]]], with_ids: bool = False) -> Iterator[str]:
+    """Serialize ticket chunks as CSV: index, optional id, then 27 cells row by row (blank cells empty)"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\n")
+    writer.writerow(["index"] + (["id"] if with_ids else []) + CSV_HEADER)
+
+    index = 0
+    for ids, grids in chunks:
+        for offset, grid in enumerate(grids):
+            prefix = [index + offset] + ([ids[offset]] if with_ids else [])
+            writer.writerow(prefix + grid[0] + grid[1] + grid[2])
+        index += len(grids)
+        yield buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
@@ -0,0 +1,97 @@
+from typing import Callable, Iterable, List, Optional, Set, Tuple
+
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import PlayerTicket
+from utils.generator import (
+    PY_RANDOM_STRIP_GENERATOR_VERSION, STRIP_GENERATOR_VERSION, FingerprintedTicket, Grid, SeededTicket
+)
+
+# 90 bits, one per number 1-90
+FINGERPRINT_BYTES = 12
+
+# Bound on regeneration rounds; a second collision for the same slot is
+# already astronomically unlikely
+MAX_ROUNDS = 10
+
+_STRIP_VERSIONS = (STRIP_GENERATOR_VERSION, PY_RANDOM_STRIP_GENERATOR_VERSION)
+
+
+def ticket_fingerprint(grid: Grid) -> bytes:
+    """Canonical fingerprint of a ticket: the set of its numbers as a 90-bit mask"""
+    mask = 0
+    for row in grid:
+        for number in row:
+            if number is not None:
+                mask |= 1 << (number - 1)
+    return mask.to_bytes(FINGERPRINT_BYTES, "big")
+
+
+async def session_fingerprints(session: AsyncSession, game_session_id: int, fingerprints: Iterable[bytes]) -> Set[bytes]:
+    """Which of `fingerprints` already exist in a game session (indexed lookup)"""
+    fingerprints = list(fingerprints)
+    if not fingerprints:
+        return set()
+    return set((await session.exec(
+        select(PlayerTicket.fingerprint).where(
+            PlayerTicket.game_session_id == game_session_id,
+            PlayerTicket.fingerprint.in_(fingerprints)
+        )
+    )).all())
+
+
+def _replacement_groups(tickets: List[FingerprintedTicket], collisions: List[int]) -> List[Tuple[str, List[int]]]:
+    """
+    (mode, indices) to regenerate together: colliding single tickets in one
+    group, and every ticket of a colliding ticket's strip in a group of its
+    own, so the replacements again come from one strip and cover 1-90 together.
+    """
+    singles = [index for index in collisions if tickets[index][1] not in _STRIP_VERSIONS]
+    strips = dict.fromkeys(
+        (tickets[index][1], tickets[index][0] >> 3) for index in collisions if tickets[index][1] in _STRIP_VERSIONS
+    )
+    groups = [("single", singles)] if singles else []
+    for strip in strips:
+        groups.append(("strip", [
+            index for index, (seed, version, _, _) in enumerate(tickets)
+            if version in _STRIP_VERSIONS and (version, seed >> 3) == strip
+        ]))
+    return groups
+
+
+async def ensure_unique_tickets(
+    session: AsyncSession,
+    game_session_id: Optional[int],
+    tickets: List[SeededTicket],
+    regenerate: Callable[[int, str], List[SeededTicket]]
+) -> List[FingerprintedTicket]:
+    """
+    Return `tickets` with fingerprints, regenerating any that duplicate a
+    ticket already in the session or an earlier ticket of the same batch.
+
+    Without a session only duplicates inside the batch are replaced. A
+    colliding strip ticket is replaced with the rest of its strip;
+    `regenerate(count, mode)` produces the replacements.
+    """
+    result = [(seed, version, grid, ticket_fingerprint(grid)) for seed, version, grid in tickets]
+
+    for _ in range(MAX_ROUNDS):
+        taken = (
+            await session_fingerprints(session, game_session_id, (t[3] for t in result))
+            if game_session_id is not None else set()
+        )
+        collisions = []
+        for index, ticket in enumerate(result):
+            if ticket[3] in taken:
+                collisions.append(index)
+            else:
+                taken.add(ticket[3])
+        if not collisions:
+            return result
+
+        for mode, group in _replacement_groups(result, collisions):
+            for index, (seed, version, grid) in zip(group, regenerate(len(group), mode)):
+                result[index] = (seed, version, grid, ticket_fingerprint(grid))
+
+    raise RuntimeError("Could not generate tickets unique within the session")
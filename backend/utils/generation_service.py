@@ -0,0 +1,169 @@
+import asyncio
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from utils.batch import batch_to_grids, generate_batch, generate_strip_batch
+from utils.generator import BingoTicketGenerator, STRIP_SIZE, Grid, SeededTicket
+
+# Orders up to this size are generated in-process (on a thread when awaited);
+# sharding them would cost more in process hand-off than the generation itself
+INLINE_THRESHOLD = 5_000
+
+# Upper bound on tickets per shard, keeps results streaming back evenly
+MAX_SHARD_SIZE = 250_000
+
+
+def _generate_shard(count: int, mode: str, seed: np.random.SeedSequence) -> np.ndarray:
+    """Worker entry point: generate one shard as an (count, 3, 9) int8 array"""
+    if mode == "strip":
+        return generate_strip_batch(-(-count // STRIP_SIZE), seed=seed)[:count]
+    return generate_batch(count, seed=seed)
+
+
+def _to_array(grids: List[Grid]) -> np.ndarray:
+    """Pack grids as int8 for a cheap hand-off between processes"""
+    return np.array([[[cell or 0 for cell in row] for row in grid] for grid in grids], dtype=np.int8)
+
+
+def _generate_seeded_shard(count: int, mode: str) -> Tuple[List[int], List[int], np.ndarray]:
+    """Worker entry point: generate one shard of seed-addressed tickets"""
+    tickets = BingoTicketGenerator.generate_seeded_tickets(count, mode)
+    return [t[0] for t in tickets], [t[1] for t in tickets], _to_array([t[2] for t in tickets])
+
+
+def _merge_seeded(shards: List[Tuple[List[int], List[int], np.ndarray]]) -> List[SeededTicket]:
+    """Join seeded shards back into (seed, version, grid) tuples"""
+    tickets = []
+    for seeds, versions, grids in shards:
+        tickets.extend(zip(seeds, versions, batch_to_grids(grids)))
+    return tickets
+
+
+class TicketGenerationService:
+    """
+    Generates large ticket orders on a process pool.
+
+    Orders above INLINE_THRESHOLD are split into shards, one independent
+    SeedSequence stream per shard, generated in worker processes and merged
+    in order. Small orders stay in-process.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None, inline_threshold: int = INLINE_THRESHOLD):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.inline_threshold = inline_threshold
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> Executor:
+        """The worker pool, started on first use"""
+        if self._pool is None:
+            # spawn keeps workers clear of the server's threads and event loop
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return self._pool
+
+    def shutdown(self) -> None:
+        """Stop the worker pool (it restarts on next use)"""
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def _shards(self, count: int, mode: str, seed: Optional[int]) -> List[Tuple[int, str, np.random.SeedSequence]]:
+        """Split an order into per-worker shards with independent seeds"""
+        shard_count = max(self.max_workers, -(-count // MAX_SHARD_SIZE))
+        shard_size = -(-count // shard_count)
+        if mode == "strip":
+            # Keep strips whole inside a shard
+            shard_size = -(-shard_size // STRIP_SIZE) * STRIP_SIZE
+
+        sizes = []
+        remaining = count
+        while remaining > 0:
+            sizes.append(min(shard_size, remaining))
+            remaining -= sizes[-1]
+
+        seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+        return [(size, mode, shard_seed) for size, shard_seed in zip(sizes, seeds)]
+
+    def generate_array(self, count: int, mode: str = "single", seed: Optional[int] = None) -> np.ndarray:
+        """Generate `count` tickets as an int8 array, blocking until done"""
+        if count <= self.inline_threshold:
+            return _generate_shard(count, mode, np.random.SeedSequence(seed))
+        shards = self._shards(count, mode, seed)
+        return np.concatenate(list(self.pool.map(_generate_shard, *zip(*shards))))
+
+    def iter_arrays(self, count: int, mode: str = "single", chunk_size: int = INLINE_THRESHOLD) -> Iterator[np.ndarray]:
+        """
+        Generate `count` tickets as consecutive int8 chunks, in order.
+
+        Up to max_workers chunks are generated ahead on the pool while the
+        caller works on the current one. With a single worker chunks are
+        generated inline, where the process hand-off would only add cost.
+        Strip-mode chunks hold whole strips.
+        """
+        if mode == "strip":
+            chunk_size = max(STRIP_SIZE, chunk_size - chunk_size % STRIP_SIZE)
+        sizes = [min(chunk_size, count - start) for start in range(0, count, chunk_size)]
+        seeds = np.random.SeedSequence().spawn(len(sizes))
+
+        if self.max_workers == 1:
+            for size, seed in zip(sizes, seeds):
+                yield _generate_shard(size, mode, seed)
+            return
+
+        pending = deque()
+        try:
+            for size, seed in zip(sizes, seeds):
+                pending.append(self.pool.submit(_generate_shard, size, mode, seed))
+                if len(pending) > self.max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            # The consumer stopped early (e.g. the client went away)
+            for future in pending:
+                future.cancel()
+
+    def generate(self, count: int, mode: str = "single") -> List[Grid]:
+        """Generate `count` tickets as nested-list grids, blocking until done"""
+        if count <= self.inline_threshold:
+            return BingoTicketGenerator.generate_tickets(count, mode)
+        return batch_to_grids(self.generate_array(count, mode))
+
+    async def agenerate(self, count: int, mode: str = "single") -> List[Grid]:
+        """Generate `count` tickets without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        if count <= self.inline_threshold:
+            # Small orders only need a worker thread, not a process hand-off
+            return await loop.run_in_executor(None, BingoTicketGenerator.generate_tickets, count, mode)
+
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.pool, _generate_shard, *shard)
+            for shard in self._shards(count, mode, None)
+        ))
+        # The list conversion is pure Python work, keep it off the loop too
+        return await loop.run_in_executor(None, batch_to_grids, np.concatenate(results))
+
+    async def agenerate_seeded(self, count: int, mode: str = "single") -> List[SeededTicket]:
+        """Generate `count` seed-addressed tickets as (seed, version, grid) without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        if count <= self.inline_threshold:
+            return await loop.run_in_executor(None, BingoTicketGenerator.generate_seeded_tickets, count, mode)
+
+        # Seeds come from each worker's own entropy, so only shard sizes are needed
+        results = await asyncio.gather(*(
+            loop.run_in_executor(self.pool, _generate_seeded_shard, size, shard_mode)
+            for size, shard_mode, _ in self._shards(count, mode, None)
+        ))
+        return await loop.run_in_executor(None, _merge_seeded, results)
+
+
+# Shared instance used by the routers
+generation_service = TicketGenerationService()
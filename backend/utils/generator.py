@@ -1,17 +1,333 @@
 import random
-from typing import List, Optional, Set
+import secrets
+from array import array
+from bisect import bisect_right
+from functools import lru_cache, partial
+from hashlib import shake_128
+from itertools import chain, combinations, count
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+
+import numpy as np
+
+# Ticket types shared by every module that handles tickets
+Grid = List[List[Optional[int]]]
+# (seed, version, grid), as generate_seeded_tickets produces
+SeededTicket = Tuple[int, int, Grid]
+# (seed, version, grid, fingerprint), as ensure_unique_tickets returns
+FingerprintedTicket = Tuple[int, int, Grid, bytes]
+
+
+# Column ranges (inclusive) shared by every generation path
+COLUMN_RANGES = [
+    (1, 10), (11, 20), (21, 30), (31, 40), (41, 50),
+    (51, 60), (61, 70), (71, 80), (81, 90)
+]
+
+_COLUMN_NUMBERS = [tuple(range(min_val, max_val + 1)) for min_val, max_val in COLUMN_RANGES]
+_FULL_MASK = (1 << 9) - 1
+
+# Rows occupied in a column, indexed by the column's 3-bit occupancy (bit r = row r)
+_ROWS_FOR_BITS = [tuple(row for row in range(3) if bits >> row & 1) for bits in range(8)]
+
+
+def _build_layout_table() -> Tuple[List[Tuple[int, int]], List[int], Dict[int, Tuple[int, ...]]]:
+    """
+    Precompute every valid 3x9 occupancy pattern.
+
+    A pattern is three 9-bit row masks (bit c set = column c holds a number)
+    with 5 bits per row and every column covered at least once; with three
+    rows a column can never hold more than 3. Instead of materialising all
+    patterns, the table stores each (row 0, row 1) pair together with the
+    row-2 masks that complete it, so a uniform index over all patterns maps
+    to a pair by bisecting the cumulative counts.
+    """
+    row_masks = [sum(1 << col for col in cols) for cols in combinations(range(9), 5)]
+
+    # Row masks that contain every column of a required mask
+    supersets = {
+        required: tuple(mask for mask in row_masks if mask & required == required)
+        for required in range(_FULL_MASK + 1)
+    }
+
+    pairs = []
+    cumulative = []
+    total = 0
+    for first in row_masks:
+        for second in row_masks:
+            completions = supersets[_FULL_MASK & ~(first | second)]
+            if completions:
+                total += len(completions)
+                pairs.append((first, second))
+                cumulative.append(total)
+
+    return pairs, cumulative, supersets
+
+
+_LAYOUT_PAIRS, _LAYOUT_CUMULATIVE, _LAYOUT_COMPLETIONS = _build_layout_table()
+LAYOUT_COUNT = _LAYOUT_CUMULATIVE[-1]
+
+# Strip layout: 6 tickets share all 90 numbers, so every column's 10 numbers
+# are split 1-3 per ticket and every ticket still holds 15 numbers.
+STRIP_SIZE = 6
+
+# A ticket's column heights packed as base-4 digits (digit c = numbers in column c)
+_HEIGHT_WEIGHTS = [4 ** col for col in range(9)]
+_BASE_HEIGHTS = sum(_HEIGHT_WEIGHTS)
+_MASK_HEIGHTS = [sum(_HEIGHT_WEIGHTS[col] for col in range(9) if mask >> col & 1) for mask in range(_FULL_MASK + 1)]
+
+# Extras a ticket can take in a column, indexed [column][extras still needed]:
+# (forced, optional). Forced extras are the ones the remaining columns, at
+# most 2 each, could no longer absorb.
+_STRIP_EXTRAS = [
+    [
+        (max(0, needed - 2 * (8 - col)), min(2, needed) - max(0, needed - 2 * (8 - col)))
+        for needed in range(7)
+    ]
+    for col in range(9)
+]
+
+
+@lru_cache(maxsize=None)
+def _layouts_by_heights() -> Dict[int, array]:
+    """
+    Group every layout-table pattern by its packed column heights.
+
+    Patterns are stored as 27-bit ints (row r in bits 9r..9r+8). Built on
+    the first strip request rather than at import since it walks all
+    735,210 patterns.
+    """
+    groups: Dict[int, array] = {}
+    for first, second in _LAYOUT_PAIRS:
+        heights = _MASK_HEIGHTS[first] + _MASK_HEIGHTS[second]
+        packed = first | second << 9
+        for third in _LAYOUT_COMPLETIONS[_FULL_MASK & ~(first | second)]:
+            group = groups.get(heights + _MASK_HEIGHTS[third])
+            if group is None:
+                group = groups[heights + _MASK_HEIGHTS[third]] = array("l")
+            group.append(packed | third << 18)
+    return groups
+
+
+# Seed-addressed tickets: a stored (seed, generator version) pair rebuilds the
+# grid exactly. A version pins the algorithm, random stream included; bump it
+# (and keep decoding the old one) whenever output for a given seed would change.
+GENERATOR_VERSION = 3  # single ticket: generate_ticket(SeedRandom(seed))
+STRIP_GENERATOR_VERSION = 4  # ticket seed & 7 of generate_strip(SeedRandom(seed >> 3))
+# Earlier tickets drew from CPython's random.Random, which the interpreter
+# defines; still decoded, and pinned by test_generator_seeds.py
+PY_RANDOM_GENERATOR_VERSION = 1
+PY_RANDOM_STRIP_GENERATOR_VERSION = 2
+SEED_BITS = 63  # fits a signed 64-bit SQLite INTEGER
+
+# Rebuilt grids kept for hot tickets
+SEED_CACHE_SIZE = 65536
+
+
+# Floats per block of a seed's random stream (one hash call each)
+SEED_BLOCK_SIZE = 64
+
+
+def _seed_block(key: bytes, index: int) -> List[float]:
+    """Block `index` of a seed's stream: the top 53 bits of each little-endian 64-bit word of SHAKE128(key, index)"""
+    digest = shake_128(key + index.to_bytes(8, "little")).digest(8 * SEED_BLOCK_SIZE)
+    # Below 2**53, so converted to float exactly
+    return ((np.frombuffer(digest, "<u8") >> 11) * 2.0 ** -53).tolist()
+
+
+class SeedRandom:
+    """
+    The random stream of a ticket seed, defined here rather than by the
+    interpreter: SHAKE128 of (seed, block counter), each block giving
+    SEED_BLOCK_SIZE floats in [0, 1), multiples of 2**-53. Offers the
+    subset of random.Random the ticket generators use.
+    """
+
+    __slots__ = ("random",)
+
+    def __init__(self, seed: int):
+        blocks = map(partial(_seed_block, seed.to_bytes(8, "little")), count())
+        # A C-level call per number, like random.Random.random
+        self.random: Callable[[], float] = chain.from_iterable(blocks).__next__
+
+    def randrange(self, stop: int) -> int:
+        return int(self.random() * stop)
+
+    def sample(self, population: Sequence, k: int) -> list:
+        """k distinct items, by a partial Fisher-Yates shuffle"""
+        pool = list(population)
+        left = len(pool)
+        picked = []
+        for _ in range(k):
+            pick = int(self.random() * left)
+            left -= 1
+            picked.append(pool[pick])
+            pool[pick] = pool[left]
+        return picked
+
+
+# Random streams the generators accept
+Rng = Union[random.Random, SeedRandom]
+
+
+def layout_from_index(index: int) -> Tuple[int, int, int]:
+    """Return the row masks of the pattern at ``index`` in [0, LAYOUT_COUNT)"""
+    pair = bisect_right(_LAYOUT_CUMULATIVE, index)
+    first, second = _LAYOUT_PAIRS[pair]
+    offset = index - (_LAYOUT_CUMULATIVE[pair - 1] if pair else 0)
+    third = _LAYOUT_COMPLETIONS[_FULL_MASK & ~(first | second)][offset]
+    return first, second, third
 
 
 class BingoTicketGenerator:
     """Generates bingo tickets with proper constraints"""
 
     @staticmethod
-    def generate_ticket() -> List[List[Optional[int]]]:
+    def generate_ticket(rng: Optional[Rng] = None) -> Grid:
         """
         Generates a single bingo ticket (9x3 grid)
         - Each row has exactly 5 numbers and 4 blanks
         - Numbers range from 1 to 90 and are unique in the ticket
-        - Column i contains numbers from (i-1)*10+1 to i*10
+        - Column i contains numbers from (i-1)*10+1 to i*10, sorted top to bottom
+
+        The occupancy pattern is drawn uniformly from the precomputed layout
+        table, so every ticket is valid on the first draw.
+        """
+        rng = rng or random
+        first, second, third = layout_from_index(rng.randrange(LAYOUT_COUNT))
+
+        grid: Grid = [[None] * 9 for _ in range(3)]
+        for col in range(9):
+            rows = _ROWS_FOR_BITS[(first >> col & 1) | (second >> col & 1) << 1 | (third >> col & 1) << 2]
+            numbers = sorted(rng.sample(_COLUMN_NUMBERS[col], len(rows)))
+            for row, number in zip(rows, numbers):
+                grid[row][col] = number
+        return grid
+
+    @staticmethod
+    def generate_strip(rng: Optional[Rng] = None) -> List[Grid]:
+        """
+        Generates a strip of 6 tickets that together hold every number 1-90 once.
+
+        Each ticket keeps the single-ticket rules (5 numbers per row, 1-3 per
+        column, columns sorted top to bottom). Column heights are dealt
+        column by column, only forcing an extra onto a ticket when the
+        remaining columns could no longer absorb its need, and each ticket's
+        rows are then a uniform draw among the layouts with those heights,
+        so a strip is built without backtracking.
+        """
+        # random() is a single C call; scaling it is much cheaper than
+        # randrange/shuffle on this hot path
+        rnd = (rng or random).random
+
+        # Every ticket starts with 1 number per column and needs 6 extras;
+        # every column hands out 4 extras, at most 2 per ticket
+        heights = [_BASE_HEIGHTS] * STRIP_SIZE
+        need = [6] * STRIP_SIZE
+        for col in range(9):
+            extras_for = _STRIP_EXTRAS[col]
+            weight = _HEIGHT_WEIGHTS[col]
+            slots = []
+            units = 4
+            for ticket in range(STRIP_SIZE):
+                forced, optional = extras_for[need[ticket]]
+                if forced:
+                    units -= forced
+                    need[ticket] -= forced
+                    heights[ticket] += forced * weight
+                if optional:
+                    slots.append(ticket)
+                    if optional == 2:
+                        slots.append(ticket)
+            size = len(slots)
+            for _ in range(units):
+                pick = int(rnd() * size)
+                size -= 1
+                ticket = slots[pick]
+                slots[pick] = slots[size]
+                need[ticket] -= 1
+                heights[ticket] += weight
+
+        groups = _layouts_by_heights()
+        layouts = []
+        for ticket_heights in heights:
+            group = groups[ticket_heights]
+            layouts.append(group[int(rnd() * len(group))])
+
+        # Deal each column's numbers: every ticket draws its cells from what
+        # is left and sorts them top to bottom
+        strip: List[Grid] = [[[None] * 9 for _ in range(3)] for _ in range(STRIP_SIZE)]
+        for col in range(9):
+            numbers = list(_COLUMN_NUMBERS[col])
+            left = 10
+            for grid, layout in zip(strip, layouts):
+                rows = _ROWS_FOR_BITS[(layout >> col & 1) | (layout >> (col + 8) & 2) | (layout >> (col + 16) & 4)]
+                if len(rows) == 1:
+                    pick = int(rnd() * left)
+                    left -= 1
+                    grid[rows[0]][col] = numbers[pick]
+                    numbers[pick] = numbers[left]
+                else:
+                    drawn = []
+                    for _ in rows:
+                        pick = int(rnd() * left)
+                        left -= 1
+                        drawn.append(numbers[pick])
+                        numbers[pick] = numbers[left]
+                    drawn.sort()
+                    for row, number in zip(rows, drawn):
+                        grid[row][col] = number
+        return strip
+
+    @staticmethod
+    def generate_tickets(
+        count: int,
+        mode: str = "single",
+        rng: Optional[Rng] = None
+    ) -> List[Grid]:
+        """
+        Generate multiple tickets
+
+        In "strip" mode tickets are taken from consecutive full strips, so any
+        6 consecutive tickets never repeat a number.
+        """
+        if mode == "strip":
+            tickets: List[Grid] = []
+            while len(tickets) < count:
+                tickets.extend(BingoTicketGenerator.generate_strip(rng))
+            return tickets[:count]
+        return [BingoTicketGenerator.generate_ticket(rng) for _ in range(count)]
+
+    @staticmethod
+    def generate_seeded_tickets(count: int, mode: str = "single") -> List[SeededTicket]:
+        """
+        Generate `count` seed-addressed tickets as (seed, version, grid).
+
+        Only the seed and version need to be stored; grid_from_seed rebuilds
+        the same grid. Strip-mode tickets share their strip's seed and carry
+        their position in the low 3 bits.
+        """
+        tickets = []
+        if mode == "strip":
+            while len(tickets) < count:
+                strip_seed = secrets.randbits(SEED_BITS - 3)
+                strip = BingoTicketGenerator.generate_strip(SeedRandom(strip_seed))
+                for index, grid in enumerate(strip):
+                    tickets.append((strip_seed << 3 | index, STRIP_GENERATOR_VERSION, grid))
+            return tickets[:count]
+
+        for _ in range(count):
+            seed = secrets.randbits(SEED_BITS)
+            tickets.append((seed, GENERATOR_VERSION, BingoTicketGenerator.generate_ticket(SeedRandom(seed))))
+        return tickets
+
+    @staticmethod
+    def generate_legacy_ticket() -> Grid:
+        """
+        Retry-loop generator used before the layout table.
+
+        Kept for benchmarking and comparison only; it patches rows until the
+        grid validates and falls back to _generate_simple_ticket after 100
+        failed attempts.
         """
         max_attempts = 100
         
@@ -97,16 +413,7 @@ class BingoTicketGenerator:
         return BingoTicketGenerator._generate_simple_ticket()
     
     @staticmethod
-    def generate_tickets(count: int) -> List[List[List[Optional[int]]]]:
-        """Generate multiple tickets"""
-        tickets = []
-        for _ in range(count):
-            ticket = BingoTicketGenerator.generate_ticket()
-            tickets.append(ticket)
-        return tickets
-    
-    @staticmethod
-    def _generate_simple_ticket() -> List[List[Optional[int]]]:
+    def _generate_simple_ticket() -> Grid:
         """Generate a simple valid ticket as fallback"""
         grid = [[None for _ in range(9)] for _ in range(3)]
         used_numbers: Set[int] = set()
@@ -171,7 +478,7 @@ class BingoTicketGenerator:
         return grid
     
     @staticmethod
-    def _verify_ticket(grid: List[List[Optional[int]]]) -> None:
+    def _verify_ticket(grid: Grid) -> None:
         """Verify that the ticket meets all constraints"""
         # Check grid dimensions
         assert len(grid) == 3, "Grid must have 3 rows"
@@ -199,3 +506,38 @@ class BingoTicketGenerator:
             # All numbers in column must be in range
             for num in column_numbers:
                 assert min_val <= num <= max_val, f"Number {num} in column {col} is out of range [{min_val}, {max_val}]"
+
+
+# Random stream of each generator version: (single ticket versions, strip versions)
+_SINGLE_STREAMS = {GENERATOR_VERSION: SeedRandom, PY_RANDOM_GENERATOR_VERSION: random.Random}
+_STRIP_STREAMS = {STRIP_GENERATOR_VERSION: SeedRandom, PY_RANDOM_STRIP_GENERATOR_VERSION: random.Random}
+
+
+@lru_cache(maxsize=16)
+def _strip_for_seed(strip_seed: int, version: int) -> Tuple[Tuple[Tuple[Optional[int], ...], ...], ...]:
+    """Rebuild a whole strip; its six tickets are usually read together"""
+    strip = BingoTicketGenerator.generate_strip(_STRIP_STREAMS[version](strip_seed))
+    return tuple(tuple(tuple(row) for row in grid) for grid in strip)
+
+
+@lru_cache(maxsize=SEED_CACHE_SIZE)
+def _grid_for_seed(seed: int, version: int) -> Tuple[Tuple[Optional[int], ...], ...]:
+    """Rebuild a seed-addressed grid (cached, immutable)"""
+    if version in _SINGLE_STREAMS:
+        grid = BingoTicketGenerator.generate_ticket(_SINGLE_STREAMS[version](seed))
+        return tuple(tuple(row) for row in grid)
+    if version in _STRIP_STREAMS:
+        return _strip_for_seed(seed >> 3, version)[seed & 7]
+    raise ValueError(f"Unknown ticket generator version {version}")
+
+
+def grid_from_seed(seed: int, version: int) -> Grid:
+    """Rebuild the grid of a seed-addressed ticket"""
+    return [list(row) for row in _grid_for_seed(seed, version)]
+
+
+def resolve_grid(ticket) -> Grid:
+    """Grid of a stored ticket, rebuilt from its seed when it has no stored grid"""
+    if ticket.seed is not None:
+        return grid_from_seed(ticket.seed, ticket.generator_version)
+    return ticket.grid
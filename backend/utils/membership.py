@@ -0,0 +1,110 @@
+from datetime import datetime, timedelta
+from typing import List, Tuple
+
+from sqlalchemy import delete, select, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import GameSession, PlayerTicket, SessionPlayer
+
+# Counter UPDATEs are applied by the database; don't reconcile loaded objects
+UNSYNCHRONIZED = {"synchronize_session": False}
+
+# Strikes move a session's last activity forward at most once per window
+ACTIVITY_RESOLUTION_SECONDS = 60
+
+
+async def add_session_tickets(session: AsyncSession, game_session_id: int, player_id: str, count: int) -> None:
+    """
+    Record `count` tickets of a player entering a game session.
+
+    Creates the player's membership on their first tickets and bumps the
+    session's counters and version in the database, so concurrent joins
+    never overwrite each other. The caller commits.
+    """
+    link = await session.get(SessionPlayer, (game_session_id, player_id))
+    if link is None:
+        session.add(SessionPlayer(game_session_id=game_session_id, player_id=player_id, tickets_count=count))
+    else:
+        await session.execute(
+            update(SessionPlayer)
+            .where(SessionPlayer.game_session_id == game_session_id, SessionPlayer.player_id == player_id)
+            .values(tickets_count=SessionPlayer.tickets_count + count),
+            execution_options=UNSYNCHRONIZED
+        )
+
+    await session.execute(
+        update(GameSession)
+        .where(GameSession.id == game_session_id)
+        .values(
+            tickets_count=GameSession.tickets_count + count,
+            players_count=GameSession.players_count + (1 if link is None else 0),
+            last_activity_at=datetime.now().isoformat(),
+            version=GameSession.version + 1
+        ),
+        execution_options=UNSYNCHRONIZED
+    )
+
+
+async def touch_session(session: AsyncSession, game_session_id: int) -> None:
+    """
+    Record activity on a game session for the idle reaper.
+
+    Only writes when the recorded activity is older than the resolution
+    window, so a burst of strikes costs one row update. The caller commits.
+    """
+    now = datetime.now()
+    await session.execute(
+        update(GameSession)
+        .where(
+            GameSession.id == game_session_id,
+            GameSession.last_activity_at < (now - timedelta(seconds=ACTIVITY_RESOLUTION_SECONDS)).isoformat()
+        )
+        .values(last_activity_at=now.isoformat()),
+        execution_options=UNSYNCHRONIZED
+    )
+
+
+async def assign_tickets(session: AsyncSession, game_session_id: int, ticket_ids: List[int]) -> int:
+    """
+    Move unassigned tickets into a game session with one UPDATE.
+
+    Returns the number of tickets moved; tickets another request assigned in
+    the meantime are left alone. The caller commits.
+    """
+    result = await session.execute(
+        update(PlayerTicket)
+        .where(PlayerTicket.id.in_(ticket_ids), PlayerTicket.game_session_id == None)
+        .values(game_session_id=game_session_id, updated_at=datetime.now().isoformat()),
+        execution_options=UNSYNCHRONIZED
+    )
+    return result.rowcount
+
+
+async def remove_player_memberships(session: AsyncSession, player_id: str) -> List[Tuple[int, str]]:
+    """
+    Take a player and their tickets out of every session's counters.
+
+    Returns (game_session_id, session_code) of the sessions left. The
+    caller commits.
+    """
+    memberships = select(SessionPlayer.tickets_count).where(
+        SessionPlayer.game_session_id == GameSession.id,
+        SessionPlayer.player_id == player_id
+    ).scalar_subquery()
+
+    left = (await session.execute(
+        update(GameSession)
+        .where(GameSession.id.in_(select(SessionPlayer.game_session_id).where(SessionPlayer.player_id == player_id)))
+        .values(
+            tickets_count=GameSession.tickets_count - memberships,
+            players_count=GameSession.players_count - 1,
+            version=GameSession.version + 1
+        )
+        .returning(GameSession.id, GameSession.session_code),
+        execution_options=UNSYNCHRONIZED
+    )).all()
+    await session.execute(
+        delete(SessionPlayer).where(SessionPlayer.player_id == player_id),
+        execution_options=UNSYNCHRONIZED
+    )
+    return [(game_session_id, code) for game_session_id, code in left]
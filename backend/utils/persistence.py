@@ -0,0 +1,53 @@
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional
+from uuid import uuid4
+
+from sqlalchemy import insert
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import PlayerTicket
+from models.ticket import Ticket
+from utils.generator import FingerprintedTicket, SeededTicket
+
+
+def ticket_rows(seeded_tickets: Iterable[SeededTicket]) -> List[Dict]:
+    """Ticket rows with their ids and timestamp filled in client-side"""
+    created_at = datetime.now().isoformat()
+    return [
+        {"id": uuid4(), "seed": seed, "generator_version": version, "created_at": created_at}
+        for seed, version, _ in seeded_tickets
+    ]
+
+
+def player_ticket_rows(
+    player_id: str,
+    seeded_tickets: Iterable[FingerprintedTicket],
+    game_session_id: Optional[int] = None
+) -> List[Dict]:
+    """PlayerTicket rows for (seed, version, grid, fingerprint) tickets, ids and timestamps filled in client-side"""
+    now = datetime.now().isoformat()
+    return [
+        {
+            "ticket_id": uuid4(),
+            "player_id": player_id,
+            "game_session_id": game_session_id,
+            "seed": seed,
+            "generator_version": version,
+            "fingerprint": fingerprint,
+            "strike_mask": 0,
+            "created_at": now,
+            "updated_at": now
+        }
+        for seed, version, _, fingerprint in seeded_tickets
+    ]
+
+
+async def insert_rows(session: AsyncSession, model, rows: List[Dict]) -> None:
+    """
+    Insert `rows` in one executemany INSERT.
+
+    Every column the caller needs back is generated client-side, so there is
+    no RETURNING and no per-row refresh. The caller commits.
+    """
+    if rows:
+        await session.execute(insert(model), rows)
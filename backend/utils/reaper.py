@@ -0,0 +1,134 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+from database import engine
+from models.player import GameSession
+from utils.session_state import publish_state_threadsafe
+
+logger = logging.getLogger(__name__)
+
+# Active sessions with no call, join or strike for this long are deactivated
+IDLE_SESSION_HOURS = float(os.getenv("BINGO_IDLE_SESSION_HOURS", "6"))
+REAPER_INTERVAL_SECONDS = 10 * 60
+# Sessions deactivated per transaction
+REAPER_CHUNK_SIZE = 500
+
+
+class SessionReaper:
+    """
+    Deactivates game sessions that have been idle past the TTL.
+
+    Idle sessions are found with a range scan of the (is_active,
+    last_activity_at) index. Streams of a reaped session get its new state.
+    Once deactivated they are archived and purged by the cleanup worker
+    like any finished game.
+    """
+
+    def __init__(
+        self,
+        idle_hours: float = IDLE_SESSION_HOURS,
+        interval: float = REAPER_INTERVAL_SECONDS,
+        chunk_size: int = REAPER_CHUNK_SIZE
+    ):
+        self.idle_hours = idle_hours
+        self.interval = interval
+        self.chunk_size = chunk_size
+        self._run_lock = threading.Lock()
+
+        self.runs = 0
+        self.errors = 0
+        self.last_run_at: Optional[str] = None
+        self.last_duration_ms = 0.0
+        self.last_lag_seconds = 0.0
+        self.last_reaped = 0
+        self.total_reaped = 0
+
+    def reaper_lag(self, cutoff: datetime) -> float:
+        """Seconds the longest-idle active session has been overdue (0 when caught up)"""
+        with Session(engine) as session:
+            oldest = session.exec(
+                select(func.min(GameSession.last_activity_at)).where(GameSession.is_active == True)
+            ).one()
+        if oldest is None:
+            return 0.0
+        return max(0.0, (cutoff - datetime.fromisoformat(oldest)).total_seconds())
+
+    def reap_idle_sessions(self, cutoff: datetime) -> int:
+        """Deactivate active sessions idle since before `cutoff`, chunk by chunk; returns sessions reaped"""
+        idle = (
+            select(GameSession.id)
+            .where(GameSession.is_active == True, GameSession.last_activity_at < cutoff.isoformat())
+            .order_by(GameSession.last_activity_at)
+            .limit(self.chunk_size)
+        )
+
+        reaped = 0
+        while True:
+            # last_activity_at is kept, so the purge follows FINISHED_GAME_HOURS after the last activity
+            statement = (
+                update(GameSession)
+                .where(GameSession.id.in_(idle))
+                .values(is_active=False, updated_at=datetime.now().isoformat(), version=GameSession.version + 1)
+                .returning(GameSession.id, GameSession.session_code)
+            )
+            with engine.begin() as connection:
+                chunk = connection.execute(statement).all()
+            publish_state_threadsafe(chunk)
+            reaped += len(chunk)
+            if len(chunk) < self.chunk_size:
+                return reaped
+
+    def run_once(self) -> int:
+        """One pass (blocking; call from a thread); returns sessions reaped"""
+        with self._run_lock:
+            start = time.perf_counter()
+            cutoff = datetime.now() - timedelta(hours=self.idle_hours)
+            try:
+                self.last_lag_seconds = self.reaper_lag(cutoff)
+                self.last_reaped = self.reap_idle_sessions(cutoff)
+                self.total_reaped += self.last_reaped
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.runs += 1
+                self.last_run_at = datetime.now().isoformat()
+                self.last_duration_ms = (time.perf_counter() - start) * 1000
+
+        if self.last_reaped:
+            logger.info(f"Deactivated {self.last_reaped} sessions idle for over {self.idle_hours:g}h")
+        return self.last_reaped
+
+    async def run(self) -> None:
+        """Background task: reap every interval, off the event loop"""
+        while True:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.run_once)
+            except Exception as e:
+                logger.error(f"Error during idle session reaping: {e}")
+
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        """Sessions reaped, lag and run duration"""
+        return {
+            "idle_ttl_hours": self.idle_hours,
+            "runs": self.runs,
+            "errors": self.errors,
+            "last_run_at": self.last_run_at,
+            "last_duration_ms": self.last_duration_ms,
+            "last_lag_seconds": self.last_lag_seconds,
+            "last_reaped": self.last_reaped,
+            "total_reaped": self.total_reaped
+        }
+
+
+# Shared instance used by the app
+session_reaper = SessionReaper()
@@ -0,0 +1,129 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import deque
+from typing import Deque, List, Optional
+
+from utils.generation_service import generation_service
+from utils.generator import BingoTicketGenerator, SeededTicket
+
+logger = logging.getLogger(__name__)
+
+
+def _generate_validated(count: int) -> List[SeededTicket]:
+    """Generate `count` seed-addressed tickets and keep only the ones that validate"""
+    tickets = []
+    for ticket in BingoTicketGenerator.generate_seeded_tickets(count):
+        try:
+            BingoTicketGenerator._verify_ticket(ticket[2])
+        except AssertionError as e:
+            logger.error(f"Discarding invalid ticket from generator: {e}")
+            continue
+        tickets.append(ticket)
+    return tickets
+
+
+class TicketReservoir:
+    """
+    Bounded pool of ready-made, validated seed-addressed single tickets.
+
+    Requests pop grids in O(1) with take(); a background task tops the pool
+    back up to capacity whenever it falls below the low-water mark. Only
+    used for single tickets, strips are always generated to order.
+    """
+
+    def __init__(self, capacity: int = 2000, low_water: int = 500):
+        self.capacity = capacity
+        self.low_water = low_water
+        self._tickets: Deque[SeededTicket] = deque()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._counter_lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.refills = 0
+        self.last_refill_ms = 0.0
+        self.max_refill_ms = 0.0
+        self._total_refill_ms = 0.0
+
+    async def take(self, count: int) -> List[SeededTicket]:
+        """Pop `count` tickets; whatever the pool cannot cover is generated off the event loop"""
+        tickets = []
+        for _ in range(count):
+            try:
+                tickets.append(self._tickets.popleft())
+            except IndexError:
+                break
+
+        hit_count = len(tickets)
+        with self._counter_lock:
+            self.hits += hit_count
+            self.misses += count - hit_count
+
+        if len(self._tickets) < self.low_water:
+            self._request_refill()
+        if hit_count < count:
+            tickets.extend(await generation_service.agenerate_seeded(count - hit_count))
+        return tickets
+
+    def _request_refill(self) -> None:
+        """Wake the refill task from any thread"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
+
+    async def refill(self) -> int:
+        """Top the pool up to capacity; returns the number of tickets added"""
+        missing = self.capacity - len(self._tickets)
+        if missing <= 0:
+            return 0
+
+        start = time.perf_counter()
+        tickets = await asyncio.get_running_loop().run_in_executor(None, _generate_validated, missing)
+        # Another refill may have topped the pool up while this batch was generated
+        tickets = tickets[:max(0, self.capacity - len(self._tickets))]
+        self._tickets.extend(tickets)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        self.refills += 1
+        self.last_refill_ms = elapsed_ms
+        self.max_refill_ms = max(self.max_refill_ms, elapsed_ms)
+        self._total_refill_ms += elapsed_ms
+        return len(tickets)
+
+    async def run(self) -> None:
+        """Background task: fill the pool, then refill whenever it runs low"""
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+
+        while True:
+            try:
+                added = await self.refill()
+                if added:
+                    logger.info(f"Ticket reservoir refilled with {added} tickets in {self.last_refill_ms:.1f}ms")
+            except Exception as e:
+                logger.error(f"Error refilling ticket reservoir: {e}")
+
+            await self._wakeup.wait()
+            self._wakeup.clear()
+
+    def stats(self) -> dict:
+        """Current size, hit/miss counts and refill latency"""
+        served = self.hits + self.misses
+        return {
+            "size": len(self._tickets),
+            "capacity": self.capacity,
+            "low_water": self.low_water,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / served if served else 0.0,
+            "refills": self.refills,
+            "last_refill_ms": self.last_refill_ms,
+            "avg_refill_ms": self._total_refill_ms / self.refills if self.refills else 0.0,
+            "max_refill_ms": self.max_refill_ms
+        }
+
+
+# Shared instance used by the routers
+ticket_reservoir = TicketReservoir()
@@ -0,0 +1,309 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import Index, MetaData, Table, delete, insert, or_, select, text
+from sqlalchemy.schema import CreateIndex, CreateTable
+from sqlmodel.ext.asyncio.session import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from database import engine
+from models.game import NumberSession
+from models.ticket import Ticket
+
+logger = logging.getLogger(__name__)
+
+# Day partitions kept besides today's; older ones are dropped whole
+TICKET_RETENTION_DAYS = int(os.getenv("BINGO_TICKET_RETENTION_DAYS", "30"))
+NUMBER_SESSION_RETENTION_DAYS = int(os.getenv("BINGO_NUMBER_SESSION_RETENTION_DAYS", "7"))
+RETENTION_INTERVAL_SECONDS = 60 * 60
+# Rows deleted per transaction when draining the pre-partition tables
+LEGACY_CHUNK_SIZE = 500
+
+PARTITION_DATE_FORMAT = "%Y%m%d"
+
+
+class DayPartitions:
+    """
+    One table per day, `<table>_YYYYMMDD`, shaped like a template table.
+
+    Rows go to the partition of their day, so expiring a day is a single
+    DROP TABLE instead of a row-by-row DELETE. The freed pages go back to
+    SQLite's freelist and are reused by the next days' inserts, so the file
+    stops growing once retention is reached.
+    """
+
+    def __init__(self, template: Table, day_column: str, retention_days: int):
+        self.template = template
+        self.day_column = day_column  # The ISO timestamp that picks a row's partition
+        self.retention_days = retention_days
+        self._metadata = MetaData()
+        self._tables: Dict[date, Table] = {}
+        self._created: Set[date] = set()
+        self._lock = threading.RLock()
+
+    def name(self, day: date) -> str:
+        return f"{self.template.name}_{day.strftime(PARTITION_DATE_FORMAT)}"
+
+    def table(self, day: date) -> Table:
+        """The partition's Table (whether or not it exists yet)"""
+        table = self._tables.get(day)
+        if table is not None:
+            return table
+        with self._lock:
+            if day in self._tables:
+                return self._tables[day]
+            name = self.name(day)
+            table = Table(name, self._metadata, *[column._copy() for column in self.template.columns])
+            # Index names are global in SQLite, so each partition gets its own
+            for index in self.template.indexes:
+                Index(
+                    index.name.replace(self.template.name, name, 1),
+                    *[table.c[column.name] for column in index.columns],
+                    unique=index.unique
+                )
+            self._tables[day] = table
+        return table
+
+    def ensure(self, day: date) -> Table:
+        """Create the day's partition if needed (blocking; once per day per process)"""
+        if day not in self._created:
+            with self._lock:
+                table = self.table(day)
+                with engine.begin() as connection:
+                    connection.execute(CreateTable(table, if_not_exists=True))
+                    for index in table.indexes:
+                        connection.execute(CreateIndex(index, if_not_exists=True))
+                self._created.add(day)
+        return self.table(day)
+
+    async def aensure(self, day: date) -> Table:
+        """ensure() for request handlers; the DDL runs in the threadpool in its own transaction"""
+        if day in self._created:
+            return self.table(day)
+        return await run_in_threadpool(self.ensure, day)
+
+    def _listing(self):
+        return (
+            text("SELECT name FROM sqlite_master WHERE type = 'table' AND name LIKE :pattern ESCAPE '\\'"),
+            {"pattern": self.template.name + "\\_%"}
+        )
+
+    def _days(self, names: List[str]) -> List[date]:
+        days = []
+        for name in names:
+            try:
+                days.append(datetime.strptime(name[len(self.template.name) + 1:], PARTITION_DATE_FORMAT).date())
+            except ValueError:
+                continue
+        return sorted(days)
+
+    def partition_days(self, connection) -> List[date]:
+        """Days that have a partition, oldest first"""
+        return self._days(connection.execute(*self._listing()).scalars().all())
+
+    async def apartition_days(self, session: AsyncSession) -> List[date]:
+        """partition_days() through a request's session"""
+        return self._days((await session.execute(*self._listing())).scalars().all())
+
+    def cutoff(self, today: date) -> date:
+        """Partitions for days before this one are expired"""
+        return today - timedelta(days=self.retention_days)
+
+    def drop(self, day: date) -> None:
+        """Drop one day's partition and its indexes"""
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f'DROP TABLE IF EXISTS "{self.name(day)}"')
+        self._created.discard(day)
+
+
+ticket_partitions = DayPartitions(Ticket.__table__, "created_at", TICKET_RETENTION_DAYS)
+number_session_partitions = DayPartitions(NumberSession.__table__, "updated_at", NUMBER_SESSION_RETENTION_DAYS)
+
+
+def day_of(timestamp: str) -> date:
+    return datetime.fromisoformat(timestamp).date()
+
+
+async def save_number_session(
+    session: AsyncSession,
+    number_session: NumberSession,
+    previous_updated_at: Optional[str] = None
+) -> None:
+    """
+    Write a legacy game to the partition of the day it was last updated.
+
+    A game played on a new day moves to that day's partition, so retention
+    only drops games nobody has touched for the retention period. Pass the
+    game's stored updated_at as `previous_updated_at` when it has been saved
+    before. The caller commits.
+    """
+    day = day_of(number_session.updated_at)
+    table = await number_session_partitions.aensure(day)
+    await session.execute(insert(table).prefix_with("OR REPLACE").values(**number_session.model_dump()))
+
+    if previous_updated_at is not None and day_of(previous_updated_at) != day:
+        previous = number_session_partitions.table(day_of(previous_updated_at))
+        exists = (await session.execute(
+            text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"), {"name": previous.name}
+        )).first()
+        if exists:
+            await session.execute(delete(previous).where(previous.c.id == number_session.id))
+
+
+async def load_latest_number_session(session: AsyncSession) -> Optional[NumberSession]:
+    """
+    The most recently updated legacy game.
+
+    Partitions are searched newest day first, so usually only today's is
+    read. A game found in the pre-partition table is moved into its
+    partition. The caller commits.
+    """
+    for day in reversed(await number_session_partitions.apartition_days(session)):
+        table = number_session_partitions.table(day)
+        row = (await session.execute(select(table).order_by(table.c.updated_at.desc()).limit(1))).first()
+        if row is not None:
+            return NumberSession(**row._mapping)
+
+    legacy = (await session.execute(
+        select(NumberSession).order_by(NumberSession.updated_at.desc()).limit(1)
+    )).scalars().first()
+    if legacy is None:
+        return None
+    number_session = NumberSession(**legacy.model_dump())
+    number_session.updated_at = number_session.updated_at or datetime.now().isoformat()
+    await save_number_session(session, number_session)
+    await session.execute(delete(NumberSession).where(NumberSession.id == number_session.id))
+    return number_session
+
+
+class RetentionWorker:
+    """
+    Applies the retention policies of the legacy Ticket and NumberSession
+    tables: drops expired day partitions and drains rows older than the
+    retention period from the pre-partition tables in small chunks.
+    """
+
+    def __init__(
+        self,
+        partitions: Tuple[DayPartitions, ...] = (ticket_partitions, number_session_partitions),
+        interval: float = RETENTION_INTERVAL_SECONDS,
+        chunk_size: int = LEGACY_CHUNK_SIZE
+    ):
+        self.partitions = partitions
+        self.interval = interval
+        self.chunk_size = chunk_size
+        self._run_lock = threading.Lock()
+
+        self.runs = 0
+        self.errors = 0
+        self.last_run_at: Optional[str] = None
+        self.last_duration_ms = 0.0
+        self.last_dropped: List[str] = []
+        self.total_dropped = 0
+        self.max_drop_ms = 0.0
+        self.legacy_rows_deleted: Dict[str, int] = {}
+
+    def drop_expired(self, partitions: DayPartitions, today: date) -> List[str]:
+        """Drop every partition older than the retention period; returns their names"""
+        with engine.connect() as connection:
+            days = partitions.partition_days(connection)
+
+        dropped = []
+        for day in days:
+            if day >= partitions.cutoff(today):
+                break
+            start = time.perf_counter()
+            partitions.drop(day)
+            self.max_drop_ms = max(self.max_drop_ms, (time.perf_counter() - start) * 1000)
+            dropped.append(partitions.name(day))
+        return dropped
+
+    def drain_legacy(self, partitions: DayPartitions, today: date) -> int:
+        """Delete expired rows of the pre-partition table in chunks; returns rows deleted"""
+        table = partitions.template
+        column = table.c[partitions.day_column]
+        expired = or_(column == None, column < partitions.cutoff(today).isoformat())
+        statement = delete(table).where(
+            table.c.id.in_(select(table.c.id).where(expired).limit(self.chunk_size))
+        )
+
+        deleted = 0
+        while True:
+            with engine.begin() as connection:
+                rowcount = connection.execute(statement).rowcount
+            deleted += rowcount
+            if rowcount < self.chunk_size:
+                break
+        if deleted:
+            self.legacy_rows_deleted[table.name] = self.legacy_rows_deleted.get(table.name, 0) + deleted
+        return deleted
+
+    def run_once(self, today: Optional[date] = None) -> List[str]:
+        """One pass over every policy (blocking; call from a thread); returns partitions dropped"""
+        today = today or date.today()
+        with self._run_lock:
+            start = time.perf_counter()
+            dropped = []
+            try:
+                for partitions in self.partitions:
+                    partitions.ensure(today)
+                    dropped += self.drop_expired(partitions, today)
+                    self.drain_legacy(partitions, today)
+            except Exception:
+                self.errors += 1
+                raise
+            finally:
+                self.runs += 1
+                self.last_run_at = datetime.now().isoformat()
+                self.last_duration_ms = (time.perf_counter() - start) * 1000
+                self.last_dropped = dropped
+                self.total_dropped += len(dropped)
+
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} expired partitions: {', '.join(dropped)}")
+        return dropped
+
+    async def run(self) -> None:
+        """Background task: apply retention every interval, off the event loop"""
+        while True:
+            try:
+                await asyncio.get_running_loop().run_in_executor(None, self.run_once)
+            except Exception as e:
+                logger.error(f"Error applying retention: {e}")
+
+            await asyncio.sleep(self.interval)
+
+    def stats(self) -> dict:
+        """Partitions kept and dropped, legacy rows drained and database size"""
+        with engine.connect() as connection:
+            partitions = {
+                partitions.template.name: len(partitions.partition_days(connection))
+                for partitions in self.partitions
+            }
+            page_size = connection.exec_driver_sql("PRAGMA page_size").scalar()
+            page_count = connection.exec_driver_sql("PRAGMA page_count").scalar()
+            freelist_count = connection.exec_driver_sql("PRAGMA freelist_count").scalar()
+
+        return {
+            "retention_days": {partitions.template.name: partitions.retention_days for partitions in self.partitions},
+            "partitions": partitions,
+            "runs": self.runs,
+            "errors": self.errors,
+            "last_run_at": self.last_run_at,
+            "last_duration_ms": self.last_duration_ms,
+            "last_dropped": list(self.last_dropped),
+            "total_dropped": self.total_dropped,
+            "max_drop_ms": self.max_drop_ms,
+            "legacy_rows_deleted": dict(self.legacy_rows_deleted),
+            "database_bytes": page_size * page_count,
+            "free_bytes": page_size * freelist_count  # Pages freed by drops, reused before the file grows
+        }
+
+
+# Shared instance used by the app
+retention_worker = RetentionWorker()
@@ -0,0 +1,64 @@
+from typing import Iterable, List, Tuple
+
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from database import engine
+from models.player import GameSession
+from schemas.multiplayer import GameSessionState
+from utils.broadcast import session_broadcaster
+from utils.draw import called_numbers, remaining_numbers
+
+# (game_session_id, session_code) of a session whose state changed
+SessionRef = Tuple[int, str]
+
+
+def session_state(game_session: GameSession, include_remaining: bool = True) -> GameSessionState:
+    """The polled (and streamed) state of a game session"""
+    return GameSessionState(
+        session_code=game_session.session_code,
+        current_number=game_session.current_number,
+        called_numbers=called_numbers(game_session),
+        remaining_numbers=remaining_numbers(game_session) if include_remaining else None,
+        players_count=game_session.players_count,
+        tickets_count=game_session.tickets_count,
+        is_active=game_session.is_active
+    )
+
+
+def _listened(sessions: Iterable[SessionRef]) -> List[int]:
+    return [game_session_id for game_session_id, code in set(sessions) if session_broadcaster.listening(code)]
+
+
+def _current(game_session_ids: List[int]):
+    # Counters are updated in the database, so overwrite any row already loaded
+    return (
+        select(GameSession)
+        .where(GameSession.id.in_(game_session_ids))
+        .execution_options(populate_existing=True)
+    )
+
+
+async def publish_state(session: AsyncSession, sessions: Iterable[SessionRef]) -> None:
+    """
+    Send the committed state of changed sessions to their streams as a
+    `state` event, for changes no smaller event describes (players and
+    tickets coming and going). Only sessions with open streams are read.
+    """
+    game_session_ids = _listened(sessions)
+    if game_session_ids:
+        for game_session in (await session.exec(_current(game_session_ids))).all():
+            session_broadcaster.publish(
+                game_session.session_code, "state", session_state(game_session).model_dump(mode="json")
+            )
+
+
+def publish_state_threadsafe(sessions: Iterable[SessionRef]) -> None:
+    """publish_state for worker threads: reads with its own session, publishes on the event loop"""
+    game_session_ids = _listened(sessions)
+    if game_session_ids:
+        with Session(engine) as session:
+            for game_session in session.exec(_current(game_session_ids)).all():
+                session_broadcaster.publish_threadsafe(
+                    game_session.session_code, "state", session_state(game_session).model_dump(mode="json")
+                )
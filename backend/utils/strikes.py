@@ -0,0 +1,81 @@
+from datetime import datetime
+from typing import Dict
+
+from sqlalchemy import Update, update
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from models.player import PlayerTicket
+from utils.membership import touch_session
+
+# One bit per grid cell, index row * 9 + col
+STRIKE_BITS = 27
+
+
+def strike_bit(row: int, col: int) -> int:
+    """Mask bit of a grid cell"""
+    return 1 << (row * 9 + col)
+
+
+def mask_to_strikes(mask: int) -> Dict[str, bool]:
+    """The API's {"row-col": True} shape for every struck cell of a mask"""
+    return {f"{index // 9}-{index % 9}": True for index in range(STRIKE_BITS) if mask >> index & 1}
+
+
+def strikes_to_mask(strikes: Dict[str, bool]) -> int:
+    """Mask of the struck cells in a {"row-col": bool} dict"""
+    mask = 0
+    for key, struck in strikes.items():
+        if struck:
+            row, col = key.split("-")
+            mask |= strike_bit(int(row), int(col))
+    return mask
+
+
+def resolve_strikes(ticket: PlayerTicket) -> Dict[str, bool]:
+    """Struck cells of a ticket, including ones recorded in the legacy JSON column"""
+    strikes = mask_to_strikes(ticket.strike_mask or 0)
+    for key, struck in (ticket.strikes or {}).items():
+        if struck:
+            strikes[key] = True
+    return strikes
+
+
+def strike_statement(ticket: PlayerTicket, row: int, col: int, strike: bool) -> Update:
+    """
+    The single UPDATE that sets or clears one cell's strike.
+
+    The database applies the OR / AND-NOT to the stored mask, so concurrent
+    taps on the same ticket never overwrite each other. Strikes still in the
+    legacy JSON column are folded into the mask by the same statement.
+    """
+    mask = PlayerTicket.strike_mask
+    values = {"updated_at": datetime.now().isoformat()}
+    if ticket.strikes is not None:
+        mask = mask.bitwise_or(strikes_to_mask(ticket.strikes))
+        values["strikes"] = None
+
+    bit = strike_bit(row, col)
+    values["strike_mask"] = mask.bitwise_or(bit) if strike else mask.bitwise_and(~bit)
+    return update(PlayerTicket).where(PlayerTicket.id == ticket.id).values(**values)
+
+
+async def apply_strike(session: AsyncSession, ticket: PlayerTicket, row: int, col: int, strike: bool) -> None:
+    """Set or clear one cell's strike atomically, record session activity and commit"""
+    await session.execute(
+        strike_statement(ticket, row, col, strike),
+        execution_options={"synchronize_session": False}
+    )
+    if ticket.game_session_id is not None:
+        await touch_session(session, ticket.game_session_id)
+    await session.commit()
+
+
+async def clear_session_strikes(session: AsyncSession, game_session_id: int) -> int:
+    """Clear the strikes of every ticket in a session with one UPDATE; returns the tickets reset. The caller commits."""
+    result = await session.execute(
+        update(PlayerTicket)
+        .where(PlayerTicket.game_session_id == game_session_id)
+        .values(strike_mask=0, strikes=None, updated_at=datetime.now().isoformat()),
+        execution_options={"synchronize_session": False}
+    )
+    return result.rowcount
@@ -8,7 +8,7 @@ import { Badge } from '@/components/ui/badge';
 import { NumberCaller } from '@/components/number-caller';
 import { GameStatus } from '@/components/game-status';
 import { CalledNumbers } from '@/components/called-numbers';
-import { useQuery } from '@tanstack/react-query';
+import { useInfiniteQuery, useQuery } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
 import { ArrowLeft, RefreshCw, Share } from 'lucide-react';
 import { AdminPageParams } from '@/types';
@@ -29,15 +29,27 @@ export default function AdminPage({ params }: AdminPageProps) {
     enabled: !!adminId,
   });
   
-  const { data: sessionInfo, isLoading: statusLoading, refetch } = useQuery({
+  // Players are loaded a page at a time; polling refetches only the pages already loaded
+  const {
+    data: sessionPages,
+    isLoading: statusLoading,
+    refetch,
+    fetchNextPage,
+    hasNextPage,
+    isFetchingNextPage,
+  } = useInfiniteQuery({
     queryKey: ['admin-session-info', sessionId, adminId],
-    queryFn: () => apiClient.getAdminSessionInfo(sessionId, adminId!),
+    queryFn: ({ pageParam }) => apiClient.getAdminSessionInfo(sessionId, adminId!, pageParam),
+    initialPageParam: null as string | null,
+    getNextPageParam: (lastPage) => lastPage.nextCursor,
     enabled: !!sessionId && !!adminId,
     refetchInterval: 2000, // Poll for real-time updates every 2 seconds
     refetchIntervalInBackground: true, // Continue polling when tab is not active
     staleTime: 500, // Consider data stale after 0.5 seconds
   });
 
+  // The first page carries the session state, every page a slice of the players
+  const sessionInfo = sessionPages?.pages[0];
   const isLoading = statusLoading || adminLoading;
 
   const handleShareSession = async () => {
@@ -123,7 +135,7 @@ export default function AdminPage({ params }: AdminPageProps) {
   };
   
   
-  const players = sessionInfo.players;
+  const players = sessionPages!.pages.flatMap((page) => page.players);
   const recentNumbers = sessionInfo.called_numbers.slice(-5); // Get last 5 called numbers
 
   return (
@@ -168,7 +180,7 @@ export default function AdminPage({ params }: AdminPageProps) {
           <div>
             <Card className="h-full">
               <CardHeader>
-                <CardTitle>Players ({players.length})</CardTitle>
+                <CardTitle>Players ({players.length}{hasNextPage ? '+' : ''})</CardTitle>
               </CardHeader>
               <CardContent className="overflow-y-auto">
                 <div className="space-y-3">
@@ -185,6 +197,16 @@ export default function AdminPage({ params }: AdminPageProps) {
                       No players yet
                     </div>
                   )}
+                  {hasNextPage && (
+                    <Button
+                      variant="outline"
+                      onClick={() => fetchNextPage()}
+                      disabled={isFetchingNextPage}
+                      className="w-full"
+                    >
+                      {isFetchingNextPage ? 'Loading...' : 'Load more players'}
+                    </Button>
+                  )}
                 </div>
               </CardContent>
             </Card>
@@ -122,7 +122,7 @@ export default function GamePage({ params }: GamePageProps) {
   const handleJoinAndSetup = async () => {
     if (sessionState && player && playerId) {
       try {
-        // Generate ticket first (required to join session)
+        // A ticket bought for the session is issued straight into it
         if (!tickets || tickets.length === 0) {
           await generateTicketsMutation.mutateAsync({
             playerId,
@@ -131,13 +131,13 @@ export default function GamePage({ params }: GamePageProps) {
               session_code: sessionId,
             },
           });
+        } else {
+          // Otherwise bring the player's existing tickets into the session
+          await joinSessionMutation.mutateAsync({
+            sessionCode: sessionId,
+            playerId,
+          });
         }
-        
-        // Then join the session
-        await joinSessionMutation.mutateAsync({
-          sessionCode: sessionId,
-          playerId,
-        });
       } catch (error) {
         console.error('Failed to join session or generate ticket:', error);
       }
@@ -26,13 +26,17 @@ export function useCallNumber() {
       if (data && typeof data === 'object' && 'called_number' in data) {
         console.log('Updating cache with NumberCallResponse:', data);
         
-        // Update admin-session-info cache
+        // Update admin-session-info cache (paged: the state is on the first page)
         queryClient.setQueryData(['admin-session-info', sessionCode], (oldData: any) => {
           if (!oldData) return oldData;
+          const [first, ...rest] = oldData.pages;
           return {
             ...oldData,
-            current_number: data.called_number,
-            called_numbers: data.all_called_numbers || [...(oldData.called_numbers || []), data.called_number]
+            pages: [{
+              ...first,
+              current_number: data.called_number,
+              called_numbers: data.all_called_numbers || [...(first.called_numbers || []), data.called_number]
+            }, ...rest]
           };
         });
         
@@ -40,8 +40,12 @@ export function useGenerateTickets() {
   return useMutation({
     mutationFn: ({ playerId, data }: { playerId: string; data: GenerateTicketsRequest }) =>
       apiClient.generateTickets(playerId, data),
-    onSuccess: (data, { playerId }) => {
+    onSuccess: (_, { playerId, data }) => {
       queryClient.invalidateQueries({ queryKey: ['player-tickets', playerId] });
+      // Tickets bought for a session are issued straight into it
+      if (data.session_code) {
+        queryClient.invalidateQueries({ queryKey: ['session-state', data.session_code] });
+      }
     },
   });
 }
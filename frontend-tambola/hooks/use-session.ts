@@ -1,15 +1,87 @@
-import { useQuery, useMutation, useQueryClient } from '@tanstack/react-query';
+import { useEffect, useState } from 'react';
+import { useQuery, useMutation, useQueryClient, QueryClient } from '@tanstack/react-query';
 import { apiClient } from '@/lib/api-client';
 import { GameSession, GameSessionState, CreateSessionRequest } from '@/types';
 
-// Hook to get session state with real-time updates
+const ALL_NUMBERS = Array.from({ length: 90 }, (_, i) => i + 1);
+
+// Apply one session stream event to the cached state
+function applySessionEvent(
+  queryClient: QueryClient,
+  sessionCode: string,
+  type: string,
+  data: any
+) {
+  const key = ['session-state', sessionCode];
+
+  if (type === 'state') {
+    queryClient.setQueryData<GameSessionState>(key, data);
+    return;
+  }
+  if (type === 'resync') {
+    queryClient.invalidateQueries({ queryKey: key });
+    return;
+  }
+
+  queryClient.setQueryData<GameSessionState>(key, (state) => {
+    if (!state) return state;
+    switch (type) {
+      case 'call':
+        // Events may repeat after a reconnect; the count tells which are new
+        if (data.called_count <= state.called_numbers.length) return state;
+        if (data.called_count !== state.called_numbers.length + 1) {
+          queryClient.invalidateQueries({ queryKey: key });
+          return state;
+        }
+        return {
+          ...state,
+          current_number: data.number,
+          called_numbers: [...state.called_numbers, data.number],
+          remaining_numbers: state.remaining_numbers?.filter((n) => n !== data.number),
+        };
+      case 'reset':
+        return { ...state, current_number: null, called_numbers: [], remaining_numbers: ALL_NUMBERS };
+      case 'deactivate':
+        return { ...state, is_active: false };
+      default:
+        return state;
+    }
+  });
+}
+
+// Hook to get session state with real-time updates: pushed over a
+// Server-Sent Events stream, with polling as the fallback
 export function useSessionState(sessionCode: string, interval = 2000) {
+  const queryClient = useQueryClient();
+  const [streaming, setStreaming] = useState(false);
+
+  useEffect(() => {
+    if (!sessionCode || typeof EventSource === 'undefined') return;
+
+    // EventSource reconnects by itself, resuming from the last event id
+    const source = new EventSource(apiClient.sessionStreamUrl(sessionCode));
+    const handle = (type: string) => (event: MessageEvent) =>
+      applySessionEvent(queryClient, sessionCode, type, JSON.parse(event.data));
+
+    for (const type of ['state', 'call', 'reset', 'deactivate', 'resync']) {
+      source.addEventListener(type, handle(type) as EventListener);
+    }
+    source.onopen = () => setStreaming(true);
+    source.onerror = () => setStreaming(false);
+
+    return () => {
+      source.close();
+      setStreaming(false);
+    };
+  }, [sessionCode, queryClient]);
+
   return useQuery({
     queryKey: ['session-state', sessionCode],
     queryFn: () => apiClient.getSessionState(sessionCode),
     enabled: !!sessionCode,
-    refetchInterval: interval, // Poll for real-time updates every 2 seconds
-    refetchIntervalInBackground: true, // Continue polling when tab is not active
+    // While the stream is up, only an occasional safety poll; otherwise poll every 2 seconds
+    refetchInterval: streaming ? 30000 : interval,
+    refetchIntervalInBackground: !streaming, // The stream keeps a background tab current
     staleTime: 500, // Consider data stale after 0.5 second
     refetchOnWindowFocus: true, // Refetch when window regains focus
     retry: 3, // Retry failed requests
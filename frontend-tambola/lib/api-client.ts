@@ -7,10 +7,10 @@ class ApiClient {
     this.baseUrl = process.env.NEXT_PUBLIC_API_BASE_URL || 'http://localhost:8000';
   }
 
-  private async request<T>(
+  private async send(
     endpoint: string,
     options: RequestInit = {}
-  ): Promise<T> {
+  ): Promise<Response> {
     const url = `${this.baseUrl}${endpoint}`;
     
     const config: RequestInit = {
@@ -29,7 +29,7 @@ class ApiClient {
         throw new Error(errorData.message || `HTTP ${response.status}`);
       }
 
-      return await response.json();
+      return response;
     } catch (error) {
       if (error instanceof Error) {
         throw error;
@@ -38,6 +38,22 @@ class ApiClient {
     }
   }
 
+  private async request<T>(
+    endpoint: string,
+    options: RequestInit = {}
+  ): Promise<T> {
+    const response = await this.send(endpoint, options);
+    return await response.json();
+  }
+
+  // Admin listings are paged: a page's X-Next-Cursor header, passed back as
+  // `after`, fetches the next one (no header on the last page)
+  private async requestPage<T>(endpoint: string, after?: string | null): Promise<{ data: T; nextCursor: string | null }> {
+    const page = after ? `${endpoint}&after=${encodeURIComponent(after)}` : endpoint;
+    const response = await this.send(page);
+    return { data: await response.json(), nextCursor: response.headers.get('X-Next-Cursor') };
+  }
+
   // Player endpoints matching FastAPI backend
   async createPlayer(data: import('@/types').CreatePlayerRequest) {
     return this.request<import('@/types').Player>('/api/players/create', {
@@ -87,6 +103,11 @@ class ApiClient {
     return this.request<import('@/types').GameSessionState>(`/api/sessions/${sessionCode}`);
   }
 
+  // Server-Sent Events stream of a session's state (for EventSource)
+  sessionStreamUrl(sessionCode: string) {
+    return `${this.baseUrl}/api/sessions/${sessionCode}/stream`;
+  }
+
   async joinSession(sessionCode: string, playerId: string) {
     return this.request<import('@/types').SuccessResponse>(`/api/sessions/${sessionCode}/join?player_id=${playerId}`, {
       method: 'POST',
@@ -121,16 +142,21 @@ class ApiClient {
     });
   }
 
-  async getAdminSessionInfo(sessionCode: string, adminPlayerId: string) {
-    return this.request<import('@/types').AdminSessionInfo>(`/api/admin/session/${sessionCode}?admin_player_id=${adminPlayerId}`);
+  // Session state with one page of its players
+  async getAdminSessionInfo(sessionCode: string, adminPlayerId: string, after?: string | null): Promise<import('@/types').AdminSessionInfoPage> {
+    const { data, nextCursor } = await this.requestPage<import('@/types').AdminSessionInfo>(`/api/admin/session/${sessionCode}?admin_player_id=${adminPlayerId}`, after);
+    return { ...data, nextCursor };
   }
 
-  async getAllPlayers(adminPlayerId: string) {
-    return this.request<import('@/types').Player[]>(`/api/admin/players?admin_player_id=${adminPlayerId}`);
+  async getPlayersPage(adminPlayerId: string, after?: string | null): Promise<import('@/types').Page<import('@/types').Player>> {
+    const { data, nextCursor } = await this.requestPage<import('@/types').Player[]>(`/api/admin/players?admin_player_id=${adminPlayerId}`, after);
+    return { items: data, nextCursor };
   }
 
-  async getAllSessions(adminPlayerId: string) {
-    return this.request<import('@/types').AdminSessionInfo[]>(`/api/admin/sessions?admin_player_id=${adminPlayerId}`);
+  // Newest sessions first
+  async getSessionsPage(adminPlayerId: string, after?: string | null): Promise<import('@/types').Page<import('@/types').AdminSessionInfo>> {
+    const { data, nextCursor } = await this.requestPage<import('@/types').AdminSessionInfo[]>(`/api/admin/sessions?admin_player_id=${adminPlayerId}`, after);
+    return { items: data, nextCursor };
   }
 
   async deletePlayer(playerId: string, adminPlayerId: string) {
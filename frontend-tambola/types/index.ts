@@ -91,6 +91,14 @@ export interface ApiResponse<T> {
   error?: string;
 }
 
+// One page of an admin listing; pass nextCursor back as `after` for the next (null on the last page)
+export interface Page<T> {
+  items: T[];
+  nextCursor: string | null;
+}
+
+export type AdminSessionInfoPage = AdminSessionInfo & { nextCursor: string | null };
+
 export interface AnnounceResponse {
   spoken: string;
 }